@@ -0,0 +1,229 @@
+"""
+Process-wide accessors for the survey's external service clients.
+
+Every client (reviewer and contributor Supabase, OpenAI, Google Drive) is created
+on first use rather than at import time, so importing the app does no network
+setup and reads no secrets until a page actually needs the service.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from contributor_config import get_contributor_db_creds
+
+
+DRIVE_SCOPES = ['https://www.googleapis.com/auth/drive']
+
+_client_lock = threading.Lock()
+_shared_clients = {}
+# Project URL -> {'clients_created': int, 'requests': int}, counted by this module
+_client_stats = {}
+_client_stats_lock = threading.Lock()
+
+
+def _record_client_stat(url: str, counter: str):
+    with _client_stats_lock:
+        stats = _client_stats.setdefault(url, {'clients_created': 0, 'requests': 0})
+        stats[counter] += 1
+
+
+def _get_shared_client(url: str, key: str):
+    """
+    Return the process-wide Supabase client for a project, creating it on first use.
+
+    Clients are shared across Streamlit sessions and script threads so that the
+    underlying HTTP session (and its keep-alive connections) is reused instead of
+    paying for a new TLS handshake on every call.
+    """
+    cache_key = (url, key)
+    client = _shared_clients.get(cache_key)
+    if client is not None:
+        return client
+    with _client_lock:
+        client = _shared_clients.get(cache_key)
+        if client is None:
+            import httpx
+            from supabase import ClientOptions, create_client
+            # The client owns its HTTP session, so every request can be counted through
+            # httpx's public event hooks
+            http_client = httpx.Client(
+                timeout=120,
+                follow_redirects=True,
+                event_hooks={'request': [lambda request: _record_client_stat(url, 'requests')]},
+            )
+            client = create_client(url, key, options=ClientOptions(httpx_client=http_client))
+            # Build the PostgREST sub-client while holding the lock so concurrent
+            # first callers don't each open their own HTTP session.
+            client.postgrest
+            _shared_clients[cache_key] = client
+            _record_client_stat(url, 'clients_created')
+    return client
+
+
+def get_client_stats():
+    """
+    Report how often each project's shared Supabase client was created and used.
+
+    A healthy process creates each client once and sends every request through it.
+
+    Returns:
+        dict mapping project URL to {'clients_created': int, 'requests': int}
+    """
+    with _client_stats_lock:
+        return {url: dict(stats) for url, stats in _client_stats.items()}
+
+
+def get_supabase_client():
+    """Get the shared Supabase client for reviewer data based on mode."""
+    import streamlit as st
+    if st.secrets['MODE'] == 'dev':
+        return _get_shared_client(
+            st.secrets['SUPABASE_DEV_URL'],
+            st.secrets['SUPABASE_DEV_KEY'],
+        )
+    elif st.secrets['MODE'] == 'prod':
+        return _get_shared_client(
+            st.secrets["SUPABASE_URL"],
+            st.secrets["SUPABASE_KEY"],
+        )
+    return None
+
+
+def get_contributor_supabase_client():
+    """Get the shared Supabase client for contributor data (repo-issues table)."""
+    try:
+        url, key = get_contributor_db_creds()
+        if not url or not key:
+            print("Contributor database credentials not found in secrets")
+            return None
+        return _get_shared_client(url, key)
+    except Exception as e:
+        print(f"Error creating contributor client: {e}")
+        return None
+
+
+_openai_client = None
+
+
+def get_openai_client():
+    """Get the shared OpenAI client used for audio transcription."""
+    global _openai_client
+    if _openai_client is None:
+        with _client_lock:
+            if _openai_client is None:
+                import openai
+                import streamlit as st
+                _openai_client = openai.OpenAI(api_key=st.secrets.get('OPENAI_KEY', ''))
+    return _openai_client
+
+
+def _load_service_account_info():
+    """Read the Drive service account from secrets or the local google_auth.json."""
+    import streamlit as st
+    sa_info = st.secrets.get('gcp_service_account')
+    if not sa_info:
+        candidate_path = st.secrets.get('GCP_SERVICE_ACCOUNT_FILE', 'google_auth.json')
+        if candidate_path and os.path.exists(candidate_path):
+            with open(candidate_path, 'r', encoding='utf-8') as f:
+                sa_info = json.load(f)
+        else:
+            raise RuntimeError(
+                "Missing service account credentials. Provide st.secrets['gcp_service_account'] or place google_auth.json in the app root."
+            )
+    return sa_info
+
+
+# Refresh the Drive access token in the background once it is this close to expiring
+DRIVE_TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+_drive_lock = threading.Lock()
+_drive_refresh_lock = threading.Lock()
+_drive_credentials = None
+_drive_refresh_pending = False
+_drive_threads = threading.local()
+_drive_token_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='drive-token')
+
+
+def _utcnow():
+    """Current UTC time as a naive datetime, the form google-auth keeps expiry in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _token_expires_within(creds, seconds: int) -> bool:
+    return not creds.token or creds.expiry is None or creds.expiry <= _utcnow() + timedelta(seconds=seconds)
+
+
+def _refresh_drive_token(creds, needs_refresh):
+    """Refresh creds unless a concurrent caller already did; one refresh runs at a time."""
+    from google.auth.transport.requests import Request
+
+    with _drive_refresh_lock:
+        if needs_refresh(creds):
+            creds.refresh(Request())
+
+
+def _refresh_drive_token_in_background(creds):
+    global _drive_refresh_pending
+    try:
+        _refresh_drive_token(
+            creds, lambda c: _token_expires_within(c, DRIVE_TOKEN_REFRESH_MARGIN_SECONDS)
+        )
+    except Exception as e:
+        # The token is still valid; the next caller inside the margin schedules another try
+        print(f"[DRIVE] Background token refresh failed: {e}")
+    finally:
+        with _drive_lock:
+            _drive_refresh_pending = False
+
+
+def _get_drive_credentials():
+    """
+    Return the shared service-account credentials with a usable token.
+
+    A token inside the refresh margin is refreshed on a background thread while
+    callers keep using it; only a missing or expired token is refreshed inline.
+    """
+    global _drive_credentials, _drive_refresh_pending
+    from google.oauth2.service_account import Credentials
+
+    with _drive_lock:
+        if _drive_credentials is None:
+            _drive_credentials = Credentials.from_service_account_info(
+                _load_service_account_info(), scopes=DRIVE_SCOPES
+            )
+        creds = _drive_credentials
+
+    if not creds.valid:
+        _refresh_drive_token(creds, lambda c: not c.valid)
+    elif _token_expires_within(creds, DRIVE_TOKEN_REFRESH_MARGIN_SECONDS):
+        with _drive_lock:
+            schedule = not _drive_refresh_pending
+            _drive_refresh_pending = True
+        if schedule:
+            _drive_token_executor.submit(_refresh_drive_token_in_background, creds)
+    return creds
+
+
+def get_drive_service():
+    """
+    Get a Google Drive v3 service for the calling thread.
+
+    Credentials are parsed once per process and shared, with the token refreshed
+    in the background before it expires. The service (and its HTTP connection) is built once per thread
+    and reused, since the underlying httplib2 client is not thread-safe.
+    """
+    try:
+        from googleapiclient.discovery import build
+    except Exception:
+        raise RuntimeError(
+            "Google API libraries not available. Please install 'google-api-python-client' and 'google-auth'."
+        )
+    creds = _get_drive_credentials()
+    service = getattr(_drive_threads, 'service', None)
+    if service is None:
+        service = build('drive', 'v3', credentials=creds, cache_discovery=False)
+        _drive_threads.service = service
+    return service
@@ -2,50 +2,54 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
 import json
-import os
 import re
-from typing import List, Optional
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional
 
-import streamlit as st
+from clients import get_drive_service, get_supabase_client
 
-try:
-    from googleapiclient.discovery import build
-    from googleapiclient.http import MediaIoBaseUpload
-    from google.oauth2.service_account import Credentials
-except Exception:  # pragma: no cover - handled at runtime
-    build = None
-    MediaIoBaseUpload = None
-    Credentials = None
 
+# Resumable chunks must be a multiple of 256 KB; peak memory per upload is about one chunk
+CHUNK_SIZE = 8 * 1024 * 1024
+# Non-seekable uploads are spooled, in memory up to this size and on disk beyond it; rolling
+# over copies the in-memory part once, so it is kept to half a chunk
+SPOOL_MAX_MEMORY = CHUNK_SIZE // 2
+# Spooling copies in pieces this size rather than whole chunks
+SPOOL_COPY_SIZE = 1024 * 1024
 
-SCOPES = ['https://www.googleapis.com/auth/drive']
-CHUNK_SIZE = 100 * 1024 * 1024  # 100 MB chunks keep uploads efficient
+FOLDER_MIMETYPE = 'application/vnd.google-apps.folder'
+DRIVE_FOLDERS_TABLE = 'reviewer-drive-folders'
+UPLOAD_SESSIONS_TABLE = 'reviewer-upload-sessions'
+REVIEW_STAGES = ('initial_review', 'final_review')
 
+# (parent folder ID, sanitized name) -> folder ID, loaded from DRIVE_FOLDERS_TABLE once per process
+_folder_ids = {}
+_folder_registry_loaded = False
+_folder_locks = {}
+_folder_cache_lock = threading.Lock()
 
-def _require_google_libs():
-    if build is None or MediaIoBaseUpload is None or Credentials is None:
-        raise RuntimeError(
-            "Google API libraries not available. Please install 'google-api-python-client' and 'google-auth'."
-        )
+_provision_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='drive-provision')
+_provisioned = set()
 
+# A resumable session is saved when Drive creates it, then after this many chunks or seconds
+UPLOAD_SESSION_SAVE_CHUNKS = 8
+UPLOAD_SESSION_SAVE_SECONDS = 30
 
-def get_drive_service():
-    """Initialize a Google Drive service using a service account stored in secrets."""
-    _require_google_libs()
-    sa_info = st.secrets.get('gcp_service_account')
-    if not sa_info:
-        candidate_path = st.secrets.get('GCP_SERVICE_ACCOUNT_FILE', 'google_auth.json')
-        if candidate_path and os.path.exists(candidate_path):
-            with open(candidate_path, 'r', encoding='utf-8') as f:
-                sa_info = json.load(f)
-        else:
-            raise RuntimeError(
-                "Missing service account credentials. Provide st.secrets['gcp_service_account'] or place google_auth.json in the app root."
-            )
-    creds = Credentials.from_service_account_info(sa_info, scopes=SCOPES)
-    return build('drive', 'v3', credentials=creds, cache_discovery=False)
+# Background uploads: at most UPLOAD_WORKERS transfers run at once, the rest wait in the queue
+UPLOAD_WORKERS = 4
+UPLOAD_JOB_RETENTION_SECONDS = 3600
+_upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix='drive-upload')
+_upload_jobs = {}
+_upload_jobs_lock = threading.Lock()
 
 
 def sanitize_filename(name: str) -> str:
@@ -56,11 +60,107 @@ def sanitize_filename(name: str) -> str:
     return safe or "uploaded_file"
 
 
-def _get_or_create_folder(service, parent_id: str, name: str) -> str:
-    """Return the ID of a child folder with given name under parent, creating it if needed."""
-    folder_name = sanitize_filename(name)
+def get_base_folder_id() -> Optional[str]:
+    """Return the configured Drive folder that participant folders are created under."""
+    import streamlit as st
+    return st.secrets.get('REVIEWER_GDRIVE_FOLDER_ID') or st.secrets.get('GDRIVE_FOLDER_ID')
+
+
+def participant_subfolders(participant_id, issue_id, stage: str) -> List[str]:
+    """Return the [participant, pr_<id>, stage] folder path for a PR's uploads."""
+    participant_folder = sanitize_filename(participant_id) if participant_id else "unknown_participant"
+    issue_folder = sanitize_filename(f"pr_{issue_id}") if issue_id else "unknown_pr"
+    return [participant_folder, issue_folder, stage]
+
+
+def _ensure_folder_registry_loaded():
+    """Load every registered folder ID into the in-process cache on first use."""
+    global _folder_registry_loaded
+    if _folder_registry_loaded:
+        return
+    with _folder_cache_lock:
+        if _folder_registry_loaded:
+            return
+        try:
+            supabase_client = get_supabase_client()
+            if supabase_client:
+                page_size = 1000
+                start = 0
+                while True:
+                    rows = supabase_client.table(DRIVE_FOLDERS_TABLE).select(
+                        'parent_id, name, folder_id'
+                    ).range(start, start + page_size - 1).execute().data or []
+                    for row in rows:
+                        _folder_ids[(row['parent_id'], row['name'])] = row['folder_id']
+                    if len(rows) < page_size:
+                        break
+                    start += page_size
+                print(f"[DRIVE] Loaded {len(_folder_ids)} cached folder IDs")
+        except Exception as e:
+            print(f"[DRIVE] Could not load folder registry: {e}")
+        _folder_registry_loaded = True
+
+
+def _lookup_registered_folder(parent_id: str, name: str) -> Optional[str]:
+    """Return the registered folder ID for (parent, name), if another process created it."""
+    try:
+        supabase_client = get_supabase_client()
+        if not supabase_client:
+            return None
+        rows = supabase_client.table(DRIVE_FOLDERS_TABLE).select('folder_id').eq(
+            'parent_id', parent_id
+        ).eq('name', name).limit(1).execute().data
+        return rows[0]['folder_id'] if rows else None
+    except Exception as e:
+        print(f"[DRIVE] Could not read folder registry: {e}")
+        return None
+
+
+def _register_folder(parent_id: str, name: str, folder_id: str) -> str:
+    """
+    Record a folder ID for (parent, name) and return the ID that won.
+
+    The unique key keeps the first registration, so when two processes create the
+    same folder concurrently both end up using the same ID.
+    """
+    try:
+        supabase_client = get_supabase_client()
+        if not supabase_client:
+            return folder_id
+        supabase_client.table(DRIVE_FOLDERS_TABLE).upsert(
+            {'parent_id': parent_id, 'name': name, 'folder_id': folder_id},
+            on_conflict='parent_id,name',
+            ignore_duplicates=True
+        ).execute()
+        return _lookup_registered_folder(parent_id, name) or folder_id
+    except Exception as e:
+        print(f"[DRIVE] Could not register folder {name}: {e}")
+        return folder_id
+
+
+def _evict_folders(keys):
+    """Drop stale (parent, name) entries from the in-process cache and the registry."""
+    supabase_client = None
+    try:
+        supabase_client = get_supabase_client()
+    except Exception as e:
+        print(f"[DRIVE] Could not evict folders from registry: {e}")
+    for parent_id, name in keys:
+        _folder_ids.pop((parent_id, name), None)
+        if not supabase_client:
+            continue
+        try:
+            supabase_client.table(DRIVE_FOLDERS_TABLE).delete().eq(
+                'parent_id', parent_id
+            ).eq('name', name).execute()
+        except Exception as e:
+            print(f"[DRIVE] Could not evict folder {name} from registry: {e}")
+
+
+def _find_or_create_drive_folder(service, parent_id: str, folder_name: str):
+    """Search Drive for a child folder, creating it if missing. Returns (folder ID, created)."""
     query = (
-        f"mimeType = 'application/vnd.google-apps.folder' and "
+        f"mimeType = '{FOLDER_MIMETYPE}' and "
         f"name = '{folder_name}' and '{parent_id}' in parents and trashed = false"
     )
     res = service.files().list(
@@ -72,10 +172,10 @@ def _get_or_create_folder(service, parent_id: str, name: str) -> str:
     ).execute()
     items = res.get('files', [])
     if items:
-        return items[0]['id']
+        return items[0]['id'], False
     body = {
         'name': folder_name,
-        'mimeType': 'application/vnd.google-apps.folder',
+        'mimeType': FOLDER_MIMETYPE,
         'parents': [parent_id],
     }
     created = service.files().create(
@@ -83,7 +183,98 @@ def _get_or_create_folder(service, parent_id: str, name: str) -> str:
         fields='id',
         supportsAllDrives=True
     ).execute()
-    return created['id']
+    return created['id'], True
+
+
+def _get_or_create_folder(service, parent_id: str, name: str) -> str:
+    """Return the ID of a child folder with given name under parent, creating it if needed."""
+    folder_name = sanitize_filename(name)
+    key = (parent_id, folder_name)
+    folder_id = _folder_ids.get(key)
+    if folder_id:
+        return folder_id
+
+    with _folder_cache_lock:
+        lock = _folder_locks.setdefault(key, threading.Lock())
+    # One resolver per folder in this process; the registry's unique key covers other processes
+    with lock:
+        folder_id = _folder_ids.get(key) or _lookup_registered_folder(parent_id, folder_name)
+        if not folder_id:
+            folder_id, created = _find_or_create_drive_folder(service, parent_id, folder_name)
+            winner_id = _register_folder(parent_id, folder_name, folder_id)
+            if created and winner_id != folder_id:
+                print(f"[DRIVE] Folder {folder_name} was created concurrently; removing duplicate")
+                try:
+                    service.files().delete(fileId=folder_id, supportsAllDrives=True).execute()
+                except Exception as e:
+                    print(f"[DRIVE] Could not remove duplicate folder {folder_id}: {e}")
+            folder_id = winner_id
+        _folder_ids[key] = folder_id
+    return folder_id
+
+
+def _resolve_folder_path(service, base_folder_id: str, subfolders, resolved_keys: list) -> str:
+    """Walk subfolders from base_folder_id, appending each (parent, name) key to resolved_keys."""
+    _ensure_folder_registry_loaded()
+    parent_id = base_folder_id
+    for folder_name in subfolders or []:
+        if folder_name:
+            resolved_keys.append((parent_id, sanitize_filename(folder_name)))
+            parent_id = _get_or_create_folder(service, parent_id, folder_name)
+    return parent_id
+
+
+def _is_not_found_error(error) -> bool:
+    """Whether a Drive API error is a 404, e.g. for a cached folder that was deleted."""
+    return getattr(getattr(error, 'resp', None), 'status', None) == 404
+
+
+def provision_participant_folders(base_folder_id: str, participant_id: str, issue_ids):
+    """
+    Create a participant's folder tree (pr_<id>/initial_review and final_review) up front.
+
+    Args:
+        base_folder_id: Drive folder participant folders live under
+        participant_id: The participant's ID
+        issue_ids: Issue IDs of the participant's assigned PRs
+
+    Returns:
+        dict with 'success' and 'error' keys
+    """
+    try:
+        service = get_drive_service()
+        for issue_id in issue_ids:
+            for stage in REVIEW_STAGES:
+                _resolve_folder_path(
+                    service, base_folder_id, participant_subfolders(participant_id, issue_id, stage), []
+                )
+        return {'success': True, 'error': None}
+    except Exception as e:
+        print(f"[DRIVE] Could not provision folders for {participant_id}: {e}")
+        return {'success': False, 'error': str(e)}
+
+
+def schedule_folder_provisioning(base_folder_id: str, participant_id: str, issue_ids):
+    """Provision a participant's folders for new PRs in the background, at most once per process."""
+    if not base_folder_id or not participant_id:
+        return
+    with _folder_cache_lock:
+        pending = [i for i in issue_ids if i is not None and (participant_id, str(i)) not in _provisioned]
+        _provisioned.update((participant_id, str(i)) for i in pending)
+    if pending:
+        _provision_executor.submit(provision_participant_folders, base_folder_id, participant_id, pending)
+
+
+def _as_seekable_stream(file):
+    """Return a readable, seekable stream over file, spooling to disk if it can't seek."""
+    seekable = getattr(file, 'seekable', None)
+    if callable(seekable) and seekable():
+        file.seek(0)
+        return file
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    shutil.copyfileobj(file, spool, SPOOL_COPY_SIZE)
+    spool.seek(0)
+    return spool
 
 
 def upload_to_drive_in_subfolders(
@@ -91,23 +282,156 @@ def upload_to_drive_in_subfolders(
     base_folder_id: str,
     subfolders: Optional[List[str]] = None,
     filename: Optional[str] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+    mimetype: Optional[str] = None,
+    resume_key: Optional[tuple] = None,
+    fingerprint: Optional[str] = None,
 ):
-    """Upload a Streamlit UploadedFile into nested Drive folders, creating them as needed."""
+    """
+    Upload a Streamlit UploadedFile into nested Drive folders, creating them as needed.
+
+    on_progress, if given, is called with the number of bytes Drive has acknowledged
+    after each chunk; it may raise to stop the upload. With a resume_key such as
+    (participant_id, issue_id, artifact), the resumable session is persisted so a
+    later upload of the same file continues from the last acknowledged chunk instead
+    of starting over. fingerprint is the file's _stream_fingerprint if the caller
+    already computed it.
+    """
     if not base_folder_id:
         raise RuntimeError("Missing Drive folder ID. Set 'GDRIVE_FOLDER_ID' (or REVIEWER_GDRIVE_FOLDER_ID) in secrets.")
 
+    started_at = time.monotonic()
+    # Raises RuntimeError if the Google API libraries are not installed
     service = get_drive_service()
-    parent_id = base_folder_id
-    for folder_name in subfolders or []:
-        if folder_name:
-            parent_id = _get_or_create_folder(service, parent_id, folder_name)
-
-    file_bytes = file.getvalue()
-    mimetype = getattr(file, 'type', None) or 'application/octet-stream'
+    mimetype = mimetype or getattr(file, 'type', None) or 'application/octet-stream'
     safe_name = sanitize_filename(filename or getattr(file, 'name', 'uploaded_file'))
+    stream = _as_seekable_stream(file)
+
+    # Folder IDs normally come from the cache; if one was deleted in Drive, evict the path and retry once
+    for attempt in range(2):
+        resolved_keys = []
+        try:
+            parent_id = _resolve_folder_path(service, base_folder_id, subfolders, resolved_keys)
+            stream.seek(0)
+            return _upload_stream(
+                service, stream, mimetype, safe_name, parent_id, started_at,
+                on_progress=on_progress, resume_key=resume_key, fingerprint=fingerprint
+            )
+        except Exception as e:
+            if attempt or not resolved_keys or not _is_not_found_error(e):
+                raise
+            print(f"[DRIVE] Cached folder path for {safe_name} is stale; resolving it again")
+            _evict_folders(resolved_keys)
+
 
+def _stream_fingerprint(stream, total_bytes: int, safe_name: str) -> str:
+    """Identify a file by name, size and first chunk, so a saved session is only resumed for the same file."""
+    stream.seek(0)
+    digest = hashlib.sha256(stream.read(CHUNK_SIZE))
+    stream.seek(0)
+    digest.update(f"{safe_name}:{total_bytes}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _session_key_filter(query, resume_key: tuple):
+    participant_id, issue_id, artifact = resume_key
+    return query.eq('participant_id', str(participant_id)).eq('issue_id', str(issue_id)).eq('artifact', artifact)
+
+
+def _load_upload_session(resume_key: tuple) -> Optional[dict]:
+    """Return the saved resumable session for (participant, issue, artifact), if any."""
+    try:
+        supabase_client = get_supabase_client()
+        if not supabase_client:
+            return None
+        query = supabase_client.table(UPLOAD_SESSIONS_TABLE).select('fingerprint, resumable_uri, bytes_confirmed')
+        rows = _session_key_filter(query, resume_key).limit(1).execute().data
+        return rows[0] if rows else None
+    except Exception as e:
+        print(f"[DRIVE] Could not load upload session {resume_key}: {e}")
+        return None
+
+
+def _save_upload_session(resume_key: tuple, fingerprint: str, resumable_uri: str, bytes_confirmed: int):
+    """Persist the resumable session URI and the byte offset Drive has acknowledged."""
+    from datetime import datetime, timezone
+    participant_id, issue_id, artifact = resume_key
+    try:
+        supabase_client = get_supabase_client()
+        if not supabase_client:
+            return
+        supabase_client.table(UPLOAD_SESSIONS_TABLE).upsert({
+            'participant_id': str(participant_id),
+            'issue_id': str(issue_id),
+            'artifact': artifact,
+            'fingerprint': fingerprint,
+            'resumable_uri': resumable_uri,
+            'bytes_confirmed': bytes_confirmed,
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+        }, on_conflict='participant_id,issue_id,artifact').execute()
+    except Exception as e:
+        print(f"[DRIVE] Could not save upload session {resume_key}: {e}")
+
+
+def _clear_upload_session(resume_key: tuple, fingerprint: str):
+    """Forget a finished session; a row already taken over by a different file is left alone."""
+    try:
+        supabase_client = get_supabase_client()
+        if supabase_client:
+            query = supabase_client.table(UPLOAD_SESSIONS_TABLE).delete().eq('fingerprint', fingerprint)
+            _session_key_filter(query, resume_key).execute()
+    except Exception as e:
+        print(f"[DRIVE] Could not clear upload session {resume_key}: {e}")
+
+
+def _query_resumable_offset(service, http, resumable_uri: str, total_bytes: int):
+    """
+    Ask Drive how far a resumable session got.
+
+    Returns:
+        tuple of (bytes acknowledged, completed file resource); bytes acknowledged is
+        None when the session has expired or is unknown. The file resource has the
+        same 'id, webViewLink' fields as a freshly completed upload.
+    """
+    resp, content = http.request(
+        resumable_uri,
+        method='PUT',
+        body=b'',
+        headers={'Content-Length': '0', 'Content-Range': f'bytes */{total_bytes}'}
+    )
+    if resp.status in (200, 201):
+        # The session replies with Drive's default file fields, which lack webViewLink
+        file_id = json.loads(content)['id']
+        completed = service.files().get(
+            fileId=file_id,
+            fields='id, webViewLink',
+            supportsAllDrives=True
+        ).execute()
+        return total_bytes, completed
+    if resp.status == 308:
+        # Range is "bytes=0-<last byte received>"; absent when nothing was stored yet
+        byte_range = resp.get('range')
+        return (int(byte_range.rsplit('-', 1)[1]) + 1 if byte_range else 0), None
+    return None, None
+
+
+def _upload_stream(
+    service,
+    stream,
+    mimetype: str,
+    safe_name: str,
+    parent_id: str,
+    started_at: float,
+    on_progress=None,
+    resume_key: Optional[tuple] = None,
+    fingerprint: Optional[str] = None,
+):
+    """Upload stream into parent_id as a resumable upload, one chunk at a time."""
+    from googleapiclient.http import MediaIoBaseUpload
+
+    # Stream from the uploaded file object itself; MediaIoBaseUpload reads one chunk at a time
     media = MediaIoBaseUpload(
-        io.BytesIO(file_bytes),
+        stream,
         mimetype=mimetype,
         resumable=True,
         chunksize=CHUNK_SIZE
@@ -120,7 +444,210 @@ def upload_to_drive_in_subfolders(
         supportsAllDrives=True
     )
 
+    if resume_key:
+        if fingerprint is None:
+            fingerprint = _stream_fingerprint(stream, media.size(), safe_name)
+        saved = _load_upload_session(resume_key)
+        if saved and saved['fingerprint'] == fingerprint:
+            try:
+                offset, completed = _query_resumable_offset(
+                    service, request.http, saved['resumable_uri'], media.size()
+                )
+            except Exception as e:
+                print(f"[DRIVE] Could not query upload session for {safe_name}: {e}")
+                offset, completed = None, None
+            if completed is not None:
+                print(f"[DRIVE] {safe_name} was already fully uploaded")
+                _clear_upload_session(resume_key, fingerprint)
+                return completed
+            if offset is not None:
+                print(f"[DRIVE] Resuming {safe_name} at byte {offset} of {media.size()}")
+                request.resumable_uri = saved['resumable_uri']
+                request.resumable_progress = offset
+                if on_progress:
+                    on_progress(offset)
+            else:
+                print(f"[DRIVE] Saved upload session for {safe_name} expired; starting over")
+
     response = None
+    first_chunk_logged = False
+    # The URI of a resumed session is already saved; a new one is saved as soon as Drive creates it
+    saved_uri = request.resumable_uri
+    saved_at = time.monotonic()
+    chunks_since_save = 0
     while response is None:
         status, response = request.next_chunk()
+        if not first_chunk_logged:
+            print(f"[DRIVE] First chunk of {safe_name} acknowledged {time.monotonic() - started_at:.2f}s after start")
+            first_chunk_logged = True
+        if status is not None:
+            # Runs first so a cancelled job stops before it can overwrite its replacement's session
+            if on_progress:
+                on_progress(status.resumable_progress)
+            chunks_since_save += 1
+            if resume_key and request.resumable_uri and (
+                request.resumable_uri != saved_uri
+                or chunks_since_save >= UPLOAD_SESSION_SAVE_CHUNKS
+                or time.monotonic() - saved_at >= UPLOAD_SESSION_SAVE_SECONDS
+            ):
+                _save_upload_session(resume_key, fingerprint, request.resumable_uri, status.resumable_progress)
+                saved_uri = request.resumable_uri
+                saved_at = time.monotonic()
+                chunks_since_save = 0
+    if resume_key:
+        _clear_upload_session(resume_key, fingerprint)
     return response
+
+
+@dataclass
+class UploadJob:
+    """Progress of one background upload; fields are written only by its worker thread."""
+    job_id: str
+    filename: str
+    total_bytes: int
+    state: str = 'queued'  # queued, uploading, done, failed, cancelled
+    bytes_sent: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    response: Optional[dict] = None
+    resume_key: Optional[tuple] = None
+    fingerprint: Optional[str] = None
+    # Set by submit_upload when a different file replaces this one; the worker stops at the next chunk
+    cancel_requested: bool = False
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ('done', 'failed', 'cancelled')
+
+    def progress(self) -> dict:
+        """
+        Summarize the transfer for display.
+
+        Returns:
+            dict with 'fraction', 'bytes_sent', 'total_bytes', 'rate' (bytes/s) and
+            'eta' (seconds, or None until a rate is known)
+        """
+        elapsed = ((self.finished_at or time.monotonic()) - self.started_at) if self.started_at else 0
+        rate = self.bytes_sent / elapsed if elapsed > 0 else 0
+        remaining = max(self.total_bytes - self.bytes_sent, 0)
+        return {
+            'fraction': min(self.bytes_sent / self.total_bytes, 1.0) if self.total_bytes else (1.0 if self.finished else 0.0),
+            'bytes_sent': self.bytes_sent,
+            'total_bytes': self.total_bytes,
+            'rate': rate,
+            'eta': remaining / rate if rate and not self.finished else None,
+        }
+
+
+def _detached_stream(file):
+    """Return a stream over file's bytes that the worker can read while the page reruns."""
+    getvalue = getattr(file, 'getvalue', None)
+    if callable(getvalue):
+        # UploadedFile is BytesIO-backed; a second BytesIO shares the bytes without copying them
+        return io.BytesIO(getvalue())
+    return _as_seekable_stream(file)
+
+
+class UploadCancelled(Exception):
+    """Raised inside a worker when its job was replaced by a newer upload."""
+
+
+def _run_upload_job(job: UploadJob, stream, base_folder_id: str, subfolders, mimetype: str):
+    """Worker body: run one upload and record its outcome on the job."""
+    job.started_at = time.monotonic()
+
+    def on_progress(bytes_sent):
+        job.bytes_sent = bytes_sent
+        if job.cancel_requested:
+            raise UploadCancelled()
+
+    try:
+        if job.cancel_requested:
+            raise UploadCancelled()
+        job.state = 'uploading'
+        job.response = upload_to_drive_in_subfolders(
+            stream, base_folder_id, subfolders=subfolders, filename=job.filename,
+            on_progress=on_progress, mimetype=mimetype, resume_key=job.resume_key,
+            fingerprint=job.fingerprint
+        )
+        job.bytes_sent = job.total_bytes
+        job.state = 'done'
+        print(f"[UPLOAD] {job.filename} uploaded ({job.total_bytes} bytes)")
+    except UploadCancelled:
+        job.state = 'cancelled'
+        print(f"[UPLOAD] {job.filename} was replaced by a newer upload; stopped")
+    except Exception as e:
+        job.error = str(e)
+        job.state = 'failed'
+        print(f"[UPLOAD] {job.filename} failed: {e}")
+    finally:
+        job.finished_at = time.monotonic()
+
+
+def submit_upload(
+    file,
+    base_folder_id: str,
+    subfolders: Optional[List[str]] = None,
+    filename: Optional[str] = None,
+    resume_key: Optional[tuple] = None,
+) -> str:
+    """
+    Queue an upload on the background worker pool and return immediately.
+
+    Args:
+        file: Streamlit UploadedFile (or any readable file object)
+        base_folder_id: Drive folder the subfolder path starts from
+        subfolders: Folder names to create/resolve under base_folder_id
+        filename: Name for the uploaded file (defaults to file.name)
+        resume_key: (participant_id, issue_id, artifact) to persist the resumable
+            session under; resubmitting the same file while it is still uploading
+            joins that job, while a different file cancels and replaces it
+
+    Returns:
+        job ID to pass to get_upload_job
+    """
+    if not base_folder_id:
+        raise RuntimeError("Missing Drive folder ID. Set 'GDRIVE_FOLDER_ID' (or REVIEWER_GDRIVE_FOLDER_ID) in secrets.")
+
+    if resume_key and not all(resume_key):
+        resume_key = None
+
+    name = filename or getattr(file, 'name', 'uploaded_file')
+    stream = _detached_stream(file)
+    total_bytes = getattr(file, 'size', None)
+    if total_bytes is None:
+        total_bytes = stream.seek(0, io.SEEK_END)
+        stream.seek(0)
+    fingerprint = _stream_fingerprint(stream, total_bytes, sanitize_filename(name)) if resume_key else None
+    job = UploadJob(
+        job_id=uuid.uuid4().hex, filename=name, total_bytes=total_bytes,
+        resume_key=resume_key, fingerprint=fingerprint
+    )
+
+    now = time.monotonic()
+    with _upload_jobs_lock:
+        for existing in _upload_jobs.values():
+            if not resume_key or existing.resume_key != resume_key or existing.finished:
+                continue
+            if existing.fingerprint == fingerprint:
+                print(f"[UPLOAD] {resume_key} is already uploading as job {existing.job_id}")
+                return existing.job_id
+            print(f"[UPLOAD] {resume_key} was resubmitted with a different file; cancelling job {existing.job_id}")
+            existing.cancel_requested = True
+        for stale_id in [
+            job_id for job_id, existing in _upload_jobs.items()
+            if existing.finished and now - existing.finished_at > UPLOAD_JOB_RETENTION_SECONDS
+        ]:
+            del _upload_jobs[stale_id]
+        _upload_jobs[job.job_id] = job
+
+    mimetype = getattr(file, 'type', None) or 'application/octet-stream'
+    _upload_executor.submit(_run_upload_job, job, stream, base_folder_id, subfolders, mimetype)
+    print(f"[UPLOAD] Queued {name} ({total_bytes} bytes) as job {job.job_id}")
+    return job.job_id
+
+
+def get_upload_job(job_id: str) -> Optional[UploadJob]:
+    """Return the background upload job with this ID, or None if it is unknown or expired."""
+    return _upload_jobs.get(job_id)
@@ -6,30 +6,9 @@ Organized into three main sections: Pre-study, Post-PR-Review, and Post-PR-Close
 import streamlit as st
 import streamlit.components.v1 as components
 from styles import SURVEY_STYLES
-from pages import (
-    # Pre-study pages
-    participant_id_page,
-    setup_checklist_page,
-    pr_assignment_page,
-
-    # Post-PR-Review pages
-    nasa_tlx_questions_page,
-    code_quality_ratings_page,
-    ai_detection_page,
-    review_submission_page,
-
-    # Post-PR-Closed pages
-    pr_status_page,
-    collaboration_questions_page,
-    contributor_perception_page,
-
-    # End of study pages
-    study_validation_page,
-
-    # Completion pages
-    completion_page
-)
-from survey_utils import normalize_page
+import pages
+from survey_utils import go_to_page, normalize_page, upload_progress_panel
+from survey_data import begin_request_scope, get_request_memo_stats
 
 
 def initialize_session_state():
@@ -45,6 +24,9 @@ def main():
     """Main application entry point."""
     st.set_page_config(page_title="Reviewer Survey", layout="centered")
 
+    # Collapse repeated reads within this rerun into a single network call
+    begin_request_scope()
+
     # Apply custom CSS styles
     st.markdown(SURVEY_STYLES, unsafe_allow_html=True)
 
@@ -63,38 +45,38 @@ def main():
             # Only update if the determined page is different from current page
             if correct_page != current_page:
                 print(f"[ROUTING] Current page: {current_page}, Correct page: {correct_page}, redirecting...")
-                st.session_state['page'] = correct_page
                 st.session_state['smart_routing_complete'] = True
-                st.rerun()
+                go_to_page(correct_page)
             else:
                 st.session_state['smart_routing_complete'] = True
 
-    # Route to the appropriate page based on session state
+    # Route to the appropriate page based on session state; page modules are
+    # imported from the pages package the first time their route is rendered
     # Flow: Pre-study → Post-PR-Review questions → PR Status → Post-PR-Closed questions → End-Study
     page_routes = {
         # Pre-study section
-        0: participant_id_page,             # Participant ID entry
-        2: setup_checklist_page,            # Setup checklist
-        3: pr_assignment_page,              # PR assignment
-        4: review_submission_page,          # Confirm first review submitted
+        0: 'participant_id_page',           # Participant ID entry
+        2: 'setup_checklist_page',          # Setup checklist
+        3: 'pr_assignment_page',            # PR assignment
+        4: 'review_submission_page',        # Confirm first review submitted
 
         # Post-PR-Review section (questions about the review experience)
-        5: nasa_tlx_questions_page,         # NASA-TLX workload questions
-        6: code_quality_ratings_page,       # Code quality ratings
-        7: ai_detection_page,               # AI detection questions
+        5: 'nasa_tlx_questions_page',       # NASA-TLX workload questions
+        6: 'code_quality_ratings_page',     # Code quality ratings
+        7: 'ai_detection_page',             # AI detection questions
 
         # PR Status check (after questions, check if PR is closed/merged)
-        8: pr_status_page,                  # PR status - can request another PR here
+        8: 'pr_status_page',                # PR status - can request another PR here
 
         # Post-PR-Closed section (only if PR is closed/merged)
-        9: collaboration_questions_page,    # Collaboration questions
-        10: contributor_perception_page,    # Contributor perception questions
+        9: 'collaboration_questions_page',  # Collaboration questions
+        10: 'contributor_perception_page',  # Contributor perception questions
 
         # End of study section
-        11: study_validation_page,          # Study validation
+        11: 'study_validation_page',        # Study validation
 
         # Completion section
-        12: completion_page                 # Survey completion
+        12: 'completion_page'               # Survey completion
     }
     
     current_page = st.session_state.get('page', 0)
@@ -102,9 +84,20 @@ def main():
     if normalized_page != current_page:
         st.session_state['page'] = normalized_page
         current_page = normalized_page
-    page_function = page_routes.get(current_page, participant_id_page)
+
+    # Background uploads keep running across pages; show their progress wherever the reviewer is
+    upload_progress_panel()
+
+    page_function = getattr(pages, page_routes.get(current_page, 'participant_id_page'))
     page_function()
 
+    memo_stats = get_request_memo_stats()
+    if memo_stats['deduplicated']:
+        print(
+            f"[MEMO] Page {current_page}: {memo_stats['deduplicated']} deduplicated reads, "
+            f"{memo_stats['executed']} executed"
+        )
+
 
 if __name__ == "__main__":
     main()
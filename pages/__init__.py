@@ -1,51 +1,36 @@
 """
 Survey pages package for reviewer survey.
 Organized into logical sections: pre-study, post-pr-review, post-pr-closed, and end-study.
+
+Sections and their page modules are imported on first attribute access (PEP 562),
+so rendering one page does not load the dependencies of every other page.
 """
 
-# Import from organized sections
-from .pre_study import (
-    participant_id_page,
-    setup_checklist_page,
-    pr_assignment_page
-)
-
-from .post_pr_review import (
-    nasa_tlx_questions_page,
-    code_quality_ratings_page,
-    ai_detection_page,
-    review_submission_page
-)
-
-from .post_pr_closed import (
-    collaboration_questions_page,
-    contributor_perception_page,
-    pr_status_page
-)
-
-from .end_study import (
-    study_validation_page,
-    completion_page
-)
-
-__all__ = [
+from ._lazy import lazy_exports
+
+
+_PAGE_SECTIONS = {
     # Pre-study pages
-    'participant_id_page',
-    'setup_checklist_page',
-    'pr_assignment_page',
-    
+    'participant_id_page': '.pre_study',
+    'setup_checklist_page': '.pre_study',
+    'pr_assignment_page': '.pre_study',
+
     # Post-PR-Review pages
-    'nasa_tlx_questions_page',
-    'code_quality_ratings_page',
-    'ai_detection_page',
-    'review_submission_page',
-    
+    'nasa_tlx_questions_page': '.post_pr_review',
+    'code_quality_ratings_page': '.post_pr_review',
+    'ai_detection_page': '.post_pr_review',
+    'review_submission_page': '.post_pr_review',
+
     # Post-PR-Closed pages
-    'pr_status_page',
-    'collaboration_questions_page',
-    'contributor_perception_page',
-    
+    'pr_status_page': '.post_pr_closed',
+    'collaboration_questions_page': '.post_pr_closed',
+    'contributor_perception_page': '.post_pr_closed',
+
     # End of study pages
-    'study_validation_page',
-    'completion_page'
-]
+    'study_validation_page': '.end_study',
+    'completion_page': '.end_study',
+}
+
+__all__ = list(_PAGE_SECTIONS)
+
+__getattr__ = lazy_exports(__name__, _PAGE_SECTIONS)
@@ -0,0 +1,29 @@
+"""
+Lazy page exports shared by the pages package and its sections.
+"""
+
+import importlib
+import sys
+
+
+def lazy_exports(module_name: str, mapping: dict):
+    """
+    Build a PEP 562 module __getattr__ that imports page functions on first access.
+
+    Args:
+        module_name: __name__ of the package the attributes belong to
+        mapping: Attribute name -> relative module to import it from, e.g.
+            {'completion_page': '.completion'}
+
+    Returns:
+        function to assign to the package's __getattr__
+    """
+    def __getattr__(name):
+        relative_module = mapping.get(name)
+        if relative_module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        page_function = getattr(importlib.import_module(relative_module, module_name), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[module_name], name, page_function)
+        return page_function
+    return __getattr__
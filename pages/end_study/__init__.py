@@ -1,11 +1,17 @@
 """
 End-of-study pages for the reviewer survey.
+
+Page modules are imported on first attribute access (PEP 562).
 """
 
-from .study_validation import study_validation_page
-from .completion import completion_page
+from .._lazy import lazy_exports
+
+
+_PAGE_MODULES = {
+    'study_validation_page': '.study_validation',
+    'completion_page': '.completion',
+}
+
+__all__ = list(_PAGE_MODULES)
 
-__all__ = [
-    'study_validation_page',
-    'completion_page'
-]
+__getattr__ = lazy_exports(__name__, _PAGE_MODULES)
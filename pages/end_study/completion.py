@@ -4,9 +4,9 @@ Survey completion page for the reviewer survey.
 
 import streamlit as st
 from survey_components import page_header, navigation_buttons
-from survey_utils import next_page
+from survey_utils import next_page, go_to_page
 from survey_data import (
-    save_session_state, get_repository_assignment, list_assigned_prs_for_reviewer,
+    save_session_state, flush_session_checkpoints, get_repository_assignment, list_assigned_prs_for_reviewer,
     get_completed_pr_closed_surveys,
 )
 
@@ -31,8 +31,7 @@ def completion_page():
             open_prs = [pr for pr in all_prs if not pr.get('is_closed') and not pr.get('is_merged')]
             if open_prs:
                 st.warning("You still have PRs to review or close. Redirecting to PR Status.")
-                st.session_state['page'] = 8
-                st.rerun()
+                go_to_page(8)
                 return
 
             # Also check for closed/merged PRs that are missing post-pr-closed surveys
@@ -48,8 +47,7 @@ def completion_page():
                     f"You have {len(pending_closed)} closed PR(s) with missing survey responses. "
                     "Redirecting to PR Status."
                 )
-                st.session_state['page'] = 8
-                st.rerun()
+                go_to_page(8)
                 return
 
     page_header(
@@ -71,13 +69,15 @@ def completion_page():
     if participant_id:
         try:
             from datetime import datetime, timezone
-            # Save final page and completed_at
+            # Save final page and completed_at, after any queued checkpoint so it can't overwrite them
+            flush_session_checkpoints(participant_id)
             save_session_state(participant_id, st.session_state.get('page', 12), st.session_state['survey_responses'])
             # Directly update completed_at
             supabase = st.session_state.get('supabase_client')
-            # Fallback to module-level client if not in session
+            # Fallback to the shared reviewer client if not in session
             if not supabase:
-                from survey_data import supabase_client as supabase
+                from clients import get_supabase_client
+                supabase = get_supabase_client()
             if supabase:
                 supabase.table('reviewer-sessions').update({
                     'completed_at': datetime.now(timezone.utc).isoformat()
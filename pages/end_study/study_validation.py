@@ -5,7 +5,7 @@ Asks about how the study workflow compared to normal work.
 
 import streamlit as st
 from survey_components import page_header, navigation_buttons
-from survey_utils import save_and_navigate, record_audio
+from survey_utils import save_and_navigate, go_to_page, record_audio
 from survey_data import (
     save_end_study_responses, get_participant_progress, MIN_COMPLETED_REVIEWS,
     get_completed_pr_closed_surveys, list_assigned_prs_for_reviewer, get_repository_assignment,
@@ -24,8 +24,7 @@ def study_validation_page():
         st.warning(
             "Please complete and close the minimum number of PR reviews before reflecting on the overall study. Redirecting to PR Status."
         )
-        st.session_state['page'] = 8
-        st.rerun()
+        go_to_page(8)
         return
 
     # Block if any reviewed+closed PR is still missing a post-pr-closed survey
@@ -50,14 +49,12 @@ def study_validation_page():
                     f"You have {len(pending)} closed PR(s) with missing survey responses. "
                     "Please complete them before finishing the study. Redirecting to PR Status."
                 )
-                st.session_state['page'] = 8
-                st.rerun()
+                go_to_page(8)
                 return
 
     # If end-of-study was already submitted, skip directly to completion
     if progress.get('end_study_completed'):
-        st.session_state['page'] = 12
-        st.rerun()
+        go_to_page(12)
         return
 
     page_header(
@@ -1,13 +1,18 @@
 """
 Post-PR-Closed pages for the reviewer survey.
+
+Page modules are imported on first attribute access (PEP 562).
 """
 
-from .collaboration_questions import collaboration_questions_page
-from .contributor_perception import contributor_perception_page
-from .pr_status import pr_status_page
+from .._lazy import lazy_exports
+
+
+_PAGE_MODULES = {
+    'collaboration_questions_page': '.collaboration_questions',
+    'contributor_perception_page': '.contributor_perception',
+    'pr_status_page': '.pr_status',
+}
+
+__all__ = list(_PAGE_MODULES)
 
-__all__ = [
-    'collaboration_questions_page',
-    'contributor_perception_page',
-    'pr_status_page'
-]
+__getattr__ = lazy_exports(__name__, _PAGE_MODULES)
@@ -34,54 +34,57 @@ def collaboration_questions_page():
     previous_responses = st.session_state['survey_responses'].get('collaboration_responses', {})
     previous_collaboration_description = st.session_state['survey_responses'].get('collaboration_description', '')
     
-    # Collaboration rating questions
-    responses = {}
-    for key, question in COLLABORATION_QUESTIONS.items():
-        previous_value = previous_responses.get(key, "Not selected")
+    # Batch answers in a form so slider moves don't rerun the page until a button is pressed
+    form = st.form("collaboration_form", border=False)
+    with form:
+        # Collaboration rating questions
+        responses = {}
+        for key, question in COLLABORATION_QUESTIONS.items():
+            previous_value = previous_responses.get(key, "Not selected")
         
-        response = slider_question(
-            question,
-            COLLABORATION_OPTIONS,
-            f"collaboration_{key}",
-            previous_value
-        )
+            response = slider_question(
+                question,
+                COLLABORATION_OPTIONS,
+                f"collaboration_{key}",
+                previous_value
+            )
         
-        responses[key] = response
+            responses[key] = response
     
-    st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
+        st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
     
-    # Open-ended collaboration question with audio or text option
-    st.markdown("""
-        <p style='font-size:18px; font-weight:600; margin-bottom: 1.5rem;'>
-        How would you describe collaboration during code review overall? What would have made the review discussions more productive?
-        </p>
-        """, unsafe_allow_html=True)
-    
-    # Create tabs for audio and text input
-    tab1, tab2 = st.tabs(["🎤 Record Audio", "⌨️ Type Response"])
-    
-    with tab1:
+        # Open-ended collaboration question with audio or text option
         st.markdown("""
-            <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
-            Click the microphone button below to record your response. Your audio will be transcribed automatically.
+            <p style='font-size:18px; font-weight:600; margin-bottom: 1.5rem;'>
+            How would you describe collaboration during code review overall? What would have made the review discussions more productive?
             </p>
             """, unsafe_allow_html=True)
-        transcript = record_audio("collaboration_description", min_duration=10, max_duration=600)
     
-    with tab2:
-        st.markdown("""
-            <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
-            Type your response in the text box below.
-            </p>
-            """, unsafe_allow_html=True)
-        text_response = st.text_area(
-            "Your response:",
-            key="collaboration_description_text",
-            value=previous_collaboration_description,
-            height=150,
-            placeholder="Type your answer here...",
-            label_visibility="collapsed"
-        )
+        # Create tabs for audio and text input
+        tab1, tab2 = st.tabs(["🎤 Record Audio", "⌨️ Type Response"])
+    
+        with tab1:
+            st.markdown("""
+                <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
+                Click the microphone button below to record your response. Your audio will be transcribed automatically.
+                </p>
+                """, unsafe_allow_html=True)
+            transcript = record_audio("collaboration_description", min_duration=10, max_duration=600, in_form=True)
+    
+        with tab2:
+            st.markdown("""
+                <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
+                Type your response in the text box below.
+                </p>
+                """, unsafe_allow_html=True)
+            text_response = st.text_area(
+                "Your response:",
+                key="collaboration_description_text",
+                value=previous_collaboration_description,
+                height=150,
+                placeholder="Type your answer here...",
+                label_visibility="collapsed"
+            )
     
     # Use whichever response is available
     if transcript:
@@ -124,11 +127,13 @@ def collaboration_questions_page():
         save_and_navigate('next')
 
     # Navigation
-    navigation_buttons(
-        on_back=handle_back,
-        on_next=handle_next,
-        back_key="collaboration_back",
-        next_key="collaboration_next",
-        validation_fn=validate,
-        validation_error="Please answer all questions before proceeding."
-    )
+    with form:
+        navigation_buttons(
+            on_back=handle_back,
+            on_next=handle_next,
+            back_key="collaboration_back",
+            next_key="collaboration_next",
+            validation_fn=validate,
+            validation_error="Please answer all questions before proceeding.",
+            in_form=True
+        )
@@ -34,89 +34,92 @@ def contributor_perception_page():
     previous_perception_description = st.session_state['survey_responses'].get('perception_description', '')
     previous_effort_response = st.session_state['survey_responses'].get('perception_effort', '')
     
-    # Contributor perception rating questions
-    responses = {}
-    for key, question in PERCEPTION_QUESTIONS.items():
-        previous_value = previous_responses.get(key, "Not selected")
+    # Batch answers in a form so slider moves don't rerun the page until a button is pressed
+    form = st.form("perception_form", border=False)
+    with form:
+        # Contributor perception rating questions
+        responses = {}
+        for key, question in PERCEPTION_QUESTIONS.items():
+            previous_value = previous_responses.get(key, "Not selected")
         
-        response = slider_question(
-            question,
-            PERCEPTION_OPTIONS,
-            f"perception_{key}",
-            previous_value
-        )
+            response = slider_question(
+                question,
+                PERCEPTION_OPTIONS,
+                f"perception_{key}",
+                previous_value
+            )
         
-        responses[key] = response
-    
-    st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
-    
-    # New effort question with audio or text option
-    st.markdown("""
-        <p style='font-size:18px; font-weight:600; margin-bottom: 1.5rem;'>
-        How much effort do you think the contributor spent in understanding the problem and writing code? What gave you that impression?
-        </p>
-        """, unsafe_allow_html=True)
+            responses[key] = response
     
-    # Create tabs for audio and text input
-    tab3, tab4 = st.tabs(["🎤 Record Audio", "⌨️ Type Response"])
+        st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
     
-    with tab3:
+        # New effort question with audio or text option
         st.markdown("""
-            <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
-            Click the microphone button below to record your response. Your audio will be transcribed automatically.
+            <p style='font-size:18px; font-weight:600; margin-bottom: 1.5rem;'>
+            How much effort do you think the contributor spent in understanding the problem and writing code? What gave you that impression?
             </p>
             """, unsafe_allow_html=True)
-        effort_transcript = record_audio("perception_effort", min_duration=10, max_duration=600)
-    
-    with tab4:
-        st.markdown("""
-            <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
-            Type your response in the text box below.
-            </p>
-            """, unsafe_allow_html=True)
-        effort_text_response = st.text_area(
-            "Your response:",
-            key="perception_effort_text",
-            value=previous_effort_response,
-            height=150,
-            placeholder="Type your answer here...",
-            label_visibility="collapsed"
-        )
     
-    st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
+        # Create tabs for audio and text input
+        tab3, tab4 = st.tabs(["🎤 Record Audio", "⌨️ Type Response"])
+    
+        with tab3:
+            st.markdown("""
+                <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
+                Click the microphone button below to record your response. Your audio will be transcribed automatically.
+                </p>
+                """, unsafe_allow_html=True)
+            effort_transcript = record_audio("perception_effort", min_duration=10, max_duration=600, in_form=True)
+    
+        with tab4:
+            st.markdown("""
+                <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
+                Type your response in the text box below.
+                </p>
+                """, unsafe_allow_html=True)
+            effort_text_response = st.text_area(
+                "Your response:",
+                key="perception_effort_text",
+                value=previous_effort_response,
+                height=150,
+                placeholder="Type your answer here...",
+                label_visibility="collapsed"
+            )
+    
+        st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
 
-    # Open-ended perception question with audio or text option
-    st.markdown("""
-        <p style='font-size:18px; font-weight:600; margin-bottom: 1.5rem;'>
-        How did this PR discussion affect your perception of this contributor?
-        </p>
-        """, unsafe_allow_html=True)
-    
-    # Create tabs for audio and text input
-    tab1, tab2 = st.tabs(["🎤 Record Audio", "⌨️ Type Response"])
-    
-    with tab1:
+        # Open-ended perception question with audio or text option
         st.markdown("""
-            <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
-            Click the microphone button below to record your response. Your audio will be transcribed automatically.
+            <p style='font-size:18px; font-weight:600; margin-bottom: 1.5rem;'>
+            How did this PR discussion affect your perception of this contributor?
             </p>
             """, unsafe_allow_html=True)
-        transcript = record_audio("perception_description", min_duration=10, max_duration=600)
     
-    with tab2:
-        st.markdown("""
-            <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
-            Type your response in the text box below.
-            </p>
-            """, unsafe_allow_html=True)
-        text_response = st.text_area(
-            "Your response:",
-            key="perception_description_text",
-            value=previous_perception_description,
-            height=150,
-            placeholder="Type your answer here...",
-            label_visibility="collapsed"
-        )
+        # Create tabs for audio and text input
+        tab1, tab2 = st.tabs(["🎤 Record Audio", "⌨️ Type Response"])
+    
+        with tab1:
+            st.markdown("""
+                <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
+                Click the microphone button below to record your response. Your audio will be transcribed automatically.
+                </p>
+                """, unsafe_allow_html=True)
+            transcript = record_audio("perception_description", min_duration=10, max_duration=600, in_form=True)
+    
+        with tab2:
+            st.markdown("""
+                <p style='font-size:14px; margin-bottom: 0.5rem; color: #666;'>
+                Type your response in the text box below.
+                </p>
+                """, unsafe_allow_html=True)
+            text_response = st.text_area(
+                "Your response:",
+                key="perception_description_text",
+                value=previous_perception_description,
+                height=150,
+                placeholder="Type your answer here...",
+                label_visibility="collapsed"
+            )
     
     # Use whichever response is available
     if transcript:
@@ -169,11 +172,13 @@ def contributor_perception_page():
         save_and_navigate('next')
 
     # Navigation
-    navigation_buttons(
-        on_back=handle_back,
-        on_next=handle_next,
-        back_key="perception_back",
-        next_key="perception_next",
-        validation_fn=validate,
-        validation_error="Please answer all questions before proceeding."
-    )
+    with form:
+        navigation_buttons(
+            on_back=handle_back,
+            on_next=handle_next,
+            back_key="perception_back",
+            next_key="perception_next",
+            validation_fn=validate,
+            validation_error="Please answer all questions before proceeding.",
+            in_form=True
+        )
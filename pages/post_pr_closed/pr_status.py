@@ -4,19 +4,16 @@ PR status page to capture whether the assigned PR is closed or merged.
 
 import streamlit as st
 from survey_components import page_header, selectbox_question, navigation_buttons
-from survey_utils import save_and_navigate
+from survey_utils import save_and_navigate, go_to_page, fragment, track_upload
 from survey_data import (
     get_repository_assignment,
-    list_assigned_prs_for_reviewer,
+    load_pr_status_view,
     update_contributor_repo_issues_status,
-    get_random_unassigned_pr,
-    assign_pr_to_reviewer,
-    get_participant_progress,
-    get_prs_with_incomplete_responses,
-    get_completed_pr_closed_surveys,
+    claim_next_unassigned_pr,
+    get_available_pr_count,
     MIN_COMPLETED_REVIEWS
 )
-from drive_upload import upload_to_drive_in_subfolders, sanitize_filename
+from drive_upload import submit_upload, get_base_folder_id, participant_subfolders
 
 
 STATUS_OPTIONS = [
@@ -26,6 +23,30 @@ STATUS_OPTIONS = [
 ]
 
 
+def _get_pr_status_view(participant_id, assigned_repo):
+    """Return the page's view model, loading it once per page visit and after each finished upload."""
+    if not participant_id or not assigned_repo:
+        return None
+    visit = st.session_state.get('_page_visit_id', 0)
+    uploads_finished = st.session_state.get('_uploads_finished', 0)
+    cached = st.session_state.get('_pr_status_view')
+    if (
+        cached and cached['visit'] == visit
+        and cached['uploads_finished'] == uploads_finished
+        and cached['view'].participant_id == participant_id
+        and cached['view'].repository == assigned_repo
+    ):
+        return cached['view']
+    view = load_pr_status_view(participant_id, assigned_repo)
+    st.session_state['_pr_status_view'] = {'visit': visit, 'uploads_finished': uploads_finished, 'view': view}
+    return view
+
+
+def _invalidate_pr_status_view():
+    """Drop the cached view model after a status update commits."""
+    st.session_state.pop('_pr_status_view', None)
+
+
 def pr_status_page():
     """Display the PR status page."""
     st.header("PR Review Status")
@@ -38,22 +59,6 @@ def pr_status_page():
         """, unsafe_allow_html=True)
 
     participant_id = st.session_state['survey_responses'].get('participant_id')
-    completed_count = None
-    remaining = None
-    if participant_id:
-        progress_result = get_participant_progress(participant_id)
-        if progress_result.get('success') and progress_result.get('progress'):
-            completed_count = progress_result['progress'].get('post_pr_review_count', 0)
-            remaining = max(MIN_COMPLETED_REVIEWS - completed_count, 0)
-    if completed_count is not None and remaining is not None:
-        if remaining > 0:
-            st.info(
-                f"You have reviewed {completed_count} PR(s) so far. Review {remaining} more to finish the study."
-            )
-        else:
-            st.success(
-                f"You've reviewed {completed_count} PR(s) — you've met the study minimum."
-            )
 
     # Load all PRs assigned to this reviewer; allow status update for any
     assigned_repo = st.session_state['survey_responses'].get('assigned_repository')
@@ -64,12 +69,22 @@ def pr_status_page():
             st.session_state['survey_responses']['assigned_repository'] = assigned_repo
             st.session_state['survey_responses']['repository_url'] = repo_result['url']
 
-    # Check for PRs with incomplete post-PR-review responses
-    incomplete_prs = []
-    if participant_id and assigned_repo:
-        incomplete_result = get_prs_with_incomplete_responses(participant_id, assigned_repo)
-        if incomplete_result['success']:
-            incomplete_prs = incomplete_result.get('incomplete_prs', [])
+    view = _get_pr_status_view(participant_id, assigned_repo)
+
+    completed_count = view.completed_count if view else None
+    if completed_count is not None:
+        remaining = max(MIN_COMPLETED_REVIEWS - completed_count, 0)
+        if remaining > 0:
+            st.info(
+                f"You have reviewed {completed_count} PR(s) so far. Review {remaining} more to finish the study."
+            )
+        else:
+            st.success(
+                f"You've reviewed {completed_count} PR(s) — you've met the study minimum."
+            )
+
+    # PRs with incomplete post-PR-review responses
+    incomplete_prs = view.incomplete_prs if view else []
     
     # If there are incomplete responses, show warning and redirect option
     if incomplete_prs:
@@ -112,99 +127,85 @@ def pr_status_page():
                     
                     # Determine which page to go to based on missing fields
                     if 'nasa_tlx' in missing:
-                        st.session_state['page'] = 5  # nasa_tlx_questions_page
+                        go_to_page(5)  # nasa_tlx_questions_page
                     elif 'code_quality' in missing:
-                        st.session_state['page'] = 6  # code_quality_ratings_page
+                        go_to_page(6)  # code_quality_ratings_page
                     elif 'ai_detection' in missing:
-                        st.session_state['page'] = 7  # ai_detection_page
+                        go_to_page(7)  # ai_detection_page
                     else:
-                        st.session_state['page'] = 5  # Default to NASA TLX
-                    
-                    st.rerun()
+                        go_to_page(5)  # Default to NASA TLX
         
         st.divider()
 
     pr_url = st.session_state['survey_responses'].get('pr_url')
     
-    pr_choices = []
-    if participant_id and assigned_repo:
-        assigned = list_assigned_prs_for_reviewer(participant_id, assigned_repo)
-        if assigned['success'] and assigned['prs']:
-            completed_pr_closed_urls = get_completed_pr_closed_surveys(participant_id)
-            for pr in assigned['prs']:
-                if not pr.get('is_reviewed'):
-                    continue
-                is_done = pr.get('is_closed') or pr.get('is_merged')
-                if not is_done:
-                    pr_choices.append(pr)
-                elif pr.get('url') not in completed_pr_closed_urls:
-                    pr_choices.append(pr)
+    pr_choices = view.pr_choices if view else []
 
     def request_another_pr(button_key: str):
         if participant_id and assigned_repo:
-            # Disable button if there are incomplete responses
+            # Disable button if there are incomplete responses; the availability count
+            # is only a hint, since the claim itself decides whether a PR is left
             button_disabled = len(incomplete_prs) > 0
+            availability = get_available_pr_count(assigned_repo)
+            if not button_disabled and availability['success'] and availability['count'] == 0:
+                st.caption(f"No unassigned PRs appear to be left in {assigned_repo} right now.")
             if st.button("Request another PR", key=button_key, use_container_width=True, disabled=button_disabled):
                 with st.spinner('Looking for another PR in this repository...'):
-                    pr_result = get_random_unassigned_pr(assigned_repo)
+                    pr_result = claim_next_unassigned_pr(participant_id, assigned_repo)
                     if pr_result['success'] and pr_result['pr']:
                         pr_data = pr_result['pr']
-                        assign_result = assign_pr_to_reviewer(participant_id, pr_data['issue_id'])
-                        if assign_result['success']:
-                            st.session_state['survey_responses']['assigned_pr'] = pr_data
-                            st.session_state['survey_responses']['pr_url'] = pr_data['url']
-                            st.session_state['survey_responses']['issue_url'] = pr_data['issue_url']
-                            st.session_state['survey_responses']['issue_id'] = pr_data['issue_id']
-                            st.session_state['survey_responses']['reviewer_estimate'] = 'Not selected'
-                            st.session_state['survey_responses']['new_contributor_estimate'] = 'Not selected'
-                            st.session_state['survey_responses']['pr_status'] = 'Still open - review in progress'
-                            artifact_map = st.session_state['survey_responses'].setdefault('artifact_upload_status', {})
-                            if pr_data.get('issue_id') is not None:
-                                artifact_map[str(pr_data['issue_id'])] = False
-                            st.session_state['survey_responses']['artifact_upload_complete'] = False
-                            
-                            # Clear post-PR-review responses from previous PR to prevent carryover
-                            # BUG FIX: Streamlit caches widget values by their `key` parameter.
-                            # The `value` param only sets the initial value on first render;
-                            # afterwards, the cached widget state takes precedence. This caused
-                            # responses from the first PR to appear pre-filled for all subsequent PRs.
-                            # 
-                            # Affected fields in reviewer-post-pr-review table:
-                            #   - nasa_tlx_* (all NASA TLX questions)
-                            #   - code_quality_* (all code quality questions)
-                            #   - ai_likelihood, ai_reasoning, ai_review_strategy
-                            st.session_state['survey_responses']['nasa_tlx_responses'] = {}
-                            st.session_state['survey_responses']['code_quality_responses'] = {}
-                            st.session_state['survey_responses']['ai_likelihood'] = None
-                            st.session_state['survey_responses']['ai_reasoning'] = ''
-                            st.session_state['survey_responses']['ai_review_strategy'] = ''
-                            st.session_state['survey_responses']['is_reviewed'] = None
-                            st.session_state['survey_responses']['artifacts_uploaded'] = False
-                            
-                            # CRITICAL: Clear all Streamlit widget keys for post-PR-review questions.
-                            # Without this, widgets ignore the `value` param and show cached values.
-                            widget_keys_to_clear = [
-                                # AI detection text areas
-                                'ai_review_strategy_text', 'ai_reasoning_text',
-                                # AI likelihood slider
-                                'ai_likelihood',
-                                # NASA TLX sliders
-                                'nasa_tlx_mental_demand', 'nasa_tlx_physical_demand', 'nasa_tlx_frustration',
-                                # Code quality sliders
-                                'code_quality_readability', 'code_quality_analyzability',
-                                'code_quality_modifiability', 'code_quality_testability',
-                                'code_quality_stability', 'code_quality_correctness',
-                                'code_quality_compliance',
-                            ]
-                            for widget_key in widget_keys_to_clear:
-                                if widget_key in st.session_state:
-                                    del st.session_state[widget_key]
-                            
-                            # Send the reviewer back to the estimate + assignment step for the new PR
-                            st.session_state['page'] = 3  # pr_assignment_page
-                            st.rerun()
-                        else:
-                            return f"Error assigning PR: {assign_result['error']}"
+                        _invalidate_pr_status_view()
+                        st.session_state['survey_responses']['assigned_pr'] = pr_data
+                        st.session_state['survey_responses']['pr_url'] = pr_data['url']
+                        st.session_state['survey_responses']['issue_url'] = pr_data['issue_url']
+                        st.session_state['survey_responses']['issue_id'] = pr_data['issue_id']
+                        st.session_state['survey_responses']['reviewer_estimate'] = 'Not selected'
+                        st.session_state['survey_responses']['new_contributor_estimate'] = 'Not selected'
+                        st.session_state['survey_responses']['pr_status'] = 'Still open - review in progress'
+                        artifact_map = st.session_state['survey_responses'].setdefault('artifact_upload_status', {})
+                        if pr_data.get('issue_id') is not None:
+                            artifact_map[str(pr_data['issue_id'])] = False
+                        st.session_state['survey_responses']['artifact_upload_complete'] = False
+                        
+                        # Clear post-PR-review responses from previous PR to prevent carryover
+                        # BUG FIX: Streamlit caches widget values by their `key` parameter.
+                        # The `value` param only sets the initial value on first render;
+                        # afterwards, the cached widget state takes precedence. This caused
+                        # responses from the first PR to appear pre-filled for all subsequent PRs.
+                        # 
+                        # Affected fields in reviewer-post-pr-review table:
+                        #   - nasa_tlx_* (all NASA TLX questions)
+                        #   - code_quality_* (all code quality questions)
+                        #   - ai_likelihood, ai_reasoning, ai_review_strategy
+                        st.session_state['survey_responses']['nasa_tlx_responses'] = {}
+                        st.session_state['survey_responses']['code_quality_responses'] = {}
+                        st.session_state['survey_responses']['ai_likelihood'] = None
+                        st.session_state['survey_responses']['ai_reasoning'] = ''
+                        st.session_state['survey_responses']['ai_review_strategy'] = ''
+                        st.session_state['survey_responses']['is_reviewed'] = None
+                        st.session_state['survey_responses']['artifacts_uploaded'] = False
+                        
+                        # CRITICAL: Clear all Streamlit widget keys for post-PR-review questions.
+                        # Without this, widgets ignore the `value` param and show cached values.
+                        widget_keys_to_clear = [
+                            # AI detection text areas
+                            'ai_review_strategy_text', 'ai_reasoning_text',
+                            # AI likelihood slider
+                            'ai_likelihood',
+                            # NASA TLX sliders
+                            'nasa_tlx_mental_demand', 'nasa_tlx_physical_demand', 'nasa_tlx_frustration',
+                            # Code quality sliders
+                            'code_quality_readability', 'code_quality_analyzability',
+                            'code_quality_modifiability', 'code_quality_testability',
+                            'code_quality_stability', 'code_quality_correctness',
+                            'code_quality_compliance',
+                        ]
+                        for widget_key in widget_keys_to_clear:
+                            if widget_key in st.session_state:
+                                del st.session_state[widget_key]
+                        
+                        # Send the reviewer back to the estimate + assignment step for the new PR
+                        go_to_page(3)  # pr_assignment_page
                     else:
                         return f"{pr_result.get('error') or 'No unassigned PRs available in this repo.'}"
         return None
@@ -271,6 +272,12 @@ def pr_status_page():
 
     st.markdown("<div style='margin: 1.5rem 0;'></div>", unsafe_allow_html=True)
 
+    _status_and_upload_section(participant_id)
+
+
+@fragment
+def _status_and_upload_section(participant_id):
+    """Status selector and artifact upload; reruns on its own as a fragment."""
     pr_status = selectbox_question(
         "What is the current status of this PR?",
         STATUS_OPTIONS,
@@ -322,28 +329,24 @@ def pr_status_page():
                     return
 
                 try:
-                    folder_id = (
-                        st.secrets.get('REVIEWER_GDRIVE_FOLDER_ID') or
-                        st.secrets.get('GDRIVE_FOLDER_ID')
-                    )
+                    folder_id = get_base_folder_id()
                     if not folder_id:
                         st.error("Drive folder not configured. Ask the study team to set REVIEWER_GDRIVE_FOLDER_ID in secrets.")
                         return
 
-                    with st.spinner('Uploading your file...'):
-                        participant_folder = sanitize_filename(participant_id) if participant_id else "unknown_participant"
-                        current_issue_id = st.session_state['survey_responses'].get('issue_id')
-                        issue_folder = sanitize_filename(f"pr_{current_issue_id}") if current_issue_id else "unknown_pr"
-                        review_status = "final_review"
-                        subfolders = [participant_folder, issue_folder, review_status]
-
-                        upload_to_drive_in_subfolders(
-                            screenrec_upload,
-                            folder_id,
-                            subfolders=subfolders,
-                            filename=screenrec_upload.name,
-                        )
-                    st.success("Upload completed successfully!")
+                    current_issue_id = st.session_state['survey_responses'].get('issue_id')
+                    subfolders = participant_subfolders(participant_id, current_issue_id, "final_review")
+
+                    # The transfer runs in the background; its progress is shown on the following pages
+                    job_id = submit_upload(
+                        screenrec_upload,
+                        folder_id,
+                        subfolders=subfolders,
+                        filename=screenrec_upload.name,
+                        resume_key=(participant_id, current_issue_id, "final_review"),
+                    )
+                    # The artifact step stays pending until the upload is done
+                    track_upload(job_id, "final_review", current_issue_id)
                 except Exception as e:
                     st.error(f"Upload failed: {e}")
                     return
@@ -357,12 +360,15 @@ def pr_status_page():
                 result = update_contributor_repo_issues_status(issue_id, is_closed, is_merged, True)
                 if not result['success']:
                     st.warning(f"Error updating PR status: {result['error']}")
+                else:
+                    _invalidate_pr_status_view()
             
-            # Mark artifact step complete for this PR (upload was optional)
-            artifact_map = st.session_state['survey_responses'].setdefault('artifact_upload_status', {})
-            if issue_id is not None:
-                artifact_map[str(issue_id)] = True
-            st.session_state['survey_responses']['artifact_upload_complete'] = True
+            # Without a file the artifact step is complete now (upload was optional)
+            if not screenrec_upload:
+                artifact_map = st.session_state['survey_responses'].setdefault('artifact_upload_status', {})
+                if issue_id is not None:
+                    artifact_map[str(issue_id)] = True
+                st.session_state['survey_responses']['artifact_upload_complete'] = True
 
             # Navigate to next page
             save_and_navigate('next', pr_status=pr_status)
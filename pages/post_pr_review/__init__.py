@@ -1,15 +1,19 @@
 """
 Post-PR-Review pages for the reviewer survey.
+
+Page modules are imported on first attribute access (PEP 562).
 """
 
-from .nasa_tlx_questions import nasa_tlx_questions_page
-from .code_quality_ratings import code_quality_ratings_page
-from .ai_detection import ai_detection_page
-from .review_submission import review_submission_page
-
-__all__ = [
-    'nasa_tlx_questions_page',
-    'code_quality_ratings_page',
-    'ai_detection_page',
-    'review_submission_page'
-]
+from .._lazy import lazy_exports
+
+
+_PAGE_MODULES = {
+    'nasa_tlx_questions_page': '.nasa_tlx_questions',
+    'code_quality_ratings_page': '.code_quality_ratings',
+    'ai_detection_page': '.ai_detection',
+    'review_submission_page': '.review_submission',
+}
+
+__all__ = list(_PAGE_MODULES)
+
+__getattr__ = lazy_exports(__name__, _PAGE_MODULES)
@@ -4,9 +4,17 @@ AI detection questions page for the reviewer survey.
 
 import streamlit as st
 from survey_components import page_header, slider_question, navigation_buttons
-from survey_utils import save_and_navigate, display_pr_context, record_audio
+from survey_utils import (
+    save_and_navigate,
+    go_to_page,
+    display_pr_context,
+    record_audio,
+    get_section_completion,
+    record_section_completion,
+    get_post_pr_review_draft,
+)
 from survey_questions import AI_DETECTION_QUESTIONS
-from survey_data import save_post_pr_review_responses, get_repository_assignment, get_assigned_pr_for_reviewer
+from survey_data import save_post_pr_review_draft, get_repository_assignment, get_assigned_pr_for_reviewer
 
 # AI detection slider options (1-5 with labels)
 AI_DETECTION_OPTIONS = [
@@ -26,11 +34,9 @@ def ai_detection_page():
     pr_url = st.session_state['survey_responses'].get('pr_url')
 
     if participant_id and pr_url:
-        from survey_data import check_ai_detection_completed
-        if check_ai_detection_completed(participant_id, pr_url):
+        if get_section_completion(participant_id, pr_url)['ai_detection']:
             print(f"[AI DETECTION] Already completed for {pr_url}, skipping to next page")
-            st.session_state['page'] = st.session_state.get('page', 7) + 1
-            st.rerun()
+            go_to_page(st.session_state.get('page', 7) + 1)
             return
 
     page_header(
@@ -178,14 +184,18 @@ def ai_detection_page():
 
         if participant_id:
             with st.spinner('Saving your responses...'):
-                result = save_post_pr_review_responses(
-                    participant_id,
-                    pr_url,
-                    st.session_state['survey_responses']
+                draft = get_post_pr_review_draft(participant_id, pr_url)
+                draft.update(
+                    ai_likelihood=ai_likelihood,
+                    ai_reasoning=ai_reasoning,
+                    ai_review_strategy=ai_review_strategy,
                 )
+                # Last post-PR-review page: finalize the record
+                result = save_post_pr_review_draft(draft, finalize=True)
             if not result.get('success'):
                 st.error(f"⚠️ Error saving responses: {result.get('error')}")
                 return
+            record_section_completion(pr_url, 'ai_detection')
 
         save_and_navigate('next')
 
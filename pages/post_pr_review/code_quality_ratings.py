@@ -4,9 +4,16 @@ Code quality ratings page for the reviewer survey.
 
 import streamlit as st
 from survey_components import page_header, slider_question, navigation_buttons
-from survey_utils import save_and_navigate, display_pr_context
+from survey_utils import (
+    save_and_navigate,
+    go_to_page,
+    display_pr_context,
+    get_section_completion,
+    record_section_completion,
+    get_post_pr_review_draft,
+)
 from survey_questions import CODE_QUALITY_QUESTIONS
-from survey_data import save_post_pr_review_responses, get_repository_assignment, get_assigned_pr_for_reviewer
+from survey_data import save_post_pr_review_draft, get_repository_assignment, get_assigned_pr_for_reviewer
 
 # Code quality slider options (1-5 with labels)
 CODE_QUALITY_OPTIONS = ["Not selected", "1 - Strongly disagree", "2", "3", "4", "5 - Strongly agree"]
@@ -19,11 +26,9 @@ def code_quality_ratings_page():
     pr_url = st.session_state['survey_responses'].get('pr_url')
 
     if participant_id and pr_url:
-        from survey_data import check_code_quality_completed
-        if check_code_quality_completed(participant_id, pr_url):
+        if get_section_completion(participant_id, pr_url)['code_quality']:
             print(f"[CODE QUALITY] Already completed for {pr_url}, skipping to next page")
-            st.session_state['page'] = st.session_state.get('page', 6) + 1
-            st.rerun()
+            go_to_page(st.session_state.get('page', 6) + 1)
             return
 
     page_header(
@@ -56,19 +61,22 @@ def code_quality_ratings_page():
     # Load previous responses
     previous_responses = st.session_state['survey_responses'].get('code_quality_responses', {})
     
-    # Code quality questions
-    responses = {}
-    for key, question in CODE_QUALITY_QUESTIONS.items():
-        previous_value = previous_responses.get(key, "Not selected")
+    # Batch answers in a form so slider moves don't rerun the page until a button is pressed
+    form = st.form("code_quality_form", border=False)
+    with form:
+        # Code quality questions
+        responses = {}
+        for key, question in CODE_QUALITY_QUESTIONS.items():
+            previous_value = previous_responses.get(key, "Not selected")
         
-        response = slider_question(
-            question,
-            CODE_QUALITY_OPTIONS,
-            f"code_quality_{key}",
-            previous_value
-        )
+            response = slider_question(
+                question,
+                CODE_QUALITY_OPTIONS,
+                f"code_quality_{key}",
+                previous_value
+            )
         
-        responses[key] = response
+            responses[key] = response
     
     # Validation function
     def validate():
@@ -87,23 +95,24 @@ def code_quality_ratings_page():
         
         if participant_id:
             with st.spinner('Saving your responses...'):
-                result = save_post_pr_review_responses(
-                    participant_id,
-                    pr_url,
-                    st.session_state['survey_responses']
-                )
+                draft = get_post_pr_review_draft(participant_id, pr_url)
+                draft.update_section('code_quality', responses)
+                result = save_post_pr_review_draft(draft)
             if not result.get('success'):
                 st.error(f"⚠️ Error saving responses: {result.get('error')}")
                 return
+            record_section_completion(pr_url, 'code_quality')
         
         save_and_navigate('next', code_quality_responses=responses)
     
     # Navigation
-    navigation_buttons(
-        on_back=lambda: save_and_navigate('back', code_quality_responses=responses),
-        on_next=handle_next,
-        back_key="code_quality_back",
-        next_key="code_quality_next",
-        validation_fn=validate,
-        validation_error="Please answer all questions before proceeding."
-    )
+    with form:
+        navigation_buttons(
+            on_back=lambda: save_and_navigate('back', code_quality_responses=responses),
+            on_next=handle_next,
+            back_key="code_quality_back",
+            next_key="code_quality_next",
+            validation_fn=validate,
+            validation_error="Please answer all questions before proceeding.",
+            in_form=True
+        )
@@ -4,9 +4,16 @@ NASA-TLX questions page for the reviewer survey.
 
 import streamlit as st
 from survey_components import page_header, slider_question, navigation_buttons
-from survey_utils import save_and_navigate, display_pr_context
+from survey_utils import (
+    save_and_navigate,
+    go_to_page,
+    display_pr_context,
+    get_section_completion,
+    record_section_completion,
+    get_post_pr_review_draft,
+)
 from survey_questions import NASA_TLX_QUESTIONS
-from survey_data import save_post_pr_review_responses, get_repository_assignment, get_assigned_pr_for_reviewer
+from survey_data import save_post_pr_review_draft, get_repository_assignment, get_assigned_pr_for_reviewer
 
 # NASA-TLX slider options (1-7 with labels)
 NASA_TLX_OPTIONS = ["Not selected", "1 - Very low", "2", "3", "4", "5", "6", "7 - Very high"]
@@ -19,11 +26,9 @@ def nasa_tlx_questions_page():
     pr_url = st.session_state['survey_responses'].get('pr_url')
 
     if participant_id and pr_url:
-        from survey_data import check_nasa_tlx_completed
-        if check_nasa_tlx_completed(participant_id, pr_url):
+        if get_section_completion(participant_id, pr_url)['nasa_tlx']:
             print(f"[NASA TLX] Already completed for {pr_url}, skipping to next page")
-            st.session_state['page'] = st.session_state.get('page', 5) + 1
-            st.rerun()
+            go_to_page(st.session_state.get('page', 5) + 1)
             return
 
     page_header(
@@ -62,19 +67,22 @@ def nasa_tlx_questions_page():
     # Load previous responses
     previous_responses = st.session_state['survey_responses'].get('nasa_tlx_responses', {})
     
-    # NASA-TLX questions
-    responses = {}
-    for key, question in NASA_TLX_QUESTIONS.items():
-        previous_value = previous_responses.get(key, "Not selected")
+    # Batch answers in a form so slider moves don't rerun the page until a button is pressed
+    form = st.form("nasa_tlx_form", border=False)
+    with form:
+        # NASA-TLX questions
+        responses = {}
+        for key, question in NASA_TLX_QUESTIONS.items():
+            previous_value = previous_responses.get(key, "Not selected")
         
-        response = slider_question(
-            question,
-            NASA_TLX_OPTIONS,
-            f"nasa_tlx_{key}",
-            previous_value
-        )
+            response = slider_question(
+                question,
+                NASA_TLX_OPTIONS,
+                f"nasa_tlx_{key}",
+                previous_value
+            )
         
-        responses[key] = response
+            responses[key] = response
     
     # Validation function
     def validate():
@@ -97,23 +105,24 @@ def nasa_tlx_questions_page():
         
         if participant_id:
             with st.spinner('Saving your responses...'):
-                result = save_post_pr_review_responses(
-                    participant_id,
-                    pr_url,
-                    st.session_state['survey_responses']
-                )
+                draft = get_post_pr_review_draft(participant_id, pr_url)
+                draft.update_section('nasa_tlx', responses)
+                result = save_post_pr_review_draft(draft)
             if not result.get('success'):
                 st.error(f"⚠️ Error saving responses: {result.get('error')}")
                 return
+            record_section_completion(pr_url, 'nasa_tlx')
         
         save_and_navigate('next', nasa_tlx_responses=responses)
     
     # Navigation
-    navigation_buttons(
-        on_back=handle_back,
-        on_next=handle_next,
-        back_key="nasa_tlx_back",
-        next_key="nasa_tlx_next",
-        validation_fn=validate,
-        validation_error="Please answer all questions before proceeding."
-    )
+    with form:
+        navigation_buttons(
+            on_back=handle_back,
+            on_next=handle_next,
+            back_key="nasa_tlx_back",
+            next_key="nasa_tlx_next",
+            validation_fn=validate,
+            validation_error="Please answer all questions before proceeding.",
+            in_form=True
+        )
@@ -6,9 +6,9 @@ then routes to the post-PR-review question pages.
 
 import streamlit as st
 from survey_components import page_header, selectbox_question, navigation_buttons
-from survey_utils import save_and_navigate, display_pr_context
-from survey_data import get_repository_assignment, get_assigned_pr_for_reviewer, save_session_state, update_is_reviewed_for_issue
-from drive_upload import upload_to_drive_in_subfolders, sanitize_filename
+from survey_utils import save_and_navigate, go_to_page, display_pr_context, fragment, track_upload
+from survey_data import get_repository_assignment, get_assigned_pr_for_reviewer, queue_session_checkpoint, update_is_reviewed_for_issue
+from drive_upload import submit_upload, get_base_folder_id, participant_subfolders
 
 
 def review_submission_page():
@@ -64,6 +64,12 @@ def review_submission_page():
 
     # st.markdown("<div style='margin-bottom: 1.5rem;'></div>", unsafe_allow_html=True)
 
+    _review_completion_section(participant_id, issue_id)
+
+
+@fragment
+def _review_completion_section(participant_id, issue_id):
+    """Completion buttons and artifact upload; reruns on its own as a fragment."""
     # Store completion choice in session state to show/hide upload section
     if 'review_completion_choice' not in st.session_state:
         st.session_state['review_completion_choice'] = None
@@ -112,34 +118,31 @@ def review_submission_page():
                     return
 
                 try:
-                    folder_id = (
-                        st.secrets.get('REVIEWER_GDRIVE_FOLDER_ID') or
-                        st.secrets.get('GDRIVE_FOLDER_ID')
-                    )
+                    folder_id = get_base_folder_id()
                     if not folder_id:
                         st.error("Drive folder not configured. Ask the study team to set REVIEWER_GDRIVE_FOLDER_ID in secrets.")
                         return
 
-                    with st.spinner('Uploading your file...'):
-                        participant_folder = sanitize_filename(participant_id) if participant_id else "unknown_participant"
-                        issue_folder = sanitize_filename(f"pr_{issue_id}") if issue_id else "unknown_pr"
-                        review_status = "initial_review"
-                        subfolders = [participant_folder, issue_folder, review_status]
-
-                        upload_to_drive_in_subfolders(
-                            screenrec_upload,
-                            folder_id,
-                            subfolders=subfolders,
-                            filename=screenrec_upload.name,
-                        )
-                    st.success("Upload completed successfully!")
+                    subfolders = participant_subfolders(participant_id, issue_id, "initial_review")
+
+                    # The transfer runs in the background; its progress is shown on the following pages
+                    job_id = submit_upload(
+                        screenrec_upload,
+                        folder_id,
+                        subfolders=subfolders,
+                        filename=screenrec_upload.name,
+                        resume_key=(participant_id, issue_id, "initial_review"),
+                    )
+                    # The artifact step stays pending until the upload is done
+                    track_upload(job_id, "initial_review", issue_id)
                 except Exception as e:
                     st.error(f"Upload failed: {e}")
                     return
 
             # Save response
             st.session_state['survey_responses']['is_reviewed'] = "Yes - I've submitted my review"
-            st.session_state['survey_responses']['artifacts_uploaded'] = bool(screenrec_upload)
+            if not screenrec_upload:
+                st.session_state['survey_responses']['artifacts_uploaded'] = False
 
             # Update is_reviewed flag in database
             print(f"[DEBUG] Updating is_reviewed for issue_id={issue_id}")
@@ -155,10 +158,9 @@ def review_submission_page():
             # Navigate to next page
             next_index = 5  # pr_status_page index
             if participant_id:
-                save_session_state(participant_id, next_index, st.session_state['survey_responses'])
-            st.session_state['page'] = next_index
+                queue_session_checkpoint(participant_id, next_index, st.session_state['survey_responses'])
             st.session_state['review_completion_choice'] = None  # Reset for next time
-            st.rerun()
+            go_to_page(next_index)
 
     # If user selected "not completed", show helpful message
     if st.session_state.get('review_completion_choice') == 'not_completed':
@@ -1,13 +1,18 @@
 """
 Pre-study pages for the reviewer survey.
+
+Page modules are imported on first attribute access (PEP 562).
 """
 
-from .participant_id import participant_id_page
-from .setup_checklist import setup_checklist_page
-from .pr_assignment import pr_assignment_page
+from .._lazy import lazy_exports
+
+
+_PAGE_MODULES = {
+    'participant_id_page': '.participant_id',
+    'setup_checklist_page': '.setup_checklist',
+    'pr_assignment_page': '.pr_assignment',
+}
+
+__all__ = list(_PAGE_MODULES)
 
-__all__ = [
-    'participant_id_page',
-    'setup_checklist_page',
-    'pr_assignment_page'
-]
+__getattr__ = lazy_exports(__name__, _PAGE_MODULES)
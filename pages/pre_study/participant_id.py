@@ -4,7 +4,14 @@ Participant ID page for the reviewer survey.
 
 import streamlit as st
 from survey_components import page_header, text_input_question
-from survey_data import validate_participant_id, get_participant_progress, get_repository_assignment
+from survey_utils import go_to_page
+from survey_data import (
+    validate_participant_id,
+    get_participant_progress,
+    get_repository_assignment,
+    load_session_state,
+    resolve_resumed_page,
+)
 
 
 def participant_id_page():
@@ -42,6 +49,20 @@ def participant_id_page():
                 # ID is valid, save it
                 st.session_state['survey_responses']['participant_id'] = participant_id
 
+                # Resume a saved session (page + responses) with a single read
+                with st.spinner('Loading your progress...'):
+                    session_result = load_session_state(participant_id)
+                saved_responses = session_result.get('survey_responses') or {}
+                # A resumable session holds answers beyond the participant ID itself
+                has_saved_answers = bool(set(saved_responses) - {'participant_id'})
+                if session_result['success'] and session_result['current_page'] > 0 and has_saved_answers:
+                    st.session_state['survey_responses'].update(saved_responses)
+                    # The saved page is where they left off, unless its section was already saved
+                    st.session_state['smart_routing_complete'] = True
+                    go_to_page(resolve_resumed_page(
+                        participant_id, session_result['current_page'], st.session_state['survey_responses']
+                    ))
+
                 # Get repository assignment
                 with st.spinner('Loading your assignment...'):
                     repo_result = get_repository_assignment(participant_id)
@@ -65,16 +86,13 @@ def participant_id_page():
                     if has_started_reviews:
                         # They've started, route to PR status page
                         st.info("Welcome back! You've already started reviewing.")
-                        st.session_state['page'] = 8  # pr_status_page
-                        st.rerun()
+                        go_to_page(8)  # pr_status_page
                     else:
                         # New reviewer, proceed to next page
-                        st.session_state['page'] = 2  # setup_checklist_page
-                        st.rerun()
+                        go_to_page(2)  # setup_checklist_page
                 else:
                     # Couldn't check progress, just proceed normally
-                    st.session_state['page'] = 2  # setup_checklist_page
-                    st.rerun()
+                    go_to_page(2)  # setup_checklist_page
             else:
                 # ID is not valid, show error
                 st.error(f"{validation_result['error']}")
@@ -6,12 +6,12 @@ import streamlit as st
 from survey_components import page_header, navigation_buttons, selectbox_question
 from survey_utils import save_and_navigate
 from survey_data import (
-    get_random_unassigned_pr,
-    assign_pr_to_reviewer,
+    claim_next_unassigned_pr,
     save_reviewer_estimate_for_issue,
     get_repository_assignment,
     get_assigned_pr_for_reviewer,
 )
+from drive_upload import get_base_folder_id, schedule_folder_provisioning
 
 
 def _sync_artifact_status(issue_id, status=None):
@@ -117,30 +117,23 @@ def pr_assignment_page():
     # Automatically assign a PR if not already assigned
     if not current_pr and participant_id and assigned_repo != 'N/A':
         with st.spinner('Finding an available PR for you to review...'):
-            # Get a random unassigned PR
-            pr_result = get_random_unassigned_pr(assigned_repo)
+            # Atomically pick and assign a random unassigned PR
+            pr_result = claim_next_unassigned_pr(participant_id, assigned_repo)
             
             if pr_result['success']:
                 pr_data = pr_result['pr']
                 
-                # Assign the PR to the reviewer
-                assign_result = assign_pr_to_reviewer(participant_id, pr_data['issue_id'])
+                # Store PR info in session state
+                st.session_state['survey_responses']['assigned_pr'] = pr_data
+                st.session_state['survey_responses']['pr_url'] = pr_data['url']
+                st.session_state['survey_responses']['issue_id'] = pr_data['issue_id']
+                st.session_state['survey_responses']['issue_url'] = pr_data['issue_url']
                 
-                if assign_result['success']:
-                    # Store PR info in session state
-                    st.session_state['survey_responses']['assigned_pr'] = pr_data
-                    st.session_state['survey_responses']['pr_url'] = pr_data['url']
-                    st.session_state['survey_responses']['issue_id'] = pr_data['issue_id']
-                    st.session_state['survey_responses']['issue_url'] = pr_data['issue_url']
-                    
-                    _sync_artifact_status(pr_data.get('issue_id'), status=False)
+                _sync_artifact_status(pr_data.get('issue_id'), status=False)
 
-                    current_pr = pr_data
-                    st.success(f"✅ Successfully assigned PR #{pr_data['number']}")
-                    st.rerun()
-                else:
-                    st.warning(f"⚠️ Error assigning PR: {assign_result['error']}")
-                    no_pr_available = True
+                current_pr = pr_data
+                st.success(f"✅ Successfully assigned PR #{pr_data['number']}")
+                st.rerun()
             else:
                 st.warning(f"⚠️ {pr_result['error']}")
                 no_pr_available = True
@@ -156,6 +149,8 @@ def pr_assignment_page():
 
     # Display PR assignment
     if current_pr:
+        # Create this PR's Drive folders now so artifact uploads skip folder lookups
+        schedule_folder_provisioning(get_base_folder_id(), participant_id, [current_pr.get('issue_id')])
         st.info(f"""
         **Issue URL:** {current_pr.get('issue_url', 'N/A')}\n
         **PR URL:** {current_pr.get('url', 'N/A')}
@@ -237,11 +232,6 @@ def pr_assignment_page():
     
     # Custom navigation handlers
     def handle_back():
-        # Save session state before going back
-        participant_id = st.session_state['survey_responses'].get('participant_id')
-        if participant_id:
-            from survey_data import save_session_state
-            save_session_state(participant_id, st.session_state.get('page', 0), st.session_state['survey_responses'])
         save_and_navigate('back')
     
     def handle_next():
@@ -254,12 +244,6 @@ def pr_assignment_page():
             saved_reviewer_estimate = st.session_state['survey_responses'].get('reviewer_estimate')
             saved_new_contributor_estimate = st.session_state['survey_responses'].get('new_contributor_estimate')
 
-            # Save session state
-            participant_id = st.session_state['survey_responses'].get('participant_id')
-            if participant_id:
-                from survey_data import save_session_state
-                save_session_state(participant_id, st.session_state.get('page', 0), st.session_state['survey_responses'])
-
             save_and_navigate(
                 'next',
                 reviewer_estimate=saved_reviewer_estimate,
@@ -281,12 +265,6 @@ def pr_assignment_page():
                     st.error(f"⚠️ Error saving estimate: {result.get('error')}")
                     return
 
-            # Save session state
-            participant_id = st.session_state['survey_responses'].get('participant_id')
-            if participant_id:
-                from survey_data import save_session_state
-                save_session_state(participant_id, st.session_state.get('page', 0), st.session_state['survey_responses'])
-
             save_and_navigate(
                 'next',
                 reviewer_estimate=reviewer_estimate,
@@ -0,0 +1,89 @@
+"""
+Page routing for returning participants.
+
+Routing is a pure function of a RoutingState: no database access, no Streamlit.
+survey_data builds the state from a ParticipantSnapshot and the session responses,
+and the ordered ROUTING_RULES table below decides the page.
+
+Page mapping:
+    0: participant_id_page - Participant ID entry
+    2: setup_checklist_page - Reviewer setup checklist
+    3: pr_assignment_page - PR assignment and time estimates
+    4: review_submission_page - Confirm first review submitted
+    5: nasa_tlx_questions_page - NASA-TLX workload questions
+    6: code_quality_ratings_page - Code quality ratings
+    7: ai_detection_page - AI detection questions
+    8: pr_status_page - PR status check (can request another PR)
+    9: collaboration_questions_page - Collaboration questions (if PR closed/merged)
+    10: contributor_perception_page - Contributor perception questions
+    11: study_validation_page - Study validation
+    12: completion_page - Survey completion
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RoutingState:
+    """Flags routing depends on; defaults describe a participant with nothing done."""
+    has_repository: bool = False
+    setup_complete: bool = False
+    has_started_reviews: bool = False
+    has_assigned_pr: bool = False
+    has_estimates: bool = False
+    is_reviewed: bool = False
+    is_closed_or_merged: bool = False
+    progress_loaded: bool = False
+    nasa_tlx_complete: bool = False
+    code_quality_complete: bool = False
+    ai_detection_complete: bool = False
+    review_quota_met: bool = False
+    all_reviewed_prs_closed: bool = False
+    has_post_pr_closed: bool = False
+    artifact_complete: bool = False
+    end_study_completed: bool = False
+
+
+# (name, predicate, page): the first rule whose predicate holds decides the page.
+ROUTING_RULES = (
+    ('no-repository', lambda s: not s.has_repository, 0),
+    # Returning reviewers who already finished a review skip the checklist
+    ('setup-checklist', lambda s: not s.setup_complete and not s.has_started_reviews, 2),
+    ('pr-assignment', lambda s: not s.has_assigned_pr or not s.has_estimates, 3),
+    ('review-submission', lambda s: not s.is_reviewed, 4),
+    ('progress-unavailable', lambda s: not s.progress_loaded, 5),
+    ('nasa-tlx', lambda s: not s.nasa_tlx_complete, 5),
+    ('code-quality', lambda s: not s.code_quality_complete, 6),
+    ('ai-detection', lambda s: not s.ai_detection_complete, 7),
+    # Review quota met: wrap up open PRs, artifacts and study validation
+    ('quota-open-prs', lambda s: s.review_quota_met and not s.all_reviewed_prs_closed, 8),
+    ('quota-artifacts', lambda s: s.review_quota_met and not s.artifact_complete, 11),
+    ('quota-validation', lambda s: s.review_quota_met and not s.end_study_completed, 11),
+    ('completed', lambda s: s.review_quota_met, 12),
+    # Below quota: finish the current PR, then request another one
+    ('pr-open', lambda s: not s.is_closed_or_merged, 8),
+    ('collaboration', lambda s: not s.has_post_pr_closed, 9),
+    ('artifacts', lambda s: not s.artifact_complete, 11),
+)
+DEFAULT_RULE = ('request-another-pr', 8)
+
+
+def resolve_route(state: RoutingState):
+    """
+    Return the (rule name, page) that applies to a routing state.
+
+    Args:
+        state: RoutingState for the participant
+
+    Returns:
+        tuple of (rule name, page number)
+    """
+    for name, predicate, page in ROUTING_RULES:
+        if predicate(state):
+            return name, page
+    return DEFAULT_RULE
+
+
+def route(state: RoutingState) -> int:
+    """Return the page number for a routing state."""
+    return resolve_route(state)[1]
@@ -0,0 +1,37 @@
+-- Atomic PR claim for reviewers (contributor project).
+--
+-- survey_data.claim_next_unassigned_pr calls this through PostgREST RPC. The
+-- candidate row is locked with FOR UPDATE SKIP LOCKED and marked assigned in the
+-- same statement, so concurrent requests for the same repository each get a
+-- different issue (or none) instead of racing on a read-then-update.
+
+create or replace function claim_next_pr(p_repository text, p_reviewer_id text)
+returns setof "repo-issues"
+language plpgsql
+as $$
+begin
+    return query
+    update "repo-issues" ri
+    set reviewer_assigned = true,
+        reviewer_id = p_reviewer_id,
+        reviewer_assigned_on = now(),
+        is_closed = false,
+        is_merged = false,
+        is_reviewed = false
+    where ri.issue_id = (
+        select c.issue_id
+        from "repo-issues" c
+        where c.repository = p_repository
+          and c.is_completed
+          and coalesce(btrim(c.pr_url), '') <> ''
+          and not coalesce(c.reviewer_assigned, false)
+        order by random()
+        limit 1
+        for update skip locked
+    )
+      and not coalesce(ri.reviewer_assigned, false)
+    returning ri.*;
+end;
+$$;
+
+grant execute on function claim_next_pr(text, text) to anon, authenticated;
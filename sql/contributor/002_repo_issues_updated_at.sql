@@ -0,0 +1,29 @@
+-- Change watermark for repo-issues (contributor project).
+--
+-- survey_data keeps a process-wide index of unassigned PRs per repository and
+-- refreshes it by fetching only rows with updated_at at or past the newest value
+-- it saw, minus a safety margin, with a periodic full reload. The trigger bumps
+-- updated_at on every update, including claim_next_pr. now() is the transaction
+-- start time, so a row can commit with an updated_at behind the watermark; the
+-- margin and the full reload cover that.
+
+alter table "repo-issues"
+    add column if not exists updated_at timestamptz not null default now();
+
+create or replace function repo_issues_touch_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at = now();
+    return new;
+end;
+$$;
+
+drop trigger if exists repo_issues_touch_updated_at on "repo-issues";
+create trigger repo_issues_touch_updated_at
+    before update on "repo-issues"
+    for each row execute function repo_issues_touch_updated_at();
+
+create index if not exists repo_issues_repository_updated_at_idx
+    on "repo-issues" (repository, updated_at);
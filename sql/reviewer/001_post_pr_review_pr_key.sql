@@ -0,0 +1,12 @@
+-- Stored, normalized PR key for reviewer-post-pr-review.
+--
+-- Mirrors survey_data.normalize_pr_url (trim whitespace, drop trailing slashes, lowercase)
+-- so completion checks can filter on (participant_id, pr_key) server-side
+-- instead of downloading every row and comparing URLs in Python.
+
+alter table "reviewer-post-pr-review"
+    add column if not exists pr_key text
+    generated always as (lower(rtrim(btrim(pr_url, E' \t\r\n'), '/'))) stored;
+
+create index if not exists reviewer_post_pr_review_participant_pr_key_idx
+    on "reviewer-post-pr-review" (participant_id, pr_key);
@@ -0,0 +1,57 @@
+-- Unique keys for the reviewer response tables so saves can be single upserts.
+--
+-- survey_data writes each table with ON CONFLICT on these keys; without them a
+-- double-click could insert duplicate rows and inflate the progress counts.
+-- Existing duplicates are collapsed to the most recently updated row first.
+--
+-- The PR response tables are keyed on the normalized pr_key (see 001), so URLs
+-- that differ only by case, surrounding whitespace or a trailing slash share one row.
+
+-- reviewer-post-pr-review: one row per (participant_id, pr_key)
+delete from "reviewer-post-pr-review" a
+using "reviewer-post-pr-review" b
+where a.participant_id = b.participant_id
+  and a.pr_key = b.pr_key
+  and (coalesce(a.updated_at, '-infinity'), a.ctid) < (coalesce(b.updated_at, '-infinity'), b.ctid);
+
+alter table "reviewer-post-pr-review"
+    alter column created_at set default now(),
+    alter column updated_at set default now(),
+    add constraint reviewer_post_pr_review_participant_pr_key_key unique (participant_id, pr_key);
+
+-- reviewer-post-pr-closed: same normalized pr_key as reviewer-post-pr-review
+alter table "reviewer-post-pr-closed"
+    add column if not exists pr_key text
+    generated always as (lower(rtrim(btrim(pr_url, E' \t\r\n'), '/'))) stored;
+
+-- reviewer-post-pr-closed: one row per (participant_id, pr_key)
+delete from "reviewer-post-pr-closed" a
+using "reviewer-post-pr-closed" b
+where a.participant_id = b.participant_id
+  and a.pr_key = b.pr_key
+  and (coalesce(a.updated_at, '-infinity'), a.ctid) < (coalesce(b.updated_at, '-infinity'), b.ctid);
+
+alter table "reviewer-post-pr-closed"
+    alter column created_at set default now(),
+    alter column updated_at set default now(),
+    add constraint reviewer_post_pr_closed_participant_pr_key_key unique (participant_id, pr_key);
+
+-- reviewer-end-study: one row per participant
+delete from "reviewer-end-study" a
+using "reviewer-end-study" b
+where a.participant_id = b.participant_id
+  and a.ctid < b.ctid;
+
+alter table "reviewer-end-study"
+    add constraint reviewer_end_study_participant_key unique (participant_id);
+
+-- reviewer-sessions: one row per participant
+delete from "reviewer-sessions" a
+using "reviewer-sessions" b
+where a.participant_id = b.participant_id
+  and (coalesce(a.updated_at, '-infinity'), a.ctid) < (coalesce(b.updated_at, '-infinity'), b.ctid);
+
+alter table "reviewer-sessions"
+    alter column started_at set default now(),
+    alter column created_at set default now(),
+    add constraint reviewer_sessions_participant_key unique (participant_id);
@@ -0,0 +1,8 @@
+-- Store the full survey_responses dict with each reviewer session.
+--
+-- save_session_state writes a JSON-safe copy (including assigned_pr and
+-- artifact_upload_status) and load_session_state restores it, so a returning
+-- reviewer resumes on their saved page from one read.
+
+alter table "reviewer-sessions"
+    add column if not exists survey_responses jsonb not null default '{}'::jsonb;
@@ -0,0 +1,23 @@
+-- Mark when a reviewer finished the post-PR-review questions for a PR.
+--
+-- Each question page upserts only the columns it changed; the AI detection
+-- submit, the last page of the section, also stamps completed_at. Going back
+-- and resubmitting sends completed_at again, so the trigger keeps the first one.
+
+alter table "reviewer-post-pr-review"
+    add column if not exists completed_at timestamptz;
+
+create or replace function reviewer_post_pr_review_keep_completed_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.completed_at = coalesce(old.completed_at, new.completed_at);
+    return new;
+end;
+$$;
+
+drop trigger if exists reviewer_post_pr_review_keep_completed_at on "reviewer-post-pr-review";
+create trigger reviewer_post_pr_review_keep_completed_at
+    before update on "reviewer-post-pr-review"
+    for each row execute function reviewer_post_pr_review_keep_completed_at();
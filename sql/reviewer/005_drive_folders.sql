@@ -0,0 +1,14 @@
+-- Cache of Google Drive folder IDs, keyed by (parent folder ID, folder name).
+--
+-- drive_upload resolves each upload's [participant, pr_<id>, stage] path from
+-- this table instead of searching Drive at every level. The unique key decides
+-- the winner when two app processes create the same folder at the same time;
+-- the loser deletes its copy and uses the registered ID.
+
+create table if not exists "reviewer-drive-folders" (
+    parent_id text not null,
+    name text not null,
+    folder_id text not null,
+    created_at timestamptz not null default now(),
+    constraint reviewer_drive_folders_parent_name_key unique (parent_id, name)
+);
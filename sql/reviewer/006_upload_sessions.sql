@@ -0,0 +1,18 @@
+-- Resumable Drive upload sessions, one per (participant, issue, artifact).
+--
+-- drive_upload saves the session URI when Drive creates it and then refreshes
+-- the acknowledged byte offset every few chunks, so a resubmitted upload of the
+-- same file (matched by fingerprint) continues from there instead of starting
+-- over. The offset is advisory; Drive is asked for the real one on resume. Rows
+-- are removed once the upload completes.
+
+create table if not exists "reviewer-upload-sessions" (
+    participant_id text not null,
+    issue_id text not null,
+    artifact text not null,
+    fingerprint text not null,
+    resumable_uri text not null,
+    bytes_confirmed bigint not null default 0,
+    updated_at timestamptz not null default now(),
+    constraint reviewer_upload_sessions_key unique (participant_id, issue_id, artifact)
+);
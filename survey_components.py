@@ -34,7 +34,8 @@ def navigation_buttons(
     next_label="Next",
     show_back=True,
     validation_fn=None,
-    validation_error="Please fill out all fields before proceeding."
+    validation_error="Please fill out all fields before proceeding.",
+    in_form=False
 ):
     """
     Display back and next navigation buttons with optional validation.
@@ -48,20 +49,26 @@ def navigation_buttons(
         show_back: Whether to render the back button (default: True)
         validation_fn: Function that returns True if validation passes
         validation_error: Error message to show if validation fails
+        in_form: Render as st.form submit buttons; must be called inside the form
     """
     st.markdown("<div style='margin-top: 2rem;'></div>", unsafe_allow_html=True)
     col1, col2, col3 = st.columns([1, 4, 1])
+
+    def button(label, key):
+        if in_form:
+            return st.form_submit_button(label, key=key)
+        return st.button(label, key=key)
     
     back_clicked = False
     next_clicked = False
     with col1:
         if show_back:
-            back_clicked = st.button("Back", key=back_key)
+            back_clicked = button("Back", back_key)
         else:
-            next_clicked = st.button(next_label, key=next_key)
+            next_clicked = button(next_label, next_key)
     with col3:
         if show_back:
-            next_clicked = st.button(next_label, key=next_key)
+            next_clicked = button(next_label, next_key)
         else:
             st.markdown("", unsafe_allow_html=True)
     
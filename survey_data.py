@@ -2,51 +2,157 @@
 Data layer for reviewer survey database operations.
 """
 
-from postgrest import APIError
-from supabase import create_client
-from contributor_config import get_contributor_db_creds, CONTRIBUTOR_TABLES
+import atexit
+import contextvars
+import copy
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from clients import get_contributor_supabase_client, get_supabase_client
+from contributor_config import CONTRIBUTOR_TABLES
+from routing import RoutingState, resolve_route
 from survey_questions import NASA_TLX_QUESTIONS, CODE_QUALITY_QUESTIONS
 
 MIN_COMPLETED_REVIEWS = 4
 
 
-# Initialize Supabase client for reviewer data
-def get_supabase_client():
-    """Get initialized Supabase client for reviewer data based on mode."""
-    import streamlit as st
-    if st.secrets['MODE'] == 'dev':
-        return create_client(
-            st.secrets['SUPABASE_DEV_URL'],
-            st.secrets['SUPABASE_DEV_KEY'],
-        )
-    elif st.secrets['MODE'] == 'prod':
-        return create_client(
-            st.secrets["SUPABASE_URL"],
-            st.secrets["SUPABASE_KEY"],
-        )
-    return None
+_request_memo = contextvars.ContextVar('survey_data_request_memo', default=None)
+_memo_lock = threading.Lock()
 
 
-# Initialize Supabase client for contributor data (repo-issues table)
-def get_contributor_supabase_client():
-    """Get initialized Supabase client for contributor data (repo-issues table)."""
-    try:
-        url, key = get_contributor_db_creds()
-        if not url or not key:
-            print("Contributor database credentials not found in secrets")
-            return None
-        return create_client(url, key)
-    except Exception as e:
-        print(f"Error creating contributor client: {e}")
-        return None
+def begin_request_scope():
+    """
+    Start a fresh memo for identical reads within one Streamlit script run.
 
+    Call this at the top of every rerun; reads made before it is called are not memoized.
+    """
+    _request_memo.set({'entries': {}, 'hits': 0, 'misses': 0})
+
+
+def get_request_memo_stats():
+    """
+    Report how many reads the current rerun served from its memo.
+
+    Returns:
+        dict with 'deduplicated' (calls answered from the memo) and 'executed' (network calls)
+    """
+    memo = _request_memo.get()
+    if memo is None:
+        return {'deduplicated': 0, 'executed': 0}
+    return {'deduplicated': memo['hits'], 'executed': memo['misses']}
+
+
+def _clear_request_memo():
+    """Drop memoized reads after a write so later reads in the same rerun see it."""
+    memo = _request_memo.get()
+    if memo is not None:
+        with _memo_lock:
+            memo['entries'].clear()
+
+
+def _request_memoized(func):
+    """Collapse identical calls to a read function into one network call per rerun."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        memo = _request_memo.get()
+        if memo is None:
+            return func(*args, **kwargs)
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            with _memo_lock:
+                if key in memo['entries']:
+                    memo['hits'] += 1
+                    return copy.deepcopy(memo['entries'][key])
+        except TypeError:
+            # Unhashable arguments can't be memoized
+            return func(*args, **kwargs)
+        result = func(*args, **kwargs)
+        with _memo_lock:
+            memo['misses'] += 1
+            memo['entries'][key] = copy.deepcopy(result)
+        return result
+    return wrapper
+
+
+READ_CACHE_TTL_SECONDS = 60
+REPOSITORY_CACHE_TTL_SECONDS = 600
+_READ_CACHE_MAX_ENTRIES = 2048
+
+_read_cache = {}
+_read_cache_lock = threading.Lock()
+_read_cache_generation = 0
+
+
+def _ttl_cached(ttl_seconds: int, tags):
+    """
+    Cache a read across reruns and sessions for ttl_seconds.
 
-supabase_client = get_supabase_client()
-# Don't initialize contributor_client at module level - initialize when needed
+    tags(args, result) returns the invalidation tags for an entry, e.g.
+    ('reviewer-post-pr-closed', participant_id); writes evict entries by tag.
+    Failed results (dicts with success False) are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (func.__name__, args)
+            with _read_cache_lock:
+                entry = _read_cache.get(key)
+                if entry and entry[0] > time.monotonic():
+                    return copy.deepcopy(entry[1])
+                generation = _read_cache_generation
+            result = func(*args)
+            if isinstance(result, dict) and result.get('success') is False:
+                return result
+            entry_tags = frozenset(tags(args, result))
+            with _read_cache_lock:
+                # Skip the store if a write invalidated entries while we were fetching
+                if generation == _read_cache_generation:
+                    if len(_read_cache) >= _READ_CACHE_MAX_ENTRIES:
+                        now = time.monotonic()
+                        for stale_key in [k for k, e in _read_cache.items() if e[0] <= now]:
+                            del _read_cache[stale_key]
+                    _read_cache[key] = (time.monotonic() + ttl_seconds, copy.deepcopy(result), entry_tags)
+            return result
+        return wrapper
+    return decorator
+
+
+def _invalidate(*tags):
+    """Evict cached reads carrying any of the given tags and reset the rerun memo."""
+    global _read_cache_generation
+    tags = set(tags)
+    with _read_cache_lock:
+        _read_cache_generation += 1
+        for key in [k for k, entry in _read_cache.items() if entry[2] & tags]:
+            del _read_cache[key]
+    _clear_request_memo()
+
+
+def _invalidate_issue(issue_id, updated_rows=None):
+    """Evict cached repo-issues reads for an issue and for the reviewers it is assigned to."""
+    tags = [('issue', issue_id)]
+    for row in updated_rows or []:
+        if row.get('reviewer_id'):
+            tags.append(('repo-issues', row['reviewer_id']))
+    _invalidate(*tags)
+
+
+_snapshot_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='participant-snapshot')
+
+
+def _submit_in_request_scope(fn, *args):
+    """Run fn on the shared executor with the caller's request memo."""
+    ctx = contextvars.copy_context()
+    return _snapshot_executor.submit(ctx.run, fn, *args)
 
 
 def _is_missing_table_error(error):
     """Return True if the PostgREST error indicates a missing table."""
+    # Only reached once a query has failed, so the client library is already loaded
+    from postgrest import APIError
     if not isinstance(error, APIError):
         return False
     payload = error.args[0] if error.args else {}
@@ -55,14 +161,17 @@ def _is_missing_table_error(error):
     return False
 
 
-def _safe_participant_query(table_name: str, participant_id: str):
-    """Select rows for a participant, treating missing tables as empty results."""
+@_request_memoized
+@_ttl_cached(READ_CACHE_TTL_SECONDS, lambda args, _: {(args[0], args[1])})
+def _safe_participant_query(table_name: str, participant_id: str, columns: str = '*'):
+    """Select columns of a participant's rows, treating missing tables as empty results."""
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return []
     try:
-        response = supabase_client.table(table_name).select('*').eq('participant_id', participant_id).execute()
+        response = supabase_client.table(table_name).select(columns).eq('participant_id', participant_id).execute()
         return response.data or []
-    except APIError as api_err:
+    except Exception as api_err:
         if _is_missing_table_error(api_err):
             print(
                 f"[WARN] Table '{table_name}' not found when querying participant '{participant_id}'. Returning empty list."
@@ -71,6 +180,29 @@ def _safe_participant_query(table_name: str, participant_id: str):
         raise
 
 
+@_request_memoized
+@_ttl_cached(READ_CACHE_TTL_SECONDS, lambda args, _: {(args[0], args[1])})
+def _safe_participant_count(table_name: str, participant_id: str) -> int:
+    """Count a participant's rows with a head request, treating missing tables as zero."""
+    supabase_client = get_supabase_client()
+    if not supabase_client:
+        return 0
+    try:
+        response = supabase_client.table(table_name).select(
+            'participant_id', count='exact', head=True
+        ).eq('participant_id', participant_id).execute()
+        return response.count or 0
+    except Exception as api_err:
+        if _is_missing_table_error(api_err):
+            print(
+                f"[WARN] Table '{table_name}' not found when counting participant '{participant_id}'. Returning 0."
+            )
+            return 0
+        raise
+
+
+@_request_memoized
+@_ttl_cached(REPOSITORY_CACHE_TTL_SECONDS, lambda args, _: {('reviewer-repos', args[0])})
 def get_repository_assignment(participant_id: str):
     """
     Get repository assignment for a reviewer participant.
@@ -81,6 +213,7 @@ def get_repository_assignment(participant_id: str):
     Returns:
         dict with 'success', 'repository' (formatted as repository), 'url', and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
@@ -158,6 +291,7 @@ def update_contributor_repo_issues_status(issue_id: int, is_closed: bool, is_mer
             "is_reviewed": is_reviewed
         }
         response = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).update(update_fields).eq('issue_id', issue_id).execute()
+        _invalidate_issue(issue_id, response.data)
         if response.data and len(response.data) > 0:
             return {'success': True, 'error': None}
         else:
@@ -175,6 +309,7 @@ def update_is_reviewed_for_issue(issue_id: int, is_reviewed: bool = True):
             .update({'is_reviewed': is_reviewed}) \
             .eq('issue_id', issue_id) \
             .execute()
+        _invalidate_issue(issue_id, resp.data)
         if resp.data and len(resp.data) > 0:
             return {'success': True, 'error': None}
         else:
@@ -192,6 +327,7 @@ def validate_participant_id(participant_id: str):
     Returns:
         dict with 'valid' (bool), 'error' (str or None) keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'valid': False,
@@ -240,71 +376,77 @@ def validate_participant_id(participant_id: str):
         }
 
 
-def save_post_pr_review_responses(participant_id: str, pr_url: str, responses: dict):
+@dataclass
+class PostPRReviewDraft:
     """
-    Save post-PR review responses to Supabase reviewer-post-pr-review table.
-    
+    A reviewer's post-PR-review answers for one PR, accumulated across pages.
+
+    Only columns whose value changed since the last successful save are written,
+    so each page persists just its own answers.
+    """
+    participant_id: str
+    pr_url: str
+    values: dict = field(default_factory=dict)
+    dirty: set = field(default_factory=set)
+
+    def update(self, **columns):
+        """Set column values, marking the ones that changed as dirty."""
+        for column, value in columns.items():
+            if column not in self.values or self.values[column] != value:
+                self.values[column] = value
+                self.dirty.add(column)
+
+    def update_section(self, prefix: str, responses: dict):
+        """Set a question section's answers, e.g. prefix 'nasa_tlx' -> nasa_tlx_<key> columns."""
+        self.update(**{f'{prefix}_{key}': value for key, value in (responses or {}).items()})
+
+
+def save_post_pr_review_draft(draft: PostPRReviewDraft, finalize: bool = False):
+    """
+    Persist a draft's changed columns to reviewer-post-pr-review in one upsert.
+
     Args:
-        participant_id: The participant's ID
-        pr_url: The PR URL
-        responses: Dictionary of all survey responses
-        
+        draft: PostPRReviewDraft for the participant and PR
+        finalize: Also stamp completed_at, at the AI detection submit; a trigger keeps
+            the first stamp when the section is resubmitted
+
     Returns:
         dict with 'success' and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
             'error': 'Database client not initialized'
         }
-    
+
     try:
         from datetime import datetime, timezone
-        
-        # Prepare data for insertion
-        data = {
-            'participant_id': participant_id,
-            'pr_url': pr_url,
-        }
-        
-        # Add NASA-TLX responses
-        nasa_tlx_responses = responses.get('nasa_tlx_responses', {})
-        for key, value in nasa_tlx_responses.items():
-            data[f'nasa_tlx_{key}'] = value
-        
-        # Add code quality responses
-        code_quality_responses = responses.get('code_quality_responses', {})
-        for key, value in code_quality_responses.items():
-            data[f'code_quality_{key}'] = value
-        
-        # Add AI detection responses
-        data['ai_likelihood'] = responses.get('ai_likelihood')
-        data['ai_reasoning'] = responses.get('ai_reasoning')
-        data['ai_review_strategy'] = responses.get('ai_review_strategy')
-        
-        print(f"Prepared post-PR review data for participant {participant_id}: {data}")
-        
-        # Check if participant already has responses for this PR
-        existing = supabase_client.table('reviewer-post-pr-review').select('participant_id').eq('participant_id', participant_id).eq('pr_url', pr_url).execute()
-        
-        if existing.data and len(existing.data) > 0:
-            # Update existing record
-            data['updated_at'] = datetime.now(timezone.utc).isoformat()
-            result = supabase_client.table('reviewer-post-pr-review').update(data).eq('participant_id', participant_id).eq('pr_url', pr_url).execute()
-            print(f"Updated post-PR review responses for participant: {participant_id}, PR: {pr_url}")
-        else:
-            # Insert new record
-            now = datetime.now(timezone.utc).isoformat()
-            data['created_at'] = now
-            data['updated_at'] = now
-            result = supabase_client.table('reviewer-post-pr-review').insert(data).execute()
-            print(f"Inserted post-PR review responses for participant: {participant_id}, PR: {pr_url}")
-        
+
+        columns = sorted(draft.dirty)
+        if not columns and not finalize:
+            return {'success': True, 'error': None}
+
+        now = datetime.now(timezone.utc).isoformat()
+        data = {column: draft.values[column] for column in columns}
+        data.update({'participant_id': draft.participant_id, 'pr_url': draft.pr_url, 'updated_at': now})
+        if finalize:
+            data['completed_at'] = now
+
+        # Only the changed columns are sent, so the upsert leaves other sections untouched;
+        # created_at is filled by its column default on first insert
+        supabase_client.table('reviewer-post-pr-review').upsert(
+            data, on_conflict='participant_id,pr_key'
+        ).execute()
+        draft.dirty.difference_update(columns)
+        print(f"Saved post-PR review columns {columns} for participant: {draft.participant_id}, PR: {draft.pr_url}")
+        _invalidate(('reviewer-post-pr-review', draft.participant_id))
+
         return {
             'success': True,
             'error': None
         }
-        
+
     except Exception as e:
         print(f"Error saving post-PR review responses: {e}")
         import traceback
@@ -327,6 +469,7 @@ def save_post_pr_closed_responses(participant_id: str, pr_url: str, responses: d
     Returns:
         dict with 'success' and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
@@ -359,21 +502,14 @@ def save_post_pr_closed_responses(participant_id: str, pr_url: str, responses: d
         
         print(f"Prepared post-PR closed data for participant {participant_id}: {data}")
         
-        # Check if participant already has responses for this PR
-        existing = supabase_client.table('reviewer-post-pr-closed').select('participant_id').eq('participant_id', participant_id).eq('pr_url', pr_url).execute()
-        
-        if existing.data and len(existing.data) > 0:
-            # Update existing record
-            data['updated_at'] = datetime.now(timezone.utc).isoformat()
-            result = supabase_client.table('reviewer-post-pr-closed').update(data).eq('participant_id', participant_id).eq('pr_url', pr_url).execute()
-            print(f"Updated post-PR closed responses for participant: {participant_id}, PR: {pr_url}")
-        else:
-            # Insert new record
-            now = datetime.now(timezone.utc).isoformat()
-            data['created_at'] = now
-            data['updated_at'] = now
-            result = supabase_client.table('reviewer-post-pr-closed').insert(data).execute()
-            print(f"Inserted post-PR closed responses for participant: {participant_id}, PR: {pr_url}")
+        # Single atomic write on the (participant_id, pr_key) unique key;
+        # created_at is filled by its column default on first insert
+        data['updated_at'] = datetime.now(timezone.utc).isoformat()
+        result = supabase_client.table('reviewer-post-pr-closed').upsert(
+            data, on_conflict='participant_id,pr_key'
+        ).execute()
+        print(f"Upserted post-PR closed responses for participant: {participant_id}, PR: {pr_url}")
+        _invalidate(('reviewer-post-pr-closed', participant_id))
         
         return {
             'success': True,
@@ -390,21 +526,29 @@ def save_post_pr_closed_responses(participant_id: str, pr_url: str, responses: d
         }
 
 
+@_ttl_cached(READ_CACHE_TTL_SECONDS, lambda args, _: {('reviewer-post-pr-closed', args[0])})
+def _fetch_completed_pr_closed_surveys(participant_id: str):
+    """Select the participant's post-PR-closed survey URLs; errors propagate so they are not cached."""
+    supabase_client = get_supabase_client()
+    result = supabase_client.table('reviewer-post-pr-closed')\
+        .select('pr_url')\
+        .eq('participant_id', participant_id)\
+        .execute()
+    return {row['pr_url'] for row in result.data} if result.data else set()
+
+
+@_request_memoized
 def get_completed_pr_closed_surveys(participant_id: str):
     """
     Get PR URLs for which the reviewer has completed the post-PR-closed survey.
 
     Returns:
-        set of pr_url strings with completed surveys
+        set of pr_url strings with completed surveys (empty on error, without caching the failure)
     """
-    if not supabase_client:
+    if not get_supabase_client():
         return set()
     try:
-        result = supabase_client.table('reviewer-post-pr-closed')\
-            .select('pr_url')\
-            .eq('participant_id', participant_id)\
-            .execute()
-        return {row['pr_url'] for row in result.data} if result.data else set()
+        return _fetch_completed_pr_closed_surveys(participant_id)
     except Exception as e:
         print(f"Error fetching completed pr-closed surveys: {e}")
         return set()
@@ -421,6 +565,7 @@ def save_end_study_responses(participant_id: str, responses: dict):
     Returns:
         dict with 'success' and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
@@ -436,17 +581,12 @@ def save_end_study_responses(participant_id: str, responses: dict):
         
         print(f"Prepared end-study data for participant {participant_id}: {data}")
         
-        # Check if participant already has responses
-        existing = supabase_client.table('reviewer-end-study').select('participant_id').eq('participant_id', participant_id).execute()
-        
-        if existing.data and len(existing.data) > 0:
-            # Update existing record
-            result = supabase_client.table('reviewer-end-study').update(data).eq('participant_id', participant_id).execute()
-            print(f"Updated end-study responses for participant: {participant_id}")
-        else:
-            # Insert new record
-            result = supabase_client.table('reviewer-end-study').insert(data).execute()
-            print(f"Inserted end-study responses for participant: {participant_id}")
+        # Single atomic write on the participant_id unique key
+        result = supabase_client.table('reviewer-end-study').upsert(
+            data, on_conflict='participant_id'
+        ).execute()
+        print(f"Upserted end-study responses for participant: {participant_id}")
+        _invalidate(('reviewer-end-study', participant_id))
         
         return {
             'success': True,
@@ -463,213 +603,335 @@ def save_end_study_responses(participant_id: str, responses: dict):
         }
 
 
-def get_random_unassigned_pr(repository: str):
+PR_AVAILABILITY_REFRESH_SECONDS = 15
+# Incremental refreshes re-read this far behind the newest updated_at seen: the trigger
+# stamps the transaction start time, so a slow transaction can commit behind the watermark
+PR_AVAILABILITY_WATERMARK_MARGIN_SECONDS = 120
+# Rebuild the whole index this often, so a change missed by the margin is bounded in time
+PR_AVAILABILITY_FULL_RELOAD_SECONDS = 300
+_AVAILABILITY_COLUMNS = 'issue_id, pr_url, is_completed, reviewer_assigned, updated_at'
+
+
+def _parse_timestamp(value):
+    """Parse a PostgREST timestamptz string into an aware datetime, or None."""
+    from datetime import datetime
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _is_available(row) -> bool:
+    pr_url = (row.get('pr_url') or '').strip()
+    return bool(row.get('is_completed') and pr_url and not row.get('reviewer_assigned'))
+
+
+class _RepositoryAvailability:
+    """Eligible (completed, has a PR, unassigned) issue IDs for one repository."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.available_issue_ids = set()
+        self.watermark = None
+        self.refreshed_at = 0.0
+        self.reloaded_at = None
+        self.refreshing = False
+
+    def apply(self, rows, full_reload: bool):
+        if full_reload:
+            self.available_issue_ids = {row['issue_id'] for row in rows if _is_available(row)}
+        else:
+            for row in rows:
+                if _is_available(row):
+                    self.available_issue_ids.add(row['issue_id'])
+                else:
+                    self.available_issue_ids.discard(row['issue_id'])
+        for row in rows:
+            updated_at = _parse_timestamp(row.get('updated_at'))
+            if updated_at and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+
+
+_availability_index = {}
+_availability_index_lock = threading.Lock()
+
+
+def _get_repository_availability(repository: str) -> _RepositoryAvailability:
+    with _availability_index_lock:
+        entry = _availability_index.get(repository)
+        if entry is None:
+            entry = _availability_index[repository] = _RepositoryAvailability()
+        return entry
+
+
+def _fetch_repository_availability(repository: str, since=None):
     """
-    Get a random unassigned PR from completed issues in a repository.
-    Looks for completed issues with PRs that haven't been assigned to reviewers yet.
-    
+    Read the lean eligibility columns for a repository's rows.
+
+    With since, only rows whose updated_at is at or past it are fetched
+    (see sql/contributor/002_repo_issues_updated_at.sql); without it, every
+    completed issue is read for a full reload.
+    """
+    contributor_client = get_contributor_supabase_client()
+    if not contributor_client:
+        raise RuntimeError('Contributor database client not initialized')
+
+    query = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues'])\
+        .select(_AVAILABILITY_COLUMNS)\
+        .eq('repository', repository)
+    if since is not None:
+        query = query.gte('updated_at', since.isoformat())
+    else:
+        query = query.eq('is_completed', True)
+    return query.execute().data or []
+
+
+def _refresh_repository_availability(entry: _RepositoryAvailability, repository: str):
+    """
+    Bring an availability entry up to date if it is due, one caller at a time.
+
+    The network read runs outside entry.lock; while one caller refreshes, others
+    keep reading the previous count instead of waiting on it.
+    """
+    from datetime import timedelta
+
+    now = time.monotonic()
+    with entry.lock:
+        if entry.refreshing or now - entry.refreshed_at < PR_AVAILABILITY_REFRESH_SECONDS:
+            return
+        full_reload = (
+            entry.watermark is None
+            or entry.reloaded_at is None
+            or now - entry.reloaded_at >= PR_AVAILABILITY_FULL_RELOAD_SECONDS
+        )
+        since = None if full_reload else entry.watermark - timedelta(seconds=PR_AVAILABILITY_WATERMARK_MARGIN_SECONDS)
+        entry.refreshing = True
+
+    try:
+        rows = _fetch_repository_availability(repository, since)
+    except Exception:
+        with entry.lock:
+            entry.refreshing = False
+        raise
+
+    with entry.lock:
+        entry.apply(rows, full_reload)
+        entry.refreshing = False
+        entry.refreshed_at = now
+        if full_reload:
+            entry.reloaded_at = now
+
+
+def get_available_pr_count(repository: str):
+    """
+    Count unassigned PRs in a repository from the shared availability index.
+
+    The index is shared by all sessions in the process, refreshed incrementally at
+    most every PR_AVAILABILITY_REFRESH_SECONDS and rebuilt every
+    PR_AVAILABILITY_FULL_RELOAD_SECONDS. The count is a hint for the UI; claiming
+    a PR always goes through claim_next_pr.
+
     Args:
         repository: Repository in format "repository"
-        
+
+    Returns:
+        dict with 'success', 'count', and 'error' keys; count is None until the
+        first load has finished
+    """
+    entry = _get_repository_availability(repository)
+    try:
+        _refresh_repository_availability(entry, repository)
+    except Exception as e:
+        print(f"[AVAILABILITY] Error refreshing {repository}: {e}")
+        return {'success': False, 'count': None, 'error': str(e)}
+    with entry.lock:
+        count = len(entry.available_issue_ids) if entry.reloaded_at is not None else None
+    return {'success': True, 'count': count, 'error': None}
+
+
+def _mark_pr_claimed(repository: str, issue_id):
+    """Drop a claimed issue from the availability index without waiting for a refresh."""
+    entry = _get_repository_availability(repository)
+    with entry.lock:
+        entry.available_issue_ids.discard(issue_id)
+
+
+def _mark_availability_stale(repository: str):
+    """Force the next availability read for a repository to refresh."""
+    entry = _get_repository_availability(repository)
+    with entry.lock:
+        entry.refreshed_at = 0.0
+
+
+def claim_next_unassigned_pr(reviewer_id: str, repository: str):
+    """
+    Atomically pick a random unassigned PR in a repository and assign it to a reviewer.
+
+    Runs the contributor project's claim_next_pr function, which selects an eligible
+    completed issue with a PR under FOR UPDATE SKIP LOCKED and marks it assigned in the
+    same statement (see sql/contributor/001_claim_next_pr.sql), so two reviewers
+    requesting a PR at the same moment can never claim the same issue.
+
+    Args:
+        reviewer_id: The reviewer's ID (e.g., "r1", "r2", etc.)
+        repository: Repository in format "repository"
+
     Returns:
         dict with 'success', 'pr' (dict with url, number, title), and 'error' keys
     """
-    if not supabase_client:
+    contributor_client = get_contributor_supabase_client()
+    if not contributor_client:
         return {
             'success': False,
-            'error': 'Database client not initialized',
+            'error': 'Contributor database client not initialized',
             'pr': None
         }
-    
+
+    no_pr_error = f"Sorry, please check back later! There are no more unassigned PRs in the repository {repository} right now."
+
     try:
-        
-        repo_name = repository
-        
-        # Get all completed issues with PRs that haven't been assigned to reviewers yet
-        # We'll check for issues that are completed (is_completed = true) and have a PR URL
-        # but haven't been assigned to a reviewer (reviewer_assigned = false or null)
-        
-        # First, get all completed issues with PRs from contributor database
-        contributor_client = get_contributor_supabase_client()
-        if not contributor_client:
-            return {
-                'success': False,
-                'error': 'Contributor database client not initialized',
-                'pr': None
-            }
-        
-        # Select all relevant fields from the repo-issues table
-        response = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).select(
-            'repository, issue_url, issue_id, repository_id, is_assigned, is_completed, '
-            'participant_id, participant_estimate, accepted_on, completed_on, pr_url, '
-            'reviewer_assigned, reviewer_id, reviewer_assigned_on, reviewer_estimate, '
-            'is_closed, is_merged, is_reviewed, using_ai, issue_sequence'
-        ).eq('repository', repo_name).eq('is_completed', True).execute()
-        
-        print(f"Found {len(response.data) if response.data else 0} completed issues for {repository}")
-        
-        if not response.data or len(response.data) == 0:
+        result = contributor_client.rpc(
+            'claim_next_pr',
+            {'p_repository': repository, 'p_reviewer_id': reviewer_id}
+        ).execute()
+
+        if not result.data:
+            print(f"No unassigned PRs left to claim in {repository}")
+            _mark_availability_stale(repository)
             return {
                 'success': False,
-                'error': f"No completed issues found for repository {repository}",
+                'error': no_pr_error,
                 'pr': None
             }
-        
-        # Filter for issues that have PRs and haven't been assigned to reviewers
-        available_issues = []
-        for issue in response.data:
-            # Check if this issue has a PR URL
-            pr_url = issue.get('pr_url', '')
-            if not pr_url or pr_url.strip() == '':
-                continue
-                
-            # Check if this issue has already been assigned to a reviewer
-            reviewer_assigned = issue.get('reviewer_assigned', False)
-            if not reviewer_assigned:
-                available_issues.append(issue)
-        
-        print(f"Found {len(available_issues)} available issues with PRs for review")
-        
-        if not available_issues:
-            return {
-                'success': False,
-                'error': f"Sorry, please check back later! There are no more unassigned PRs in the repository {repository} right now.",
-                'pr': None
-            }
-        
-        # Randomly select one issue with PR
-        import random
-        selected_issue = random.choice(available_issues)
-        
-        # Extract all relevant information from the issue
-        pr_url = selected_issue.get('pr_url', '')
-        issue_url = selected_issue.get('issue_url', '')
-        issue_id = selected_issue.get('issue_id', 'N/A')
-        repository_id = selected_issue.get('repository_id', 'N/A')
-        participant_id = selected_issue.get('participant_id', 'N/A')
-        participant_estimate = selected_issue.get('participant_estimate', 'N/A')
-        accepted_on = selected_issue.get('accepted_on', 'N/A')
-        completed_on = selected_issue.get('completed_on', 'N/A')
-        
-        # Extract PR number from URL if possible
-        pr_number = 'N/A'
-        if pr_url and 'pull/' in pr_url:
-            try:
-                pr_number = pr_url.split('pull/')[-1].split('/')[0]
-            except:
-                pr_number = 'N/A'
-        
+
+        claimed_issue = result.data[0]
+        issue_id = claimed_issue.get('issue_id', 'N/A')
+        pr_url = claimed_issue.get('pr_url', '')
+        participant_estimate = claimed_issue.get('participant_estimate', 'N/A')
+        _invalidate(('issue', issue_id), ('repo-issues', reviewer_id))
+        _mark_pr_claimed(repository, issue_id)
+
         # Create a title from available information
         title = f"Issue #{issue_id}"
         if participant_estimate and participant_estimate != 'N/A':
             title += f" - {participant_estimate}"
-        
-        print(f"Retrieved issue {issue_id} with PR {pr_number} (not yet assigned to reviewer)")
-        print(f"Issue URL: {issue_url}")
-        print(f"PR URL: {pr_url}")
-        
+
+        print(f"✅ Reviewer {reviewer_id} claimed issue {issue_id} with PR {pr_url}")
+
         return {
             'success': True,
             'pr': {
                 'url': pr_url,  # PR URL
-                'number': pr_number,
+                'number': _extract_pr_number(pr_url),
                 'title': title,
-                'repository': repo_name,
+                'repository': repository,
                 'issue_id': issue_id,
-                'issue_url': issue_url,  # Issue URL
-                'repository_id': repository_id,
-                'participant_id': participant_id,
+                'issue_url': claimed_issue.get('issue_url', ''),  # Issue URL
+                'repository_id': claimed_issue.get('repository_id', 'N/A'),
+                'participant_id': claimed_issue.get('participant_id', 'N/A'),
                 'participant_estimate': participant_estimate,
-                'accepted_on': accepted_on,
-                'completed_on': completed_on,
-                'reviewer_estimate': selected_issue.get('reviewer_estimate'),
-                'is_closed': selected_issue.get('is_closed'),
-                'is_merged': selected_issue.get('is_merged'),
-                'is_reviewed': selected_issue.get('is_reviewed'),
-                'using_ai': selected_issue.get('using_ai'),
-                'issue_sequence': selected_issue.get('issue_sequence')
+                'accepted_on': claimed_issue.get('accepted_on', 'N/A'),
+                'completed_on': claimed_issue.get('completed_on', 'N/A'),
+                'reviewer_estimate': claimed_issue.get('reviewer_estimate'),
+                'is_closed': claimed_issue.get('is_closed'),
+                'is_merged': claimed_issue.get('is_merged'),
+                'is_reviewed': claimed_issue.get('is_reviewed'),
+                'using_ai': claimed_issue.get('using_ai'),
+                'issue_sequence': claimed_issue.get('issue_sequence')
             },
             'error': None
         }
-        
+
     except Exception as e:
-        print(f"Error getting random PR: {e}")
+        print(f"❌ ERROR claiming PR: {e}")
         import traceback
         traceback.print_exc()
         return {
             'success': False,
-            'error': f"Error getting PR: {str(e)}",
+            'error': f"Error assigning PR: {str(e)}",
             'pr': None
         }
 
 
-def assign_pr_to_reviewer(reviewer_id: str, issue_id: int):
-    """
-    Assign a specific issue's PR to a reviewer by updating the repo-issues table.
-
-    Args:
-        reviewer_id: The reviewer's ID (e.g., "r1", "r2", etc.)
-        issue_id: The issue ID whose PR should be assigned
-
-    Returns:
-        dict with 'success' and 'error' keys
-    """
-    contributor_client = get_contributor_supabase_client()
-    if not contributor_client:
-        print("ERROR: Contributor database client not initialized")
-        return {
-            'success': False,
-            'error': 'Contributor database client not initialized'
-        }
-
-    try:
-        print(f"=== STARTING PR ASSIGNMENT ===")
-        print(f"Reviewer ID: {reviewer_id} (type: {type(reviewer_id)})")
-        print(f"Issue ID: {issue_id} (type: {type(issue_id)})")
-
-        # Update the issue to mark as assigned to reviewer with timestamp
-        from datetime import datetime, timezone
-
-        update_data = {
-            'reviewer_assigned': True,
-            'reviewer_id': reviewer_id,  # Store as string (r1, r2, etc.)
-            'reviewer_assigned_on': datetime.now(timezone.utc).isoformat(),  # Current UTC timestamp
-            'is_closed': False,
-            'is_merged': False,
-            'is_reviewed': False
-        }
-
-        print(f"Update data: {update_data}")
-        print(f"Updating table 'repo-issues' where issue_id = {issue_id}")
+_ASSIGNED_PR_COLUMNS = (
+    'repository, issue_url, issue_id, repository_id, pr_url, reviewer_assigned, reviewer_id, '
+    'reviewer_estimate, new_contributor_estimate, reviewer_assigned_on, is_closed, is_merged, is_reviewed, '
+    'using_ai, issue_sequence'
+)
+
+
+def normalize_pr_url(url) -> str:
+    """Normalize a PR URL for comparison (trim whitespace and trailing slashes, lowercase)."""
+    return (url or '').strip().rstrip('/').lower()
+
+
+def _extract_pr_number(pr_url: str) -> str:
+    """Return the PR number from a GitHub pull request URL, or 'N/A'."""
+    if pr_url and 'pull/' in pr_url:
+        try:
+            return pr_url.split('pull/')[-1].split('/')[0]
+        except Exception:
+            return 'N/A'
+    return 'N/A'
+
+
+@_request_memoized
+@_ttl_cached(
+    READ_CACHE_TTL_SECONDS,
+    lambda args, rows: {('repo-issues', args[1])} | {('issue', row.get('issue_id')) for row in rows}
+)
+def _fetch_reviewer_issue_rows(contributor_client, reviewer_id: str, repository: str = None):
+    """Select the repo-issues rows assigned to a reviewer, optionally scoped to a repository."""
+    query = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).select(_ASSIGNED_PR_COLUMNS)
+    if repository is not None:
+        query = query.eq('repository', repository)
+    response = query.eq('reviewer_id', reviewer_id).eq('reviewer_assigned', True).execute()
+    return response.data or []
+
+
+def _format_assigned_pr(issue: dict, repo_name: str) -> dict:
+    """Shape a repo-issues row into the PR dict used by the survey pages."""
+    pr_url = issue.get('pr_url', '')
+    issue_id = issue.get('issue_id')
+    return {
+        'url': pr_url,
+        'number': _extract_pr_number(pr_url),
+        'title': f"Issue #{issue_id}",
+        'repository': repo_name,
+        'issue_id': issue_id,
+        'issue_url': issue.get('issue_url', ''),
+        'reviewer_estimate': issue.get('reviewer_estimate'),
+        'new_contributor_estimate': issue.get('new_contributor_estimate'),
+        'reviewer_assigned_on': issue.get('reviewer_assigned_on'),
+        'is_closed': issue.get('is_closed'),
+        'is_merged': issue.get('is_merged'),
+        'is_reviewed': issue.get('is_reviewed'),
+        'using_ai': issue.get('using_ai'),
+        'issue_sequence': issue.get('issue_sequence')
+    }
+
+
+def _select_current_assignment(issues: list):
+    """Pick the most recent open assignment (fallback to the newest record if all are closed)."""
+    if not issues:
+        return None
 
-        result = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).update(update_data).eq('issue_id', issue_id).execute()
+    def sort_key(record):
+        assigned_on = record.get('reviewer_assigned_on') or ''
+        seq = record.get('issue_sequence')
+        return (assigned_on, seq if seq is not None else -1)
 
-        print(f"Update result: {result}")
+    sorted_issues = sorted(issues, key=sort_key, reverse=True)
 
-        if result.data and len(result.data) > 0:
-            print(f"✅ Successfully assigned issue {issue_id} PR to reviewer {reviewer_id}")
-            print(f"Updated row: {result.data[0]}")
-            return {
-                'success': True,
-                'error': None
-            }
-        else:
-            print(f"⚠️ Update returned empty data - issue may not exist or RLS policy blocked the update")
-            return {
-                'success': False,
-                'error': f"Issue {issue_id} not found or RLS policy blocked the update. Check server logs."
-            }
+    def is_active(record):
+        return not record.get('is_closed') and not record.get('is_merged')
 
-    except Exception as e:
-        print(f"❌ ERROR assigning PR: {e}")
-        import traceback
-        traceback.print_exc()
-        return {
-            'success': False,
-            'error': f"Error assigning PR: {str(e)}"
-        }
+    return next((record for record in sorted_issues if is_active(record)), sorted_issues[0])
 
 
+@_request_memoized
 def get_assigned_pr_for_reviewer(reviewer_id: str, repository: str):
     """
     Load the PR assigned to a reviewer from the contributor repo-issues table.
@@ -690,58 +952,14 @@ def get_assigned_pr_for_reviewer(reviewer_id: str, repository: str):
         }
 
     try:
-        repo_name = repository
-
-        response = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).select(
-            'repository, issue_url, issue_id, repository_id, pr_url, reviewer_assigned, reviewer_id, '
-            'reviewer_estimate, new_contributor_estimate, reviewer_assigned_on, is_closed, is_merged, is_reviewed, '
-            'using_ai, issue_sequence'
-        ).eq('repository', repo_name).eq('reviewer_id', reviewer_id).eq('reviewer_assigned', True).execute()
-
-        if not response.data or len(response.data) == 0:
+        issues = _fetch_reviewer_issue_rows(contributor_client, reviewer_id, repository)
+        issue = _select_current_assignment(issues)
+        if issue is None:
             return {'success': True, 'pr': None, 'error': None}
 
-        # Pick the most recent open assignment (fallback to the newest record if all are closed)
-        issues = response.data
-
-        def sort_key(record):
-            assigned_on = record.get('reviewer_assigned_on') or ''
-            seq = record.get('issue_sequence')
-            return (assigned_on, seq if seq is not None else -1)
-
-        sorted_issues = sorted(issues, key=sort_key, reverse=True)
-
-        def is_active(record):
-            return not record.get('is_closed') and not record.get('is_merged')
-
-        issue = next((record for record in sorted_issues if is_active(record)), sorted_issues[0])
-        pr_url = issue.get('pr_url', '')
-        issue_url = issue.get('issue_url', '')
-        issue_id = issue.get('issue_id')
-        pr_number = 'N/A'
-        if pr_url and 'pull/' in pr_url:
-            try:
-                pr_number = pr_url.split('pull/')[-1].split('/')[0]
-            except Exception:
-                pr_number = 'N/A'
-
-        title = f"Issue #{issue_id}"
-
         return {
             'success': True,
-            'pr': {
-                'url': pr_url,
-                'number': pr_number,
-                'title': title,
-                'repository': repo_name,
-                'issue_id': issue_id,
-                'issue_url': issue_url,
-                'reviewer_estimate': issue.get('reviewer_estimate'),
-                'new_contributor_estimate': issue.get('new_contributor_estimate'),
-                'is_closed': issue.get('is_closed'),
-                'is_merged': issue.get('is_merged'),
-                'is_reviewed': issue.get('is_reviewed')
-            },
+            'pr': _format_assigned_pr(issue, repository),
             'error': None
         }
     except Exception as e:
@@ -751,6 +969,7 @@ def get_assigned_pr_for_reviewer(reviewer_id: str, repository: str):
         return {'success': False, 'pr': None, 'error': str(e)}
 
 
+@_request_memoized
 def list_assigned_prs_for_reviewer(reviewer_id: str, repository: str):
     """
     List all PRs assigned to a reviewer for a given repository.
@@ -771,43 +990,8 @@ def list_assigned_prs_for_reviewer(reviewer_id: str, repository: str):
         }
 
     try:
-        repo_name = repository
-
-        response = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).select(
-            'repository, issue_url, issue_id, repository_id, pr_url, reviewer_assigned, reviewer_id, '
-            'reviewer_estimate, new_contributor_estimate, reviewer_assigned_on, is_closed, is_merged, is_reviewed, '
-            'using_ai, issue_sequence'
-        ).eq('repository', repo_name).eq('reviewer_id', reviewer_id).eq('reviewer_assigned', True).execute()
-
-        prs = []
-        if response.data:
-            for issue in response.data:
-                pr_url = issue.get('pr_url', '')
-                issue_url = issue.get('issue_url', '')
-                issue_id = issue.get('issue_id')
-                pr_number = 'N/A'
-                if pr_url and 'pull/' in pr_url:
-                    try:
-                        pr_number = pr_url.split('pull/')[-1].split('/')[0]
-                    except Exception:
-                        pr_number = 'N/A'
-                prs.append({
-                    'url': pr_url,
-                    'number': pr_number,
-                    'title': f"Issue #{issue_id}",
-                    'repository': repo_name,
-                    'issue_id': issue_id,
-                    'issue_url': issue_url,
-                    'reviewer_estimate': issue.get('reviewer_estimate'),
-                    'new_contributor_estimate': issue.get('new_contributor_estimate'),
-                    'reviewer_assigned_on': issue.get('reviewer_assigned_on'),
-                    'is_closed': issue.get('is_closed'),
-                    'is_merged': issue.get('is_merged'),
-                    'is_reviewed': issue.get('is_reviewed'),
-                    'using_ai': issue.get('using_ai'),
-                    'issue_sequence': issue.get('issue_sequence')
-                })
-
+        issues = _fetch_reviewer_issue_rows(contributor_client, reviewer_id, repository)
+        prs = [_format_assigned_pr(issue, repository) for issue in issues]
         return {'success': True, 'prs': prs, 'error': None}
 
     except Exception as e:
@@ -816,6 +1000,17 @@ def list_assigned_prs_for_reviewer(reviewer_id: str, repository: str):
         traceback.print_exc()
         return {'success': False, 'prs': [], 'error': str(e)}
 
+def _build_progress(post_pr_review_count: int, post_pr_closed_count: int, end_study_count: int) -> dict:
+    """Assemble the progress dict from the participant's row count in each survey table."""
+    return {
+        'pre_study_completed': False,
+        'post_pr_review_count': post_pr_review_count,
+        'post_pr_closed_count': post_pr_closed_count,
+        'end_study_completed': end_study_count > 0,
+    }
+
+
+@_request_memoized
 def get_participant_progress(participant_id: str):
     """
     Get the progress status of a reviewer participant.
@@ -826,6 +1021,7 @@ def get_participant_progress(participant_id: str):
     Returns:
         dict with 'success', 'progress' (dict with status info), and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
@@ -834,25 +1030,12 @@ def get_participant_progress(participant_id: str):
         }
 
     try:
-
-        # Check post-PR review responses
-        post_pr_review_data = _safe_participant_query('reviewer-post-pr-review', participant_id)
-
-        # Check post-PR closed responses
-        post_pr_closed_data = _safe_participant_query('reviewer-post-pr-closed', participant_id)
-
-        # Check end-study completion
-        end_study_data = _safe_participant_query('reviewer-end-study', participant_id)
-
-        progress = {
-            'pre_study_completed': False,
-            'post_pr_review_count': len(post_pr_review_data),
-            'post_pr_closed_count': len(post_pr_closed_data),
-            'end_study_completed': len(end_study_data) > 0,
-            'post_pr_review_data': post_pr_review_data,
-            'post_pr_closed_data': post_pr_closed_data,
-            'end_study_data': end_study_data[0] if end_study_data else None
-        }
+        # Count rows with head requests; no response bodies are transferred
+        progress = _build_progress(
+            _safe_participant_count('reviewer-post-pr-review', participant_id),
+            _safe_participant_count('reviewer-post-pr-closed', participant_id),
+            _safe_participant_count('reviewer-end-study', participant_id),
+        )
 
         print(f"Progress for reviewer participant {participant_id}: {progress}")
 
@@ -873,151 +1056,162 @@ def get_participant_progress(participant_id: str):
         }
 
 
-def check_nasa_tlx_completed(participant_id: str, pr_url: str):
-    """
-    Check if NASA TLX questions have been completed for a specific PR by querying Supabase.
+_PRIMARY_CODE_QUALITY_COLUMN = f"code_quality_{next(iter(CODE_QUALITY_QUESTIONS.keys()))}"
 
-    Args:
-        participant_id: The participant's ID
-        pr_url: The PR URL to check
 
-    Returns:
-        bool: True if NASA TLX questions are completed, False otherwise
+def _is_answered(value) -> bool:
     """
-    if not supabase_client or not pr_url:
-        print(f"[NASA TLX CHECK] Skipping check - client: {bool(supabase_client)}, pr_url: {pr_url}")
+    Return True if a stored survey value counts as an answer.
+
+    'Not selected' is the radio placeholder, so it counts as unanswered for every
+    section, including ai_likelihood, as get_prs_with_incomplete_responses does.
+    """
+    if not value:
+        return False
+    if isinstance(value, str) and value.strip().lower() in ('', 'not selected'):
         return False
+    return True
 
-    try:
-        # Normalize URL for comparison
-        normalized_url = pr_url.strip().rstrip('/')
-        print(f"[NASA TLX CHECK] Checking for participant {participant_id}, PR: {normalized_url}")
 
-        # Query the database for this participant - get all entries to check URL matching
-        response = supabase_client.table('reviewer-post-pr-review').select(
-            'pr_url, nasa_tlx_mental_demand'
-        ).eq('participant_id', participant_id).execute()
+def _post_pr_review_completion(entry) -> dict:
+    """Return which post-PR-review sections a reviewer-post-pr-review row has answered."""
+    if not entry:
+        return {'nasa_tlx': False, 'code_quality': False, 'ai_detection': False}
+    return {
+        'nasa_tlx': _is_answered(entry.get('nasa_tlx_mental_demand')),
+        'code_quality': _is_answered(entry.get(_PRIMARY_CODE_QUALITY_COLUMN)),
+        'ai_detection': _is_answered(entry.get('ai_likelihood')),
+    }
 
-        print(f"[NASA TLX CHECK] Found {len(response.data) if response.data else 0} entries for participant")
 
-        if response.data and len(response.data) > 0:
-            # Find matching entry by normalized URL
-            for entry in response.data:
-                entry_url = entry.get('pr_url', '').strip().rstrip('/')
-                if entry_url == normalized_url:
-                    print(f"[NASA TLX CHECK] Found matching entry for PR")
-                    value = entry.get('nasa_tlx_mental_demand')
-                    if value and (not isinstance(value, str) or value.strip().lower() not in ['', 'not selected']):
-                        print(f"[NASA TLX CHECK] Primary field complete - returning True")
-                        return True
-                    print(f"[NASA TLX CHECK] Primary field missing - returning False")
-                    return False
-        print(f"[NASA TLX CHECK] No matching entry found - returning False")
-        return False
-    except Exception as e:
-        print(f"[NASA TLX CHECK] Error checking NASA TLX completion: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+_COMPLETION_COLUMNS = f'pr_key, nasa_tlx_mental_demand, {_PRIMARY_CODE_QUALITY_COLUMN}, ai_likelihood'
+_POST_PR_REVIEW_STATUS_COLUMNS = f'pr_url, {_COMPLETION_COLUMNS}, created_at, updated_at'
 
 
-def check_code_quality_completed(participant_id: str, pr_url: str):
+@_request_memoized
+@_ttl_cached(READ_CACHE_TTL_SECONDS, lambda args, _: {('reviewer-post-pr-review', args[0])})
+def _fetch_post_pr_review_completion(participant_id: str, pr_key: str):
+    """Look up the participant's row for a normalized PR key and report section completion."""
+    supabase_client = get_supabase_client()
+    response = supabase_client.table('reviewer-post-pr-review').select(
+        _COMPLETION_COLUMNS
+    ).eq('participant_id', participant_id).eq('pr_key', pr_key).limit(1).execute()
+    entry = response.data[0] if response.data else None
+    return _post_pr_review_completion(entry)
+
+
+def get_post_pr_review_completion(participant_id: str, pr_url: str):
     """
-    Check if code quality questions have been completed for a specific PR by querying Supabase.
+    Check which post-PR-review sections have been completed for a specific PR.
+
+    Uses a single filtered query on the stored, indexed pr_key column
+    (see sql/reviewer/001_post_pr_review_pr_key.sql).
 
     Args:
         participant_id: The participant's ID
         pr_url: The PR URL to check
 
     Returns:
-        bool: True if code quality questions are completed, False otherwise
+        dict mapping 'nasa_tlx', 'code_quality' and 'ai_detection' to bool
     """
+    supabase_client = get_supabase_client()
     if not supabase_client or not pr_url:
-        print(f"[CODE QUALITY CHECK] Skipping check - client: {bool(supabase_client)}, pr_url: {pr_url}")
-        return False
+        print(f"[COMPLETION CHECK] Skipping check - client: {bool(supabase_client)}, pr_url: {pr_url}")
+        return _post_pr_review_completion(None)
 
     try:
-        # Normalize URL for comparison
-        normalized_url = pr_url.strip().rstrip('/')
-        print(f"[CODE QUALITY CHECK] Checking for participant {participant_id}, PR: {normalized_url}")
-
-        first_quality_key = next(iter(CODE_QUALITY_QUESTIONS.keys()))
-        primary_field = f'code_quality_{first_quality_key}'
-        response = supabase_client.table('reviewer-post-pr-review').select(
-            f'pr_url, {primary_field}'
-        ).eq('participant_id', participant_id).execute()
-
-        print(f"[CODE QUALITY CHECK] Found {len(response.data) if response.data else 0} entries for participant")
-
-        if response.data and len(response.data) > 0:
-            # Find matching entry by normalized URL
-            for entry in response.data:
-                entry_url = entry.get('pr_url', '').strip().rstrip('/')
-                if entry_url == normalized_url:
-                    print(f"[CODE QUALITY CHECK] Found matching entry for PR")
-                    value = entry.get(primary_field)
-                    if value and (not isinstance(value, str) or value.strip().lower() not in ['', 'not selected']):
-                        print(f"[CODE QUALITY CHECK] Primary field complete - returning True")
-                        return True
-                    print(f"[CODE QUALITY CHECK] Primary field missing - returning False")
-                    return False
-        print(f"[CODE QUALITY CHECK] No matching entry found - returning False")
-        return False
+        completion = _fetch_post_pr_review_completion(participant_id, normalize_pr_url(pr_url))
+        print(f"[COMPLETION CHECK] Participant {participant_id}, PR {pr_url}: {completion}")
+        return completion
     except Exception as e:
-        print(f"[CODE QUALITY CHECK] Error checking code quality completion: {e}")
+        print(f"[COMPLETION CHECK] Error checking post-PR review completion: {e}")
         import traceback
         traceback.print_exc()
-        return False
+        return _post_pr_review_completion(None)
 
 
-def check_ai_detection_completed(participant_id: str, pr_url: str):
-    """
-    Check if AI detection questions have been completed for a specific PR by querying Supabase.
+def check_nasa_tlx_completed(participant_id: str, pr_url: str):
+    """Return True if NASA TLX questions have been completed for a specific PR."""
+    return get_post_pr_review_completion(participant_id, pr_url)['nasa_tlx']
 
-    Args:
-        participant_id: The participant's ID
-        pr_url: The PR URL to check
 
-    Returns:
-        bool: True if AI detection questions are completed, False otherwise
-    """
-    if not supabase_client or not pr_url:
-        print(f"[AI DETECTION CHECK] Skipping check - client: {bool(supabase_client)}, pr_url: {pr_url}")
-        return False
+def check_code_quality_completed(participant_id: str, pr_url: str):
+    """Return True if code quality questions have been completed for a specific PR."""
+    return get_post_pr_review_completion(participant_id, pr_url)['code_quality']
 
-    try:
-        # Normalize URL for comparison
-        normalized_url = pr_url.strip().rstrip('/')
-        print(f"[AI DETECTION CHECK] Checking for participant {participant_id}, PR: {normalized_url}")
 
-        # Query the database for this participant - get all entries to check URL matching
-        response = supabase_client.table('reviewer-post-pr-review').select(
-            'pr_url, ai_likelihood'
-        ).eq('participant_id', participant_id).execute()
+def check_ai_detection_completed(participant_id: str, pr_url: str):
+    """Return True if AI detection questions have been completed for a specific PR."""
+    return get_post_pr_review_completion(participant_id, pr_url)['ai_detection']
 
-        print(f"[AI DETECTION CHECK] Found {len(response.data) if response.data else 0} entries for participant")
 
-        if response.data and len(response.data) > 0:
-            # Find matching entry by normalized URL
-            for entry in response.data:
-                entry_url = entry.get('pr_url', '').strip().rstrip('/')
-                if entry_url == normalized_url:
-                    print(f"[AI DETECTION CHECK] Found matching entry for PR")
-                    value = entry.get('ai_likelihood')
-                    if value and (not isinstance(value, str) or value.strip() != ''):
-                        print(f"[AI DETECTION CHECK] Primary field complete - returning True")
-                        return True
-                    print(f"[AI DETECTION CHECK] Primary field missing - returning False")
-                    return False
-        print(f"[AI DETECTION CHECK] No matching entry found - returning False")
-        return False
-    except Exception as e:
-        print(f"[AI DETECTION CHECK] Error checking AI detection completion: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+_INCOMPLETE_CHECK_COLUMNS = (
+    'pr_url, pr_key, nasa_tlx_mental_demand, code_quality_readability, ai_likelihood, ai_reasoning, ai_review_strategy'
+)
 
 
+def _find_incomplete_prs(reviewed_prs: list, review_entries: list) -> list:
+    """Return reviewed PRs whose post-PR-review row is missing or has unanswered sections."""
+    # Index review rows by normalized PR URL (first row wins, as before)
+    entries_by_url = {}
+    for entry in review_entries:
+        entry_key = entry.get('pr_key') or normalize_pr_url(entry.get('pr_url'))
+        entries_by_url.setdefault(entry_key, entry)
+
+    incomplete_prs = []
+    
+    for pr in reviewed_prs:
+        pr_url = pr.get('pr_url', '')
+        if not pr_url:
+            continue
+        
+        matching_entry = entries_by_url.get(normalize_pr_url(pr_url))
+        
+        # Check which fields are missing
+        missing_fields = []
+        
+        if not matching_entry:
+            missing_fields = ['nasa_tlx', 'code_quality', 'ai_detection']
+        else:
+            # Check NASA TLX
+            nasa_val = matching_entry.get('nasa_tlx_mental_demand')
+            if not nasa_val or (isinstance(nasa_val, str) and nasa_val.strip().lower() in ['', 'not selected']):
+                missing_fields.append('nasa_tlx')
+            
+            # Check code quality
+            cq_val = matching_entry.get('code_quality_readability')
+            if not cq_val or (isinstance(cq_val, str) and cq_val.strip().lower() in ['', 'not selected']):
+                missing_fields.append('code_quality')
+            
+            # Check AI detection
+            ai_likelihood = matching_entry.get('ai_likelihood')
+            ai_reasoning = matching_entry.get('ai_reasoning')
+            ai_strategy = matching_entry.get('ai_review_strategy')
+            
+            if not ai_likelihood or (isinstance(ai_likelihood, str) and ai_likelihood.strip().lower() in ['', 'not selected']):
+                missing_fields.append('ai_detection')
+            elif not ai_reasoning or (isinstance(ai_reasoning, str) and ai_reasoning.strip() == ''):
+                missing_fields.append('ai_detection')
+            elif not ai_strategy or (isinstance(ai_strategy, str) and ai_strategy.strip() == ''):
+                missing_fields.append('ai_detection')
+        
+        if missing_fields:
+            incomplete_prs.append({
+                'issue_id': pr.get('issue_id'),
+                'pr_url': pr_url,
+                'issue_url': pr.get('issue_url'),
+                'is_closed': pr.get('is_closed'),
+                'is_merged': pr.get('is_merged'),
+                'missing_fields': missing_fields
+            })
+    return incomplete_prs
+
+
+@_request_memoized
+@_ttl_cached(
+    READ_CACHE_TTL_SECONDS,
+    lambda args, _: {('reviewer-post-pr-review', args[0]), ('repo-issues', args[0])}
+)
 def get_prs_with_incomplete_responses(participant_id: str, repository: str):
     """
     Find PRs assigned to a reviewer that have incomplete post-PR-review responses.
@@ -1030,6 +1224,7 @@ def get_prs_with_incomplete_responses(participant_id: str, repository: str):
     Returns:
         dict with 'success', 'incomplete_prs' (list of PR dicts with missing fields), and 'error'
     """
+    supabase_client = get_supabase_client()
     contributor_client = get_contributor_supabase_client()
     if not contributor_client or not supabase_client:
         return {
@@ -1038,76 +1233,25 @@ def get_prs_with_incomplete_responses(participant_id: str, repository: str):
             'incomplete_prs': []
         }
     
-    try:
+    def fetch_reviewed_prs():
         # Get all PRs assigned to this reviewer that have been reviewed (is_reviewed=True)
-        response = contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).select(
+        return contributor_client.table(CONTRIBUTOR_TABLES['repo_issues']).select(
             'issue_id, pr_url, issue_url, is_reviewed, is_closed, is_merged'
         ).eq('repository', repository).eq('reviewer_id', participant_id).eq('reviewer_assigned', True).eq('is_reviewed', True).execute()
-        
-        if not response.data:
-            return {'success': True, 'incomplete_prs': [], 'error': None}
-        
-        incomplete_prs = []
-        
-        for pr in response.data:
-            pr_url = pr.get('pr_url', '')
-            if not pr_url:
-                continue
-            
-            # Check if this PR has complete post-PR-review responses
-            normalized_url = pr_url.strip().rstrip('/')
-            
-            # Query the reviewer's post-PR-review table for this PR
-            review_response = supabase_client.table('reviewer-post-pr-review').select(
-                'pr_url, nasa_tlx_mental_demand, code_quality_readability, ai_likelihood, ai_reasoning, ai_review_strategy'
-            ).eq('participant_id', participant_id).execute()
-            
-            # Find matching entry by URL
-            matching_entry = None
-            if review_response.data:
-                for entry in review_response.data:
-                    entry_url = (entry.get('pr_url') or '').strip().rstrip('/')
-                    if entry_url == normalized_url:
-                        matching_entry = entry
-                        break
-            
-            # Check which fields are missing
-            missing_fields = []
-            
-            if not matching_entry:
-                missing_fields = ['nasa_tlx', 'code_quality', 'ai_detection']
-            else:
-                # Check NASA TLX
-                nasa_val = matching_entry.get('nasa_tlx_mental_demand')
-                if not nasa_val or (isinstance(nasa_val, str) and nasa_val.strip().lower() in ['', 'not selected']):
-                    missing_fields.append('nasa_tlx')
-                
-                # Check code quality
-                cq_val = matching_entry.get('code_quality_readability')
-                if not cq_val or (isinstance(cq_val, str) and cq_val.strip().lower() in ['', 'not selected']):
-                    missing_fields.append('code_quality')
-                
-                # Check AI detection
-                ai_likelihood = matching_entry.get('ai_likelihood')
-                ai_reasoning = matching_entry.get('ai_reasoning')
-                ai_strategy = matching_entry.get('ai_review_strategy')
-                
-                if not ai_likelihood or (isinstance(ai_likelihood, str) and ai_likelihood.strip().lower() in ['', 'not selected']):
-                    missing_fields.append('ai_detection')
-                elif not ai_reasoning or (isinstance(ai_reasoning, str) and ai_reasoning.strip() == ''):
-                    missing_fields.append('ai_detection')
-                elif not ai_strategy or (isinstance(ai_strategy, str) and ai_strategy.strip() == ''):
-                    missing_fields.append('ai_detection')
-            
-            if missing_fields:
-                incomplete_prs.append({
-                    'issue_id': pr.get('issue_id'),
-                    'pr_url': pr_url,
-                    'issue_url': pr.get('issue_url'),
-                    'is_closed': pr.get('is_closed'),
-                    'is_merged': pr.get('is_merged'),
-                    'missing_fields': missing_fields
-                })
+
+    def fetch_review_entries():
+        # Get all of the reviewer's post-PR-review rows once, rather than once per PR
+        return supabase_client.table('reviewer-post-pr-review').select(
+            _INCOMPLETE_CHECK_COLUMNS
+        ).eq('participant_id', participant_id).execute()
+
+    try:
+        prs_future = _submit_in_request_scope(fetch_reviewed_prs)
+        entries_future = _submit_in_request_scope(fetch_review_entries)
+        response = prs_future.result()
+        review_response = entries_future.result()
+
+        incomplete_prs = _find_incomplete_prs(response.data or [], review_response.data or [])
         
         print(f"[INCOMPLETE CHECK] Found {len(incomplete_prs)} PRs with incomplete responses for {participant_id}")
         return {
@@ -1127,258 +1271,357 @@ def get_prs_with_incomplete_responses(participant_id: str, repository: str):
         }
 
 
+@dataclass
+class ParticipantSnapshot:
+    """
+    Everything routing needs about a participant, fetched in one parallel step.
+
+    Each field holds the same result dict the corresponding survey_data function
+    returns, so callers can treat the snapshot as a drop-in, in-memory source.
+    """
+    participant_id: str
+    repository: dict
+    progress: dict
+    assigned_pr: dict
+    assigned_prs: dict
+    completed_pr_closed_urls: set = field(default_factory=set)
+    post_pr_review_rows: list = field(default_factory=list)
+
+    def find_post_pr_review_entry(self, pr_url: str):
+        """Return the reviewer-post-pr-review row for a PR, if one was loaded."""
+        entries = self.post_pr_review_rows
+        target = normalize_pr_url(pr_url)
+        if not target:
+            return None
+        for entry in entries:
+            if normalize_pr_url(entry.get('pr_url')) == target:
+                return entry
+        return None
+
+    def post_pr_review_completion(self, pr_url: str) -> dict:
+        """Return section completion for a PR, computed from the loaded rows."""
+        return _post_pr_review_completion(self.find_post_pr_review_entry(pr_url))
+
+
+def load_participant_snapshot(participant_id: str) -> ParticipantSnapshot:
+    """
+    Fetch repository assignment, progress, assigned PRs and closed-survey URLs in parallel.
+
+    All queries are independent so they are issued at once; assigned PRs are loaded
+    by reviewer ID and scoped to the assigned repository in memory.
+
+    Args:
+        participant_id: The participant's ID
+
+    Returns:
+        ParticipantSnapshot
+    """
+    supabase_client = get_supabase_client()
+    contributor_client = get_contributor_supabase_client()
+
+    def fetch_reviewer_issues():
+        if not contributor_client:
+            return None
+        return _fetch_reviewer_issue_rows(contributor_client, participant_id)
+
+    futures = {
+        'repository': _submit_in_request_scope(get_repository_assignment, participant_id),
+        'closed_urls': _submit_in_request_scope(get_completed_pr_closed_surveys, participant_id),
+        'issues': _submit_in_request_scope(fetch_reviewer_issues),
+    }
+    if supabase_client:
+        # Only the columns routing reads; the row count doubles as the review count
+        futures['post_pr_review_rows'] = _submit_in_request_scope(
+            _safe_participant_query, 'reviewer-post-pr-review', participant_id, _POST_PR_REVIEW_STATUS_COLUMNS
+        )
+        for table_name in ('reviewer-post-pr-closed', 'reviewer-end-study'):
+            futures[table_name] = _submit_in_request_scope(_safe_participant_count, table_name, participant_id)
+
+    repo_result = futures['repository'].result()
+    completed_pr_closed_urls = futures['closed_urls'].result()
+
+    post_pr_review_rows = []
+    if not supabase_client:
+        progress_result = {'success': False, 'error': 'Database client not initialized', 'progress': None}
+    else:
+        try:
+            post_pr_review_rows = futures['post_pr_review_rows'].result()
+            progress = _build_progress(
+                len(post_pr_review_rows),
+                futures['reviewer-post-pr-closed'].result(),
+                futures['reviewer-end-study'].result(),
+            )
+            progress_result = {'success': True, 'progress': progress, 'error': None}
+        except Exception as e:
+            print(f"Error getting participant progress: {e}")
+            progress_result = {'success': False, 'error': f"Error getting progress: {str(e)}", 'progress': None}
+
+    repository = repo_result.get('repository')
+    try:
+        issues = futures['issues'].result()
+        if issues is None:
+            error = 'Contributor database client not initialized'
+            assigned_pr = {'success': False, 'pr': None, 'error': error}
+            assigned_prs = {'success': False, 'prs': [], 'error': error}
+        else:
+            repo_issues = [issue for issue in issues if issue.get('repository') == repository]
+            current = _select_current_assignment(repo_issues)
+            assigned_pr = {
+                'success': True,
+                'pr': _format_assigned_pr(current, repository) if current else None,
+                'error': None
+            }
+            assigned_prs = {
+                'success': True,
+                'prs': [_format_assigned_pr(issue, repository) for issue in repo_issues],
+                'error': None
+            }
+    except Exception as e:
+        print(f"Error loading assigned PRs: {e}")
+        assigned_pr = {'success': False, 'pr': None, 'error': str(e)}
+        assigned_prs = {'success': False, 'prs': [], 'error': str(e)}
+
+    return ParticipantSnapshot(
+        participant_id=participant_id,
+        repository=repo_result,
+        progress=progress_result,
+        assigned_pr=assigned_pr,
+        assigned_prs=assigned_prs,
+        completed_pr_closed_urls=completed_pr_closed_urls,
+        post_pr_review_rows=post_pr_review_rows,
+    )
+
+
+@dataclass
+class PRStatusViewModel:
+    """
+    What pr_status_page shows for a reviewer, built from one combined fetch.
+
+    completed_count is None when the review count could not be loaded.
+    """
+    participant_id: str
+    repository: str
+    completed_count: int = None
+    incomplete_prs: list = field(default_factory=list)
+    pr_choices: list = field(default_factory=list)
+
+
+def load_pr_status_view(participant_id: str, repository: str) -> PRStatusViewModel:
+    """
+    Load review progress, incomplete PRs and selectable PRs for the PR status page.
+
+    The reviewer's repo-issues rows, post-PR-review rows and closed-survey URLs are
+    fetched in parallel; progress, incomplete responses and the PR choices are all
+    derived from them in memory.
+
+    Args:
+        participant_id: The reviewer's participant ID
+        repository: The assigned repository
+
+    Returns:
+        PRStatusViewModel
+    """
+    contributor_client = get_contributor_supabase_client()
+    supabase_client = get_supabase_client()
+
+    futures = {'closed_urls': _submit_in_request_scope(get_completed_pr_closed_surveys, participant_id)}
+    if contributor_client:
+        futures['issues'] = _submit_in_request_scope(
+            _fetch_reviewer_issue_rows, contributor_client, participant_id, repository
+        )
+    if supabase_client:
+        futures['review_rows'] = _submit_in_request_scope(
+            _safe_participant_query, 'reviewer-post-pr-review', participant_id, _INCOMPLETE_CHECK_COLUMNS
+        )
+
+    view = PRStatusViewModel(participant_id=participant_id, repository=repository)
+    completed_pr_closed_urls = futures['closed_urls'].result()
+
+    review_rows = []
+    if 'review_rows' in futures:
+        try:
+            review_rows = futures['review_rows'].result()
+            view.completed_count = len(review_rows)
+        except Exception as e:
+            print(f"Error getting participant progress: {e}")
+
+    issues = []
+    if 'issues' in futures:
+        try:
+            issues = futures['issues'].result()
+        except Exception as e:
+            print(f"Error loading assigned PRs: {e}")
+
+    reviewed_issues = [issue for issue in issues if issue.get('is_reviewed')]
+    if 'review_rows' in futures:
+        view.incomplete_prs = _find_incomplete_prs(reviewed_issues, review_rows)
+
+    for issue in reviewed_issues:
+        pr = _format_assigned_pr(issue, repository)
+        is_done = pr.get('is_closed') or pr.get('is_merged')
+        if not is_done or pr.get('url') not in completed_pr_closed_urls:
+            view.pr_choices.append(pr)
+
+    return view
+
+
+def build_routing_state(snapshot: ParticipantSnapshot, survey_responses: dict = None) -> RoutingState:
+    """
+    Reduce a participant snapshot and session responses to the flags routing needs.
+
+    Args:
+        snapshot: ParticipantSnapshot from load_participant_snapshot
+        survey_responses: Optional dict of survey responses from session state
+
+    Returns:
+        RoutingState
+    """
+    session_responses = survey_responses if isinstance(survey_responses, dict) else {}
+    if not snapshot.repository.get('success'):
+        return RoutingState()
+
+    progress_result = snapshot.progress
+    progress_loaded = bool(progress_result.get('success') and progress_result.get('progress'))
+    progress = progress_result.get('progress') or {}
+    review_count = progress.get('post_pr_review_count', 0)
+
+    pr_result = snapshot.assigned_pr
+    pr_data = pr_result.get('pr') if pr_result.get('success') else None
+    if pr_data is None:
+        return RoutingState(
+            has_repository=True,
+            setup_complete=bool(session_responses.get('setup_checklist_complete', False)),
+            has_started_reviews=review_count > 0,
+        )
+
+    # Merged or closed PRs must have been reviewed
+    is_closed_or_merged = bool(pr_data.get('is_closed') or pr_data.get('is_merged'))
+    is_reviewed = bool(
+        pr_data.get('is_reviewed')
+        or session_responses.get('is_reviewed') == "Yes - I've submitted my review"
+        or is_closed_or_merged
+    )
+
+    # Every reviewed+closed PR needs its own post-pr-closed survey (matched per URL,
+    # not by count, to catch gaps when extra PRs were assigned)
+    closed_survey_urls = {normalize_pr_url(url) for url in snapshot.completed_pr_closed_urls}
+    assigned_prs = snapshot.assigned_prs.get('prs', []) if snapshot.assigned_prs.get('success') else []
+    reviewed_closed_prs = [
+        pr for pr in assigned_prs
+        if pr.get('is_reviewed') and (pr.get('is_closed') or pr.get('is_merged'))
+    ]
+    all_reviewed_prs_closed = bool(reviewed_closed_prs) and all(
+        normalize_pr_url(pr.get('url', '')) in closed_survey_urls for pr in reviewed_closed_prs
+    )
+
+    artifact_status_map = session_responses.get('artifact_upload_status', {})
+    issue_key = str(pr_data.get('issue_id') or pr_data.get('url') or 'current_pr')
+    completion = snapshot.post_pr_review_completion(pr_data.get('url'))
+
+    return RoutingState(
+        has_repository=True,
+        setup_complete=bool(session_responses.get('setup_checklist_complete', False)),
+        has_started_reviews=review_count > 0,
+        has_assigned_pr=True,
+        has_estimates=bool(pr_data.get('reviewer_estimate') and pr_data.get('new_contributor_estimate')),
+        is_reviewed=is_reviewed,
+        is_closed_or_merged=is_closed_or_merged,
+        progress_loaded=progress_loaded,
+        nasa_tlx_complete=completion['nasa_tlx'],
+        code_quality_complete=completion['code_quality'],
+        ai_detection_complete=completion['ai_detection'],
+        review_quota_met=review_count >= MIN_COMPLETED_REVIEWS,
+        all_reviewed_prs_closed=all_reviewed_prs_closed,
+        has_post_pr_closed=progress.get('post_pr_closed_count', 0) > 0,
+        artifact_complete=bool(artifact_status_map.get(issue_key, False)),
+        end_study_completed=bool(progress.get('end_study_completed')),
+    )
+
+
 def determine_current_page(participant_id: str, survey_responses: dict = None):
     """
     Determine the appropriate page for a participant based on their completion status.
 
+    Loads a ParticipantSnapshot and routes on it with the rules in routing.py.
+
     Args:
         participant_id: The participant's ID
         survey_responses: Optional dict of survey responses from session state
 
     Returns:
         int: The page number the participant should be on
-
-    Page mapping (new flow):
-        0: participant_id_page - Participant ID entry
-        2: setup_checklist_page - Reviewer setup checklist
-        3: pr_assignment_page - PR assignment and time estimates
-        4: review_submission_page - Confirm first review submitted
-        5: nasa_tlx_questions_page - NASA-TLX workload questions
-        6: code_quality_ratings_page - Code quality ratings
-        7: ai_detection_page - AI detection questions
-        8: pr_status_page - PR status check (can request another PR)
-        9: collaboration_questions_page - Collaboration questions (if PR closed/merged)
-        10: contributor_perception_page - Contributor perception questions
-        11: study_validation_page - Study validation
-        12: completion_page - Survey completion
     """
     if not participant_id:
         return 0  # No participant ID, start at beginning
 
     try:
-        # Get repository assignment
-        repo_result = get_repository_assignment(participant_id)
-        if not repo_result['success']:
-            return 0  # No valid repository assignment
-
-        assigned_repo = repo_result['repository']
-
-        # Require setup checklist completion before proceeding to PR assignment
-        # BUT skip checklist requirement if they've already completed a review
-        setup_complete = False
-        if isinstance(survey_responses, dict):
-            setup_complete = survey_responses.get('setup_checklist_complete', False)
-
-        # Check if they've already started reviewing (completed at least one review)
-        progress_result = get_participant_progress(participant_id)
-        has_started_reviews = False
-        if progress_result.get('success') and progress_result.get('progress'):
-            has_started_reviews = progress_result['progress'].get('post_pr_review_count', 0) > 0
-
-        if not setup_complete and not has_started_reviews:
-            return 2
-
-        # Check if PR is assigned and if estimates are provided
-        pr_result = get_assigned_pr_for_reviewer(participant_id, assigned_repo)
-        if not pr_result['success'] or pr_result['pr'] is None:
-            return 3  # No PR assigned yet, go to PR assignment page
-
-        pr_data = pr_result['pr']
-        session_responses = survey_responses if isinstance(survey_responses, dict) else {}
-        reviewer_estimate = pr_data.get('reviewer_estimate')
-        new_contributor_estimate = pr_data.get('new_contributor_estimate')
-        has_estimates = bool(reviewer_estimate and new_contributor_estimate)
-
-        print(f"[DEBUG] PR data: reviewer_estimate={reviewer_estimate}, new_contributor_estimate={new_contributor_estimate}, has_estimates={has_estimates}")
-
-        if not has_estimates:
-            print(f"[DEBUG] No estimates found, directing to page 3")
-            return 3  # PR assigned but no estimates, go to PR assignment page
-
-        # Check if initial review has been submitted (is_reviewed flag or survey response)
-        # Also consider PR merged/closed as evidence of review completion
-        is_reviewed = pr_data.get('is_reviewed')
-        is_closed = pr_data.get('is_closed')
-        is_merged = pr_data.get('is_merged')
-        if session_responses.get('is_reviewed') == "Yes - I've submitted my review":
-            is_reviewed = True
-        # If PR is already merged or closed, they must have reviewed it
-        if is_merged or is_closed:
-            is_reviewed = True
-        print(f"[DEBUG] Estimates found, checking is_reviewed={is_reviewed}, is_merged={is_merged}, is_closed={is_closed}")
-        if not is_reviewed:
-            print(f"[DEBUG] Review not submitted, directing to page 4")
-            return 4  # Estimates provided but review not submitted, go to review submission page
-
-        # Get progress data
-        progress_result = get_participant_progress(participant_id)
-        if not progress_result['success']:
-            return 5  # Error getting progress, start with NASA-TLX questions
-
-        progress = progress_result.get('progress') or {}
-        completed_pr_reviews = progress.get('post_pr_review_count', 0)
-        closed_pr_reviews = progress.get('post_pr_closed_count', 0)
-        post_pr_review_entries = progress.get('post_pr_review_data') or []
-        current_pr_url = pr_data.get('url')
-
-        # Check if EVERY reviewed+closed PR has a post-pr-closed survey (per-PR URL match,
-        # not just a count comparison, to catch gaps when extra PRs were assigned).
-        _norm_url = lambda u: (u or '').strip().rstrip('/')
-        _closed_survey_urls = {_norm_url(u) for u in get_completed_pr_closed_surveys(participant_id)}
-        _assigned_all = list_assigned_prs_for_reviewer(participant_id, assigned_repo)
-        _all_assigned_prs = _assigned_all.get('prs', []) if _assigned_all.get('success') else []
-        _reviewed_closed_prs = [
-            pr for pr in _all_assigned_prs
-            if pr.get('is_reviewed') and (pr.get('is_closed') or pr.get('is_merged'))
-        ]
-        all_reviewed_prs_closed = (
-            len(_reviewed_closed_prs) > 0 and
-            all(_norm_url(pr.get('url', '')) in _closed_survey_urls for pr in _reviewed_closed_prs)
-        )
-        print(
-            f"[DEBUG] all_reviewed_prs_closed={all_reviewed_prs_closed} "
-            f"({len(_closed_survey_urls)} closed surveys / {len(_reviewed_closed_prs)} reviewed+closed PRs)"
-        )
+        snapshot = load_participant_snapshot(participant_id)
+        rule, page = resolve_route(build_routing_state(snapshot, survey_responses))
+        print(f"[ROUTE] {participant_id} -> page {page} ({rule})")
+        return page
 
-        def normalize_url(url: str) -> str:
-            if not url:
-                return ''
-            return url.strip().rstrip('/')
-
-        def find_post_pr_entry(entries, pr_url):
-            if not pr_url:
-                return None
-            normalized_target = normalize_url(pr_url)
-            for entry in entries:
-                entry_url = normalize_url(entry.get('pr_url'))
-                if entry_url and entry_url == normalized_target:
-                    return entry
-            return None
+    except Exception as e:
+        print(f"Error determining current page: {e}")
+        import traceback
+        traceback.print_exc()
+        return 0  # Default to start on error
+
+
+# Saved page -> post-PR-review section answered on that page
+_RESUME_REVIEW_SECTIONS = {5: 'nasa_tlx', 6: 'code_quality', 7: 'ai_detection'}
+# Saved page -> reviewer-post-pr-closed column that page's submit fills in
+_RESUME_CLOSED_COLUMNS = {9: 'collaboration_description', 10: 'perception_effort'}
 
-        def is_valid_response(value):
-            if value is None:
-                return False
-            if isinstance(value, str):
-                stripped = value.strip()
-                if not stripped or stripped.lower() == "not selected":
-                    return False
-            return True
-
-        def has_answers(entry, keys, prefix=""):
-            if not entry or not isinstance(entry, dict):
-                return False
-            for key in keys:
-                column = f"{prefix}{key}" if prefix else key
-                value = entry.get(column)
-                if not is_valid_response(value):
-                    return False
-            return True
-
-        def collect_sources(*sources):
-            return [source for source in sources if isinstance(source, dict)]
-
-        def get_nested_dict(source, key):
-            if isinstance(source, dict):
-                value = source.get(key)
-                if isinstance(value, dict):
-                    return value
-            return None
 
-        def sources_have_answers(sources, keys, prefix=""):
-            for source in sources:
-                if has_answers(source, keys, prefix=prefix):
-                    return True
+def _saved_page_section_complete(participant_id: str, saved_page: int, survey_responses: dict) -> bool:
+    """Check with one query whether the section on the saved page has already been saved."""
+    pr_url = survey_responses.get('pr_url')
+    if saved_page in _RESUME_REVIEW_SECTIONS:
+        if not pr_url:
             return False
+        return _fetch_post_pr_review_completion(participant_id, normalize_pr_url(pr_url))[
+            _RESUME_REVIEW_SECTIONS[saved_page]
+        ]
+    if saved_page in _RESUME_CLOSED_COLUMNS:
+        if not pr_url:
+            return False
+        column = _RESUME_CLOSED_COLUMNS[saved_page]
+        response = get_supabase_client().table('reviewer-post-pr-closed').select(column).eq(
+            'participant_id', participant_id
+        ).eq('pr_key', normalize_pr_url(pr_url)).limit(1).execute()
+        return bool(response.data) and _is_answered(response.data[0].get(column))
+    if saved_page == 11:
+        return _safe_participant_count('reviewer-end-study', participant_id) > 0
+    return False
 
-        current_post_pr_entry = find_post_pr_entry(post_pr_review_entries, current_pr_url)
-        if not current_post_pr_entry and (not current_pr_url or current_pr_url in ('', 'N/A')):
-            # Fallback: if no PR URL is available, use the most recent entry
-            if post_pr_review_entries:
-                current_post_pr_entry = sorted(
-                    post_pr_review_entries,
-                    key=lambda e: e.get('updated_at') or e.get('created_at') or '',
-                    reverse=True
-                )[0]
-
-        session_assigned_pr = session_responses.get('assigned_pr') if session_responses else None
-        shared_sources = collect_sources(current_post_pr_entry, pr_data, session_assigned_pr, session_responses)
-
-        review_quota_met = completed_pr_reviews >= MIN_COMPLETED_REVIEWS
-        artifact_status_map = session_responses.get('artifact_upload_status', {}) if isinstance(session_responses, dict) else {}
-        issue_key = str(pr_data.get('issue_id') or pr_data.get('url') or 'current_pr')
-        artifact_complete = artifact_status_map.get(issue_key, False)
-
-        # Check NASA TLX completion directly from database
-        nasa_complete = check_nasa_tlx_completed(participant_id, current_pr_url)
-        print(f"[DEBUG] NASA TLX completed from database: {nasa_complete}")
-        if not nasa_complete:
-            return 5  # NASA-TLX questions incomplete for this PR
-
-        # Check code quality completion directly from database
-        code_quality_complete = check_code_quality_completed(participant_id, current_pr_url)
-        print(f"[DEBUG] Code quality completed from database: {code_quality_complete}")
-        if not code_quality_complete:
-            return 6  # Code quality ratings incomplete
-
-        # Check AI detection completion directly from database
-        ai_detection_complete = check_ai_detection_completed(participant_id, current_pr_url)
-        print(f"[DEBUG] AI detection completed from database: {ai_detection_complete}")
-        if not ai_detection_complete:
-            return 7  # AI detection questions incomplete
-
-        if review_quota_met:
-            print(
-                f"[DEBUG] Reviewer quota met ({completed_pr_reviews}/{MIN_COMPLETED_REVIEWS}). Proceeding to end-of-study checks."
-            )
-            if not all_reviewed_prs_closed:
-                print(
-                    f"[DEBUG] Reviewer still has open PRs ({closed_pr_reviews}/{completed_pr_reviews}). Redirecting to PR status page."
-                )
-                return 8
-            if not artifact_complete:
-                print(f"[DEBUG] Awaiting artifact uploads for issue_key={issue_key}.")
-                return 11
-            if not progress.get('end_study_completed'):
-                return 11  # Go to study validation
-            return 12  # Completion page once validation done
-
-        # After post-PR review questions, go to PR status page
-        # Check if PR is closed/merged
-        if not is_closed and not is_merged:
-            return 8  # PR not closed yet, go to PR status page
-
-        # Check post-PR closed completion
-        if progress.get('post_pr_closed_count', 0) == 0:
-            return 9  # PR closed but no post-PR closed data, go to collaboration questions
-
-        if not artifact_complete:
-            print(f"[DEBUG] Awaiting artifact uploads for issue_key={issue_key}.")
-            return 11
-
-        # Ensure minimum number of PR reviews before end-of-study
-        if completed_pr_reviews < MIN_COMPLETED_REVIEWS:
-            print(
-                f"[DEBUG] Completed PR reviews {completed_pr_reviews}/{MIN_COMPLETED_REVIEWS}. Redirecting to PR status page."
-            )
-            return 8  # Need to complete additional PR reviews
 
-        # Check end-study completion
-        if not progress.get('end_study_completed'):
-            return 11  # Post-PR closed complete, go to study validation
+def resolve_resumed_page(participant_id: str, saved_page: int, survey_responses: dict = None):
+    """
+    Check a restored session's saved page against the participant's current data.
 
-        if not all_reviewed_prs_closed:
-            print(
-                f"[DEBUG] Cannot finish - pending PR closed surveys. Redirecting to PR status page."
-            )
-            return 8
+    The saved page is trusted unless its own section has already been saved (e.g.
+    a checkpoint was dropped after the submit), which one targeted query detects.
+    Only then is the participant re-routed from a full snapshot. Errors keep the saved page.
 
-        return 12  # Go to completion page
+    Args:
+        participant_id: The participant's ID
+        saved_page: Page stored in reviewer-sessions
+        survey_responses: Restored survey responses
 
+    Returns:
+        int: The page number the participant should resume on
+    """
+    survey_responses = survey_responses if isinstance(survey_responses, dict) else {}
+    try:
+        if not _saved_page_section_complete(participant_id, saved_page, survey_responses):
+            return saved_page
+        snapshot = load_participant_snapshot(participant_id)
+        rule, page = resolve_route(build_routing_state(snapshot, survey_responses))
     except Exception as e:
-        print(f"Error determining current page: {e}")
-        import traceback
-        traceback.print_exc()
-        return 0  # Default to start on error
+        print(f"[ROUTE] Could not check saved page for {participant_id}: {e}")
+        return saved_page
+    print(f"[ROUTE] {participant_id}: saved page {saved_page} is already complete, resuming on page {page} ({rule})")
+    return page
 
 
 def save_reviewer_estimate_for_issue(issue_id: int, reviewer_estimate: str, new_contributor_estimate: str):
@@ -1409,6 +1652,7 @@ def save_reviewer_estimate_for_issue(issue_id: int, reviewer_estimate: str, new_
             .update(update_fields) \
             .eq('issue_id', issue_id) \
             .execute()
+        _invalidate_issue(issue_id, result.data)
 
         if result.data and len(result.data) > 0:
             return {
@@ -1427,6 +1671,32 @@ def save_reviewer_estimate_for_issue(issue_id: int, reviewer_estimate: str, new_
         }
 
 
+_UNSERIALIZABLE = object()
+
+
+def _json_safe(value):
+    """
+    Convert survey responses to JSON-compatible values for the sessions table.
+
+    Sets and tuples become lists and dates become ISO strings; values that cannot be
+    represented (e.g. uploaded file objects) are dropped.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        safe = {}
+        for key, item in value.items():
+            item = _json_safe(item)
+            if item is not _UNSERIALIZABLE:
+                safe[str(key)] = item
+        return safe
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [item for item in map(_json_safe, value) if item is not _UNSERIALIZABLE]
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return _UNSERIALIZABLE
+
+
 def save_session_state(participant_id: str, current_page: int, survey_responses: dict):
     """
     Save the current session state to the reviewer-sessions table.
@@ -1439,6 +1709,7 @@ def save_session_state(participant_id: str, current_page: int, survey_responses:
     Returns:
         dict with 'success' and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
@@ -1456,22 +1727,16 @@ def save_session_state(participant_id: str, current_page: int, survey_responses:
             'session_id': session_id,
             'participant_id': participant_id,
             'current_page': str(current_page),
+            'survey_responses': _json_safe(survey_responses or {}),
             'updated_at': datetime.now(timezone.utc).isoformat()
         }
         
-        # Check if participant already has a session
-        existing = supabase_client.table('reviewer-sessions').select('session_id').eq('participant_id', participant_id).execute()
-        
-        if existing.data and len(existing.data) > 0:
-            # Update existing session
-            result = supabase_client.table('reviewer-sessions').update(data).eq('participant_id', participant_id).execute()
-            print(f"Updated session for participant: {participant_id}, page: {current_page}")
-        else:
-            # Insert new session
-            data['started_at'] = datetime.now(timezone.utc).isoformat()
-            data['created_at'] = datetime.now(timezone.utc).isoformat()
-            result = supabase_client.table('reviewer-sessions').insert(data).execute()
-            print(f"Created new session for participant: {participant_id}, page: {current_page}")
+        # Single atomic write on the participant_id unique key;
+        # started_at and created_at are filled by their column defaults on first insert
+        result = supabase_client.table('reviewer-sessions').upsert(
+            data, on_conflict='participant_id'
+        ).execute()
+        print(f"Saved session for participant: {participant_id}, page: {current_page}")
         
         return {
             'success': True,
@@ -1488,6 +1753,79 @@ def save_session_state(participant_id: str, current_page: int, survey_responses:
         }
 
 
+_checkpoint_condition = threading.Condition()
+_pending_checkpoints = {}
+_checkpoint_in_flight = set()
+_checkpoint_worker = None
+
+
+def queue_session_checkpoint(participant_id: str, current_page: int, survey_responses: dict):
+    """
+    Queue a session checkpoint to be written by the background writer.
+
+    Repeated checkpoints for a participant are coalesced into the latest one, and
+    a participant's writes are applied in the order they were queued, one at a
+    time. Use flush_session_checkpoints() before reading the session back.
+
+    Args:
+        participant_id: The participant's ID
+        current_page: Current page number
+        survey_responses: Dictionary of all survey responses (snapshotted now)
+    """
+    global _checkpoint_worker
+    snapshot = _json_safe(survey_responses or {})
+    with _checkpoint_condition:
+        # Re-insert so the dict stays ordered by most recent queue time
+        _pending_checkpoints.pop(participant_id, None)
+        _pending_checkpoints[participant_id] = (current_page, snapshot)
+        if _checkpoint_worker is None or not _checkpoint_worker.is_alive():
+            _checkpoint_worker = threading.Thread(
+                target=_run_checkpoint_writer, name='session-checkpoint-writer', daemon=True
+            )
+            _checkpoint_worker.start()
+        _checkpoint_condition.notify_all()
+
+
+def _run_checkpoint_writer():
+    """Write queued checkpoints one at a time, oldest participant first."""
+    while True:
+        with _checkpoint_condition:
+            while not _pending_checkpoints:
+                _checkpoint_condition.wait()
+            participant_id = next(iter(_pending_checkpoints))
+            current_page, survey_responses = _pending_checkpoints.pop(participant_id)
+            _checkpoint_in_flight.add(participant_id)
+        try:
+            result = save_session_state(participant_id, current_page, survey_responses)
+            if not result['success']:
+                print(f"[CHECKPOINT] Failed for {participant_id}: {result['error']}")
+        except Exception as e:
+            print(f"[CHECKPOINT] Failed for {participant_id}: {e}")
+        finally:
+            with _checkpoint_condition:
+                _checkpoint_in_flight.discard(participant_id)
+                _checkpoint_condition.notify_all()
+
+
+def flush_session_checkpoints(participant_id: str = None, timeout: float = 10.0) -> bool:
+    """
+    Wait until queued checkpoints (for one participant, or all) have been written.
+
+    Returns:
+        bool: True if everything was flushed before the timeout
+    """
+    def pending():
+        if participant_id is None:
+            return bool(_pending_checkpoints or _checkpoint_in_flight)
+        return participant_id in _pending_checkpoints or participant_id in _checkpoint_in_flight
+
+    with _checkpoint_condition:
+        return _checkpoint_condition.wait_for(lambda: not pending(), timeout=timeout)
+
+
+atexit.register(flush_session_checkpoints)
+
+
 def load_session_state(participant_id: str):
     """
     Load the saved session state for a participant.
@@ -1498,6 +1836,7 @@ def load_session_state(participant_id: str):
     Returns:
         dict with 'success', 'current_page', 'survey_responses', and 'error' keys
     """
+    supabase_client = get_supabase_client()
     if not supabase_client:
         return {
             'success': False,
@@ -1506,17 +1845,24 @@ def load_session_state(participant_id: str):
             'survey_responses': {}
         }
     
+    # Make sure a queued checkpoint isn't about to overwrite what we read
+    flush_session_checkpoints(participant_id)
+
     try:
-        # Get the most recent session for this participant
-        response = supabase_client.table('reviewer-sessions').select('*').eq('participant_id', participant_id).order('updated_at', desc=True).limit(1).execute()
+        # One row per participant (unique key), so a single read restores everything
+        response = supabase_client.table('reviewer-sessions')\
+            .select('current_page, survey_responses')\
+            .eq('participant_id', participant_id)\
+            .limit(1)\
+            .execute()
         
         if response.data and len(response.data) > 0:
             session = response.data[0]
-            current_page = int(session.get('current_page', 0))
+            current_page = int(session.get('current_page') or 0)
             
-            # No survey_responses column in reviewer-sessions schema
-            # Provide participant_id in responses so pages relying on it can resume smoothly
-            survey_responses = {'participant_id': participant_id}
+            # Sessions saved before the survey_responses column existed restore only the ID
+            survey_responses = session.get('survey_responses') or {}
+            survey_responses['participant_id'] = participant_id
             
             print(f"Loaded session for participant: {participant_id}, page: {current_page}")
             return {
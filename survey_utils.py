@@ -2,16 +2,15 @@
 Utility functions for the reviewer survey application.
 """
 
+import functools
 import io
 import wave
 from urllib.parse import urlparse
 
 import streamlit as st
-import openai
 
-
-# Initialize OpenAI client
-openai_client = openai.OpenAI(api_key=st.secrets.get('OPENAI_KEY', ''))
+from clients import get_openai_client
+from drive_upload import get_upload_job
 
 
 HIDDEN_PAGES = {1}
@@ -38,8 +37,41 @@ def normalize_page(page_number: int) -> int:
     return page_number
 
 
-def _go_to_page(target_page: int):
+def fragment(func=None, *, run_every=None):
+    """
+    Run func as a Streamlit fragment so its widgets rerun only func, not the page.
+
+    Falls back to experimental_fragment on older Streamlit and to a plain call when
+    neither exists. Each fragment run starts a fresh request memo, since a
+    fragment-only rerun does not pass through main(). With run_every (seconds) the
+    fragment also reruns on a timer; the plain-call fallback ignores it.
+    """
+    if func is None:
+        return functools.partial(fragment, run_every=run_every)
+    fragment_api = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if fragment_api is None:
+        return func
+
+    @functools.wraps(func)
+    def scoped(*args, **kwargs):
+        from survey_data import begin_request_scope
+        begin_request_scope()
+        return func(*args, **kwargs)
+
+    if run_every is None:
+        return fragment_api(scoped)
+    return fragment_api(scoped, run_every=run_every)
+
+
+def go_to_page(target_page: int):
+    """
+    Switch to a page and rerun, starting a new page visit.
+
+    Every navigation goes through here, so '_page_visit_id' changes exactly when the
+    participant arrives on a page; pages key per-visit caches on it.
+    """
     st.session_state['page'] = target_page
+    st.session_state['_page_visit_id'] = st.session_state.get('_page_visit_id', 0) + 1
     st.rerun()
 
 
@@ -47,14 +79,14 @@ def next_page():
     """Navigate to the next visible page."""
     current_page = st.session_state.get('page', 0)
     target_page = _compute_target_page(current_page, 'next')
-    _go_to_page(target_page)
+    go_to_page(target_page)
 
 
 def previous_page():
     """Navigate to the previous visible page."""
     current_page = st.session_state.get('page', 0)
     target_page = _compute_target_page(current_page, 'back')
-    _go_to_page(target_page)
+    go_to_page(target_page)
 
 
 def save_and_navigate(direction: str, **responses):
@@ -74,10 +106,54 @@ def save_and_navigate(direction: str, **responses):
     target_page = _compute_target_page(current_page, direction)
 
     if participant_id:
-        from survey_data import save_session_state
-        save_session_state(participant_id, target_page, st.session_state['survey_responses'])
+        # Written in the background so navigation doesn't wait on the network
+        from survey_data import queue_session_checkpoint
+        queue_session_checkpoint(participant_id, target_page, st.session_state['survey_responses'])
+
+    go_to_page(target_page)
+
+
+def get_section_completion(participant_id: str, pr_url: str) -> dict:
+    """
+    Return post-PR-review section completion for a PR from the session's ledger.
+
+    The ledger is keyed by PR and checked against the database the first time the
+    PR is seen in this session; record_section_completion keeps it current after
+    each successful save, so later visits don't query again.
+
+    Returns:
+        dict mapping 'nasa_tlx', 'code_quality' and 'ai_detection' to bool
+    """
+    from survey_data import get_post_pr_review_completion, normalize_pr_url
+
+    ledger = st.session_state.setdefault('_completion_ledger', {})
+    pr_key = normalize_pr_url(pr_url)
+    completion = ledger.get(pr_key)
+    if completion is None:
+        completion = ledger[pr_key] = get_post_pr_review_completion(participant_id, pr_url)
+    return completion
 
-    _go_to_page(target_page)
+
+def record_section_completion(pr_url: str, section: str):
+    """Mark a post-PR-review section complete in the ledger after a successful save."""
+    from survey_data import normalize_pr_url
+
+    ledger = st.session_state.setdefault('_completion_ledger', {})
+    completion = ledger.get(normalize_pr_url(pr_url))
+    if completion is not None:
+        completion[section] = True
+
+
+def get_post_pr_review_draft(participant_id: str, pr_url: str):
+    """Return this session's PostPRReviewDraft for a PR, creating it on first use."""
+    from survey_data import PostPRReviewDraft, normalize_pr_url
+
+    drafts = st.session_state.setdefault('_post_pr_review_drafts', {})
+    pr_key = normalize_pr_url(pr_url)
+    draft = drafts.get(pr_key)
+    if draft is None or draft.participant_id != participant_id:
+        draft = drafts[pr_key] = PostPRReviewDraft(participant_id, pr_url)
+    return draft
 
 
 def validate_required_fields(*fields):
@@ -121,7 +197,7 @@ def get_audio_duration(file):
         return None
 
 
-def record_audio(question_key, min_duration=20, max_duration=600):
+def record_audio(question_key, min_duration=20, max_duration=600, in_form=False):
     """
     Record and transcribe audio for a question.
     
@@ -129,10 +205,19 @@ def record_audio(question_key, min_duration=20, max_duration=600):
         question_key: Unique key for the question
         min_duration: Minimum audio duration in seconds
         max_duration: Maximum audio duration in seconds
+        in_form: Use a form submit button for Transcribe; must be called inside an st.form
         
     Returns:
         The transcribed (and optionally edited) text, or None if not yet completed
     """
+    if in_form:
+        return _record_audio(question_key, min_duration, max_duration, in_form=True)
+    # Outside a form, recording and transcribing rerun only this widget
+    return _record_audio_fragment(question_key, min_duration, max_duration)
+
+
+def _record_audio(question_key, min_duration, max_duration, in_form=False):
+    """Render the recorder, Transcribe button and editable transcript."""
     work_audio = None
     
     # Prefer stable API if available
@@ -151,7 +236,12 @@ def record_audio(question_key, min_duration=20, max_duration=600):
     else:
         st.info("Audio recording is not supported in this Streamlit version.")
 
-    if st.button("Transcribe", key=f"transcript_{question_key}"):
+    if in_form:
+        transcribe_clicked = st.form_submit_button("Transcribe", key=f"transcript_{question_key}")
+    else:
+        transcribe_clicked = st.button("Transcribe", key=f"transcript_{question_key}")
+
+    if transcribe_clicked:
         if work_audio:
             # Read the audio bytes
             audio_bytes = work_audio.read()
@@ -172,7 +262,7 @@ def record_audio(question_key, min_duration=20, max_duration=600):
                     audio_file.seek(0)
                     if not hasattr(audio_file, 'name'):
                         audio_file.name = 'audio.wav'
-                    transcription = openai_client.audio.transcriptions.create(
+                    transcription = get_openai_client().audio.transcriptions.create(
                         model='whisper-1',
                         file=audio_file
                     )
@@ -195,6 +285,9 @@ def record_audio(question_key, min_duration=20, max_duration=600):
     return None
 
 
+_record_audio_fragment = fragment(_record_audio)
+
+
 def extract_repo_url(pr_url: str) -> str:
     """Extract the base repository URL from a GitHub pull request URL."""
     if pr_url is None:
@@ -213,3 +306,121 @@ def extract_repo_url(pr_url: str) -> str:
     scheme = parsed.scheme or 'https'
     netloc = parsed.netloc or 'github.com'
     return f"{scheme}://{netloc}/{owner}/{repo}"
+
+
+UPLOAD_POLL_SECONDS = 2
+# Page each artifact step is uploaded from, where a failed upload sends the reviewer back to
+UPLOAD_RETRY_PAGES = {
+    'initial_review': 4,  # review_submission_page
+    'final_review': 8,    # pr_status_page
+}
+
+
+def _set_artifact_step(step: str, issue_id, complete: bool):
+    """Record whether a PR's initial_review or final_review artifact step is complete."""
+    responses = st.session_state['survey_responses']
+    is_current_pr = str(responses.get('issue_id')) == str(issue_id)
+    if step == 'initial_review':
+        if is_current_pr:
+            responses['artifacts_uploaded'] = complete
+        return
+    artifact_map = responses.setdefault('artifact_upload_status', {})
+    if issue_id is not None:
+        artifact_map[str(issue_id)] = complete
+    if is_current_pr:
+        responses['artifact_upload_complete'] = complete
+
+
+def track_upload(job_id: str, step: str, issue_id):
+    """
+    Record an artifact step as pending on a background upload.
+
+    The step stays incomplete until the job is done; if it fails, the step is rolled
+    back and the reviewer is sent back to re-upload (see _upload_progress_fragment).
+    Pending uploads live in survey_responses, so they are checkpointed with the session.
+
+    Args:
+        job_id: ID returned by drive_upload.submit_upload
+        step: 'initial_review' or 'final_review'
+        issue_id: Issue the artifact belongs to
+    """
+    pending = st.session_state['survey_responses'].setdefault('pending_uploads', {})
+    pending[job_id] = {'step': step, 'issue_id': issue_id}
+    _set_artifact_step(step, issue_id, False)
+
+
+def _format_megabytes(num_bytes) -> str:
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+def _finish_upload(job_id: str, upload: dict, job):
+    """Settle a finished (or lost) upload's step; returns the page to re-upload from, if any."""
+    responses = st.session_state['survey_responses']
+    responses['pending_uploads'].pop(job_id, None)
+    if job is not None and job.state == 'cancelled':
+        # Replaced by a newer upload of a different file, which tracks the step now
+        return None
+    # Cached views that show artifact status compare this counter (e.g. pr_status_page)
+    st.session_state['_uploads_finished'] = st.session_state.get('_uploads_finished', 0) + 1
+    if job is not None and job.state == 'done':
+        _set_artifact_step(upload['step'], upload['issue_id'], True)
+        st.toast(f"✅ {job.filename} uploaded")
+        retry_page = None
+    else:
+        _set_artifact_step(upload['step'], upload['issue_id'], False)
+        st.session_state.setdefault('_failed_uploads', []).append({
+            'job_id': job_id,
+            'filename': job.filename if job else 'your file',
+            'error': job.error if job else 'the upload was interrupted',
+        })
+        is_current_pr = str(responses.get('issue_id')) == str(upload['issue_id'])
+        retry_page = UPLOAD_RETRY_PAGES.get(upload['step']) if is_current_pr else None
+
+    participant_id = responses.get('participant_id')
+    if participant_id:
+        from survey_data import queue_session_checkpoint
+        queue_session_checkpoint(participant_id, retry_page or st.session_state.get('page', 0), responses)
+    return retry_page
+
+
+@fragment(run_every=UPLOAD_POLL_SECONDS)
+def _upload_progress_fragment():
+    failed = st.session_state.get('_failed_uploads', [])
+    for failure in list(failed):
+        st.error(
+            f"Upload of {failure['filename']} failed: {failure['error']}. "
+            "Please upload it again, or use the Google Form for large files."
+        )
+        if st.button("Dismiss", key=f"dismiss_upload_{failure['job_id']}"):
+            failed.remove(failure)
+
+    pending = st.session_state['survey_responses'].get('pending_uploads') or {}
+    retry_page = None
+    for job_id, upload in list(pending.items()):
+        job = get_upload_job(job_id)
+        if job is None or job.finished:
+            retry_page = _finish_upload(job_id, upload, job) or retry_page
+            continue
+
+        progress = job.progress()
+        if job.state == 'queued':
+            text = f"Waiting to upload {job.filename}…"
+        else:
+            text = (
+                f"Uploading {job.filename}: {_format_megabytes(progress['bytes_sent'])} of "
+                f"{_format_megabytes(progress['total_bytes'])}"
+            )
+            if progress['rate']:
+                text += f" · {_format_megabytes(progress['rate'])}/s"
+            if progress['eta'] is not None:
+                text += f" · about {int(progress['eta']) + 1}s left"
+        st.progress(progress['fraction'], text=text)
+
+    if retry_page is not None and st.session_state.get('page') != retry_page:
+        go_to_page(retry_page)
+
+
+def upload_progress_panel():
+    """Render this participant's background uploads, polling while any are pending or failed."""
+    if st.session_state['survey_responses'].get('pending_uploads') or st.session_state.get('_failed_uploads'):
+        _upload_progress_fragment()
@@ -0,0 +1,196 @@
+"""Shared pytest setup: make the app's top-level modules importable from tests/."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Prepended to scripts run by run_stubbed_import_script: client libraries import as
+# empty stubs and st.secrets records reads, so import costs don't depend on what is installed
+_STUBBED_IMPORT_PRELUDE = '''
+import importlib
+import importlib.abc
+import importlib.machinery
+import json
+import sys
+import time
+import types
+
+STUBBED = ('supabase', 'postgrest', 'openai', 'googleapiclient', 'google.auth', 'google.oauth2')
+
+
+def is_stubbed(name):
+    return any(name == prefix or name.startswith(prefix + '.') for prefix in STUBBED)
+
+
+class StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve an empty package for any stubbed module that gets imported."""
+
+    def find_spec(self, fullname, path, target=None):
+        if is_stubbed(fullname):
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        pass
+
+
+class RecordingSecrets(dict):
+    """Stand-in for st.secrets that records every key read."""
+
+    reads = []
+
+    def __getitem__(self, key):
+        self.reads.append(key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        self.reads.append(key)
+        return default
+
+
+# streamlit itself is loaded before timing starts; it depends on google.protobuf, not the stubs
+import streamlit
+streamlit.secrets = RecordingSecrets()
+sys.meta_path.insert(0, StubFinder())
+
+'''
+
+
+def run_stubbed_import_script(script: str) -> dict:
+    """Run script in a fresh interpreter after the stub prelude; return its last line parsed as JSON."""
+    completed = subprocess.run(
+        [sys.executable, '-c', _STUBBED_IMPORT_PRELUDE + script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class FakeChunkRequest:
+    """Stand-in for a resumable files().create request that accepts every chunk."""
+
+    def __init__(self, media, on_chunk=None):
+        self.media = media
+        self.on_chunk = on_chunk
+        self.resumable_uri = None
+        self.resumable_progress = 0
+        self.http = None
+
+    def next_chunk(self):
+        from types import SimpleNamespace
+        data = self.media.getbytes(self.resumable_progress, self.media.chunksize())
+        if self.on_chunk:
+            self.on_chunk(len(data))
+        self.resumable_progress += len(data)
+        if self.resumable_progress >= self.media.size():
+            return None, {'id': 'file-id', 'webViewLink': 'https://drive.example/file-id'}
+        return SimpleNamespace(resumable_progress=self.resumable_progress), None
+
+
+class FakeDriveService:
+    """Minimal Drive v3 service: files().create(...) returns a FakeChunkRequest."""
+
+    def __init__(self, on_chunk=None):
+        self.on_chunk = on_chunk
+
+    def files(self):
+        return self
+
+    def create(self, body=None, media_body=None, fields=None, supportsAllDrives=None):
+        return FakeChunkRequest(media_body, self.on_chunk)
+
+
+@pytest.fixture
+def fake_drive(monkeypatch):
+    """Route drive_upload to a FakeDriveService with every folder already resolved."""
+    pytest.importorskip('googleapiclient.http')
+    import drive_upload
+
+    service = FakeDriveService()
+    monkeypatch.setattr(drive_upload, 'get_drive_service', lambda: service)
+    monkeypatch.setattr(
+        drive_upload, '_resolve_folder_path', lambda service, base_folder_id, subfolders, resolved_keys: 'parent-id'
+    )
+    return service
+
+
+class FakeQuery:
+    """Chainable PostgREST query over in-memory rows, logged on execute."""
+
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+        self.columns = '*'
+        self.count = None
+        self.head = False
+        self.filters = []
+        self.row_limit = None
+
+    def select(self, columns='*', count=None, head=None):
+        self.columns, self.count, self.head = columns, count, bool(head)
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in set(values))
+        return self
+
+    def limit(self, row_limit):
+        self.row_limit = row_limit
+        return self
+
+    def execute(self):
+        from types import SimpleNamespace
+        if self.table_name in self.client.failing_tables:
+            raise RuntimeError(f"{self.table_name} unavailable")
+        rows = [row for row in self.client.tables.get(self.table_name, []) if all(f(row) for f in self.filters)]
+        if self.row_limit is not None:
+            rows = rows[:self.row_limit]
+        if self.columns != '*':
+            names = [name.strip() for name in self.columns.split(',')]
+            rows = [{name: row.get(name) for name in names} for row in rows]
+        data = [] if self.head else rows
+        self.client.queries.append(SimpleNamespace(table=self.table_name, columns=self.columns, head=self.head, data=data))
+        return SimpleNamespace(data=data, count=len(rows) if self.count else None)
+
+
+class FakeSupabaseClient:
+    """Supabase stand-in holding rows per table and recording every executed query."""
+
+    def __init__(self, tables=None):
+        self.tables = tables or {}
+        self.failing_tables = set()
+        self.queries = []
+
+    def table(self, table_name):
+        return FakeQuery(self, table_name)
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    """Point survey_data at one FakeSupabaseClient for both databases, with empty read caches."""
+    import survey_data
+
+    client = FakeSupabaseClient()
+    monkeypatch.setattr(survey_data, 'get_supabase_client', lambda: client)
+    monkeypatch.setattr(survey_data, 'get_contributor_supabase_client', lambda: client)
+    monkeypatch.setattr(survey_data, '_read_cache', {})
+    survey_data.begin_request_scope()
+    return client
@@ -0,0 +1,84 @@
+"""
+Per-call latency of Supabase reads with a fresh client per call versus the shared client.
+
+A local keep-alive HTTP server stands in for PostgREST and counts the TCP
+connections it accepts; the app-side counters come from clients.get_client_stats.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import clients
+
+CALLS = 30
+# Any JWT-shaped string passes supabase-py's key check
+FAKE_KEY = 'header.payload.signature'
+
+
+class _PostgrestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps([{'participant_id': 'p1'}]).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def postgrest_server(monkeypatch):
+    pytest.importorskip('supabase')
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _PostgrestHandler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(clients, '_shared_clients', {})
+    monkeypatch.setattr(clients, '_client_stats', {})
+    yield server, f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def _mean_call_seconds(get_client, url):
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        rows = get_client(url).table('reviewer-sessions').select('participant_id').eq(
+            'participant_id', 'p1'
+        ).execute().data
+        assert rows == [{'participant_id': 'p1'}]
+    return (time.perf_counter() - started) / CALLS
+
+
+def test_shared_client_reuses_one_client_and_connection(postgrest_server):
+    server, url = postgrest_server
+    from supabase import create_client
+
+    # Before: a new client (and HTTP session) for every call
+    per_call = _mean_call_seconds(lambda u: create_client(u, FAKE_KEY), url)
+    per_call_connections = server.connections
+
+    # After: the process-wide client from clients.py
+    server.connections = 0
+    shared = _mean_call_seconds(lambda u: clients._get_shared_client(u, FAKE_KEY), url)
+
+    print(f"[BENCH] per-call client: {per_call * 1000:.2f} ms/call over {per_call_connections} connections; "
+          f"shared client: {shared * 1000:.2f} ms/call over {server.connections} connection(s)")
+    assert clients.get_client_stats()[url] == {'clients_created': 1, 'requests': CALLS}
+    assert per_call_connections == CALLS
+    assert server.connections == 1
+    assert shared < per_call
@@ -0,0 +1,50 @@
+"""
+Cold start of the first page: lazy page exports versus importing every page module.
+
+Each variant runs in a fresh interpreter with the client-library stubs from conftest.
+"Lazy" is what a new session does now: import main and resolve participant_id_page.
+"Eager" additionally imports every page module, as the pages package used to.
+"""
+
+import pytest
+
+from conftest import run_stubbed_import_script
+
+_COLD_START_SCRIPT = '''
+EAGER = {eager}
+before = set(sys.modules)
+started = time.perf_counter()
+importlib.import_module('main')
+pages = importlib.import_module('pages')
+pages.participant_id_page
+if EAGER:
+    for section in ('pre_study', 'post_pr_review', 'post_pr_closed', 'end_study'):
+        package = importlib.import_module(f'pages.{{section}}')
+        for name in package.__all__:
+            getattr(package, name)
+elapsed = time.perf_counter() - started
+
+print(json.dumps({{
+    'elapsed': elapsed,
+    'modules': sorted(set(sys.modules) - before),
+}}))
+'''
+
+
+@pytest.fixture(scope='module')
+def cold_starts():
+    pytest.importorskip('streamlit')
+    return {
+        variant: run_stubbed_import_script(_COLD_START_SCRIPT.format(eager=variant == 'eager'))
+        for variant in ('lazy', 'eager')
+    }
+
+
+def test_first_page_loads_only_its_own_modules(cold_starts):
+    lazy, eager = cold_starts['lazy'], cold_starts['eager']
+    print(f"[COLD START] lazy: {lazy['elapsed'] * 1000:.1f} ms, {len(lazy['modules'])} modules; "
+          f"eager: {eager['elapsed'] * 1000:.1f} ms, {len(eager['modules'])} modules")
+
+    lazy_pages = {name for name in lazy['modules'] if name.startswith('pages.')}
+    assert lazy_pages == {'pages._lazy', 'pages.pre_study', 'pages.pre_study.participant_id'}
+    assert len(lazy['modules']) < len(eager['modules'])
@@ -0,0 +1,101 @@
+"""
+Time to first byte of a Drive upload whose token is close to expiring.
+
+Measures an upload whose token must be refreshed inline (the behaviour for any
+token inside the refresh margin before it moved to the background) against one
+whose token is inside the margin but still valid, now refreshed in the background.
+The token endpoint is replaced by a refresh that sleeps REFRESH_LATENCY_SECONDS.
+"""
+
+import io
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+import clients
+import drive_upload
+from conftest import FakeDriveService
+
+REFRESH_LATENCY_SECONDS = 0.5
+
+
+class SlowCredentials:
+    """google-auth style credentials whose refresh takes REFRESH_LATENCY_SECONDS."""
+
+    def __init__(self, expires_in: timedelta):
+        self.token = 'old-token'
+        self.expiry = clients._utcnow() + expires_in
+        self.refreshes = 0
+        self.refreshed = threading.Event()
+
+    @property
+    def valid(self):
+        return self.token is not None and self.expiry > clients._utcnow() + timedelta(minutes=3, seconds=45)
+
+    def refresh(self, request):
+        time.sleep(REFRESH_LATENCY_SECONDS)
+        self.refreshes += 1
+        self.token = f'token-{self.refreshes}'
+        self.expiry = clients._utcnow() + timedelta(hours=1)
+        self.refreshed.set()
+
+
+@pytest.fixture
+def drive_with_credentials(monkeypatch):
+    """Install credentials and a per-thread FakeDriveService that records the first chunk."""
+    pytest.importorskip('googleapiclient.http')
+    pytest.importorskip('google.auth.transport.requests')
+
+    first_chunk_at = []
+    service = FakeDriveService(on_chunk=lambda size: first_chunk_at or first_chunk_at.append(time.perf_counter()))
+    monkeypatch.setattr(clients._drive_threads, 'service', service, raising=False)
+    monkeypatch.setattr(
+        drive_upload, '_resolve_folder_path', lambda service, base_folder_id, subfolders, resolved_keys: 'parent-id'
+    )
+
+    def install(creds):
+        monkeypatch.setattr(clients, '_drive_credentials', creds)
+        return first_chunk_at
+    return install
+
+
+def _time_to_first_byte(first_chunk_at) -> float:
+    started = time.perf_counter()
+    drive_upload.upload_to_drive_in_subfolders(
+        io.BytesIO(b'\x00' * drive_upload.CHUNK_SIZE), 'base-id', filename='recording.zip'
+    )
+    return first_chunk_at[0] - started
+
+
+def test_expired_token_is_refreshed_before_the_first_chunk(drive_with_credentials):
+    creds = SlowCredentials(expires_in=timedelta(seconds=-1))
+    ttfb = _time_to_first_byte(drive_with_credentials(creds))
+    print(f"[TTFB] inline refresh: {ttfb:.3f}s")
+    assert creds.refreshes == 1
+    assert ttfb >= REFRESH_LATENCY_SECONDS
+
+
+def test_expiring_token_is_refreshed_off_the_upload_path(drive_with_credentials):
+    creds = SlowCredentials(expires_in=timedelta(seconds=clients.DRIVE_TOKEN_REFRESH_MARGIN_SECONDS - 30))
+    ttfb = _time_to_first_byte(drive_with_credentials(creds))
+    print(f"[TTFB] background refresh: {ttfb:.3f}s")
+    assert ttfb < REFRESH_LATENCY_SECONDS / 2
+    assert creds.refreshed.wait(REFRESH_LATENCY_SECONDS * 4)
+    assert creds.refreshes == 1
+
+
+def test_concurrent_callers_share_one_background_refresh(drive_with_credentials):
+    creds = SlowCredentials(expires_in=timedelta(seconds=clients.DRIVE_TOKEN_REFRESH_MARGIN_SECONDS - 30))
+    drive_with_credentials(creds)
+    started = time.perf_counter()
+    threads = [threading.Thread(target=clients._get_drive_credentials) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.perf_counter() - started < REFRESH_LATENCY_SECONDS / 2
+    assert creds.refreshed.wait(REFRESH_LATENCY_SECONDS * 4)
+    time.sleep(0.05)
+    assert creds.refreshes == 1
@@ -0,0 +1,94 @@
+"""
+Peak memory of a Drive upload stays around one CHUNK_SIZE, however large the file.
+
+The Drive request is stubbed (see conftest.FakeDriveService); MediaIoBaseUpload and
+the streaming path in drive_upload are the real ones.
+"""
+
+import io
+import tracemalloc
+
+import pytest
+
+import drive_upload
+from drive_upload import CHUNK_SIZE
+
+FILE_SIZE = 8 * CHUNK_SIZE
+# One chunk in flight plus bookkeeping; a full copy of the file would be FILE_SIZE
+PEAK_BUDGET = 2 * CHUNK_SIZE
+
+
+def _uploaded_file(data: bytes):
+    """Build a Streamlit UploadedFile, which is BytesIO-backed like in the app."""
+    pytest.importorskip('streamlit')
+    from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+    record = UploadedFileRec(file_id='file', name='recording.zip', type='application/zip', data=data)
+    return UploadedFile(record, None)
+
+
+class _NonSeekable(io.RawIOBase):
+    """A readable stream that can't seek, like a socket or pipe."""
+
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data[self._pos:self._pos + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope='module')
+def payload():
+    return b'\x5a' * FILE_SIZE
+
+
+def test_upload_streams_uploaded_file(fake_drive, payload):
+    file = _uploaded_file(payload)
+    response, peak = _peak_bytes(
+        lambda: drive_upload.upload_to_drive_in_subfolders(file, 'base-id', ['p1', 'pr_1', 'initial_review'])
+    )
+    assert response['id'] == 'file-id'
+    assert peak < PEAK_BUDGET, f"peak {peak} bytes for a {FILE_SIZE} byte upload"
+
+
+def test_upload_spools_non_seekable_stream(fake_drive, payload):
+    stream = io.BufferedReader(_NonSeekable(payload), buffer_size=CHUNK_SIZE)
+    response, peak = _peak_bytes(
+        lambda: drive_upload.upload_to_drive_in_subfolders(stream, 'base-id', filename='recording.zip')
+    )
+    assert response['id'] == 'file-id'
+    assert peak < PEAK_BUDGET, f"peak {peak} bytes for a {FILE_SIZE} byte upload"
+
+
+def test_detached_stream_shares_uploaded_bytes(payload):
+    file = _uploaded_file(payload)
+    stream, peak = _peak_bytes(lambda: drive_upload._detached_stream(file))
+    assert stream.read() == payload
+    assert peak < CHUNK_SIZE, f"detaching copied {peak} bytes"
+
+
+def test_background_upload_path_streams(fake_drive, payload):
+    file = _uploaded_file(payload)
+
+    def detach_and_upload():
+        stream = drive_upload._detached_stream(file)
+        return drive_upload.upload_to_drive_in_subfolders(stream, 'base-id', filename=file.name)
+
+    response, peak = _peak_bytes(detach_and_upload)
+    assert response['id'] == 'file-id'
+    assert peak < PEAK_BUDGET, f"peak {peak} bytes for a {FILE_SIZE} byte upload"
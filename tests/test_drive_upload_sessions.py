@@ -0,0 +1,133 @@
+"""
+Background upload jobs and resumable sessions keyed by (participant, issue, artifact).
+
+Drive and the reviewer-upload-sessions table are stubbed; see conftest.FakeDriveService.
+"""
+
+import io
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import drive_upload
+from drive_upload import CHUNK_SIZE
+
+RESUME_KEY = ('p1', 42, 'final_review')
+
+
+def _file(data: bytes, name='recording.zip'):
+    file = io.BytesIO(data)
+    file.name = name
+    return file
+
+
+def _assign_session_uri(fake_drive, monkeypatch):
+    """Make Drive assign a resumable session URI with the first chunk, as the real API does."""
+    create = fake_drive.create
+
+    def create_with_uri(*args, **kwargs):
+        request = create(*args, **kwargs)
+        next_chunk = request.next_chunk
+
+        def next_chunk_with_uri():
+            request.resumable_uri = 'https://upload.example/session'
+            return next_chunk()
+        request.next_chunk = next_chunk_with_uri
+        return request
+    monkeypatch.setattr(fake_drive, 'create', create_with_uri)
+
+
+@pytest.fixture
+def blocked_drive(fake_drive, monkeypatch):
+    """Hold every chunk until release is set, so jobs stay in flight."""
+    release = threading.Event()
+    fake_drive.on_chunk = lambda size: release.wait(5)
+    monkeypatch.setattr(drive_upload, '_load_upload_session', lambda resume_key: None)
+    monkeypatch.setattr(drive_upload, '_save_upload_session', lambda *args: None)
+    monkeypatch.setattr(drive_upload, '_clear_upload_session', lambda resume_key, fingerprint: None)
+    yield release
+    release.set()
+
+
+def _wait(job_id):
+    job = drive_upload.get_upload_job(job_id)
+    for _ in range(500):
+        if job.finished:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_resubmitting_the_same_file_joins_the_running_job(blocked_drive):
+    data = b'a' * (2 * CHUNK_SIZE)
+    first = drive_upload.submit_upload(_file(data), 'base-id', resume_key=RESUME_KEY)
+    second = drive_upload.submit_upload(_file(data), 'base-id', resume_key=RESUME_KEY)
+    blocked_drive.set()
+    assert second == first
+    assert _wait(first).state == 'done'
+
+
+def test_resubmitting_a_different_file_replaces_the_running_job(blocked_drive):
+    first = drive_upload.submit_upload(_file(b'a' * (2 * CHUNK_SIZE)), 'base-id', resume_key=RESUME_KEY)
+    second = drive_upload.submit_upload(_file(b'b' * (2 * CHUNK_SIZE)), 'base-id', resume_key=RESUME_KEY)
+    blocked_drive.set()
+    assert second != first
+    assert _wait(first).state == 'cancelled'
+    assert _wait(second).state == 'done'
+
+
+def test_replaced_job_never_saves_over_the_new_session(blocked_drive, fake_drive, monkeypatch):
+    saves = []
+    monkeypatch.setattr(drive_upload, '_save_upload_session', lambda *args: saves.append(args[1]))
+    _assign_session_uri(fake_drive, monkeypatch)
+    fingerprints = []
+    fingerprint = drive_upload._stream_fingerprint
+    monkeypatch.setattr(
+        drive_upload, '_stream_fingerprint', lambda *args: fingerprints.append(fingerprint(*args)) or fingerprints[-1]
+    )
+
+    first = drive_upload.submit_upload(_file(b'a' * (2 * CHUNK_SIZE)), 'base-id', resume_key=RESUME_KEY)
+    second = drive_upload.submit_upload(_file(b'b' * (2 * CHUNK_SIZE)), 'base-id', resume_key=RESUME_KEY)
+    blocked_drive.set()
+    assert _wait(first).state == 'cancelled'
+    assert _wait(second).state == 'done'
+    # Each file is hashed once, in submit_upload, and only the replacement's session is written
+    assert fingerprints == [drive_upload.get_upload_job(first).fingerprint, drive_upload.get_upload_job(second).fingerprint]
+    assert saves == [fingerprints[1]]
+
+
+def test_session_is_saved_on_creation_then_every_few_chunks(fake_drive, monkeypatch):
+    saves = []
+    monkeypatch.setattr(drive_upload, '_load_upload_session', lambda resume_key: None)
+    monkeypatch.setattr(drive_upload, '_clear_upload_session', lambda resume_key, fingerprint: None)
+    monkeypatch.setattr(drive_upload, '_save_upload_session', lambda *args: saves.append(args[3]))
+    monkeypatch.setattr(drive_upload, 'UPLOAD_SESSION_SAVE_SECONDS', 3600)
+    _assign_session_uri(fake_drive, monkeypatch)
+
+    chunks = 2 * drive_upload.UPLOAD_SESSION_SAVE_CHUNKS + 2
+
+    drive_upload.upload_to_drive_in_subfolders(
+        _file(b'c' * (chunks * CHUNK_SIZE)), 'base-id', resume_key=RESUME_KEY
+    )
+    every = drive_upload.UPLOAD_SESSION_SAVE_CHUNKS
+    assert saves == [CHUNK_SIZE, (1 + every) * CHUNK_SIZE, (1 + 2 * every) * CHUNK_SIZE]
+
+
+def test_completed_session_returns_the_same_fields_as_an_upload():
+    requests = []
+
+    class Files:
+        def get(self, fileId=None, fields=None, supportsAllDrives=None):
+            requests.append((fileId, fields))
+            return SimpleNamespace(execute=lambda: {'id': fileId, 'webViewLink': f'https://drive.example/{fileId}'})
+
+    service = SimpleNamespace(files=lambda: Files())
+    http = SimpleNamespace(
+        request=lambda *args, **kwargs: (SimpleNamespace(status=200), json.dumps({'id': 'done-id', 'kind': 'drive#file'}))
+    )
+    offset, completed = drive_upload._query_resumable_offset(service, http, 'https://upload.example/s', 10)
+    assert offset == 10
+    assert requests == [('done-id', 'id, webViewLink')]
+    assert completed == {'id': 'done-id', 'webViewLink': 'https://drive.example/done-id'}
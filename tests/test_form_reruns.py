@@ -0,0 +1,42 @@
+"""
+Reruns needed to complete each slider question page.
+
+In the browser, every change to a widget outside a form reruns the script, while
+widgets inside a form only rerun on submit. Completing a page therefore costs one
+rerun per answer widget outside a form plus the Next press. Before the pages were
+batched into forms every answer widget counted; now only the submit does.
+"""
+
+import pytest
+
+pytest.importorskip('streamlit.testing.v1')
+from streamlit.testing.v1 import AppTest
+
+ANSWER_WIDGETS = ('select_slider', 'slider', 'radio', 'selectbox', 'text_area', 'text_input')
+SLIDER_PAGES = {
+    5: 'nasa_tlx_questions_page',
+    6: 'code_quality_ratings_page',
+    9: 'collaboration_questions_page',
+    10: 'contributor_perception_page',
+}
+
+
+def _app(page, page_function):
+    # AppTest runs this function's source as a script, so it can't close over test variables
+    import streamlit as st
+    import pages
+    st.session_state.setdefault('survey_responses', {})
+    st.session_state.setdefault('page', page)
+    getattr(pages, page_function)()
+
+
+@pytest.mark.parametrize('page, page_function', SLIDER_PAGES.items())
+def test_completing_a_slider_page_takes_one_rerun(page, page_function):
+    at = AppTest.from_function(_app, args=(page, page_function)).run()
+    assert not at.exception
+
+    answers = [widget for kind in ANSWER_WIDGETS for widget in getattr(at, kind)]
+    rerunning = [widget for widget in answers if not widget.proto.form_id]
+    print(f"[RERUNS] Page {page}: {len(answers) + 1} reruns without a form, {len(rerunning) + 1} with one")
+    assert answers
+    assert rerunning == []
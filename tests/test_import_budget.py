@@ -0,0 +1,48 @@
+"""
+Importing main must stay cheap: no client libraries, no secrets, no network setup.
+
+The import runs in a fresh interpreter so modules loaded by other tests don't hide
+the cost. Supabase, PostgREST, OpenAI and Google modules are replaced by empty stubs
+on import, so the check is the same whether or not they are installed.
+"""
+
+import pytest
+
+from conftest import run_stubbed_import_script
+
+# Seconds importing main may take once streamlit itself is loaded
+IMPORT_BUDGET_SECONDS = 0.5
+LAZY_MODULES = ('supabase', 'openai', 'googleapiclient')
+
+_IMPORT_SCRIPT = '''
+started = time.perf_counter()
+importlib.import_module('main')
+elapsed = time.perf_counter() - started
+
+print(json.dumps({
+    'elapsed': elapsed,
+    'modules': sorted(name for name in sys.modules if is_stubbed(name)),
+    'secrets_read': RecordingSecrets.reads,
+}))
+'''
+
+
+@pytest.fixture(scope='module')
+def import_result():
+    pytest.importorskip('streamlit')
+    return run_stubbed_import_script(_IMPORT_SCRIPT)
+
+
+def test_import_main_within_budget(import_result):
+    assert import_result['elapsed'] < IMPORT_BUDGET_SECONDS, (
+        f"importing main took {import_result['elapsed']:.3f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+    )
+
+
+def test_import_main_loads_no_client_libraries(import_result):
+    loaded = [name for name in import_result['modules'] if name.split('.')[0] in LAZY_MODULES]
+    assert loaded == []
+
+
+def test_import_main_reads_no_secrets(import_result):
+    assert import_result['secrets_read'] == []
@@ -0,0 +1,40 @@
+"""get_prs_with_incomplete_responses issues a fixed number of queries however many PRs are assigned."""
+
+import pytest
+
+import survey_data
+from contributor_config import CONTRIBUTOR_TABLES
+
+
+def _load_reviewed_prs(client, pr_count):
+    client.tables[CONTRIBUTOR_TABLES['repo_issues']] = [
+        {
+            'issue_id': n, 'pr_url': f'https://github.com/o/r/pull/{n}', 'issue_url': f'https://github.com/o/r/issues/{n}',
+            'repository': 'o/r', 'reviewer_id': 'p1', 'reviewer_assigned': True, 'is_reviewed': True,
+            'is_closed': True, 'is_merged': False,
+        }
+        for n in range(pr_count)
+    ]
+    # Every other PR has a complete survey row; the rest have none
+    client.tables['reviewer-post-pr-review'] = [
+        {
+            'participant_id': 'p1', 'pr_url': f'https://github.com/o/r/pull/{n}',
+            'pr_key': f'https://github.com/o/r/pull/{n}', 'nasa_tlx_mental_demand': '3',
+            'code_quality_readability': '4', 'ai_likelihood': 'Unlikely', 'ai_reasoning': 'style',
+            'ai_review_strategy': 'read diff',
+        }
+        for n in range(0, pr_count, 2)
+    ]
+
+
+@pytest.mark.parametrize('pr_count', [1, 10, 100])
+def test_query_count_is_constant(fake_supabase, pr_count):
+    _load_reviewed_prs(fake_supabase, pr_count)
+
+    result = survey_data.get_prs_with_incomplete_responses('p1', 'o/r')
+
+    assert result['success']
+    assert len(result['incomplete_prs']) == pr_count // 2
+    assert sorted(query.table for query in fake_supabase.queries) == sorted(
+        [CONTRIBUTOR_TABLES['repo_issues'], 'reviewer-post-pr-review']
+    )
@@ -0,0 +1,78 @@
+"""
+Query and payload comparison for participant progress and the routing snapshot.
+
+Participants with long transcripts used to be loaded with select('*') on three
+tables just to take len(); progress now uses head counts and routing fetches
+only the columns it reads.
+"""
+
+import json
+
+import survey_data
+
+REVIEWS = 8
+TRANSCRIPT = 'um, so I looked at the diff and ' * 600  # ~20 KB of free text per answer
+
+
+def _payload_bytes(queries):
+    return sum(len(json.dumps(row)) for query in queries for row in query.data)
+
+
+def _load_participant(client):
+    client.tables['reviewer-post-pr-review'] = [
+        {
+            'participant_id': 'p1', 'pr_url': f'https://github.com/o/r/pull/{n}', 'pr_key': f'https://github.com/o/r/pull/{n}',
+            'nasa_tlx_mental_demand': '3', 'code_quality_readability': '4', 'ai_likelihood': 'Unlikely',
+            'ai_reasoning': TRANSCRIPT, 'ai_review_strategy': TRANSCRIPT, 'review_notes': TRANSCRIPT,
+            'created_at': '2026-01-01T00:00:00Z', 'updated_at': '2026-01-01T00:00:00Z',
+        }
+        for n in range(REVIEWS)
+    ]
+    client.tables['reviewer-post-pr-closed'] = [
+        {'participant_id': 'p1', 'pr_url': f'https://github.com/o/r/pull/{n}', 'collaboration_notes': TRANSCRIPT}
+        for n in range(REVIEWS // 2)
+    ]
+    client.tables['reviewer-end-study'] = [{'participant_id': 'p1', 'reflection': TRANSCRIPT}]
+
+
+def _baseline_progress(client):
+    """The old get_participant_progress: full rows from each table, counted in memory."""
+    counts = [
+        len(client.table(table).select('*').eq('participant_id', 'p1').execute().data)
+        for table in ('reviewer-post-pr-review', 'reviewer-post-pr-closed', 'reviewer-end-study')
+    ]
+    return survey_data._build_progress(*counts)
+
+
+def test_progress_uses_head_counts(fake_supabase):
+    _load_participant(fake_supabase)
+    baseline = _baseline_progress(fake_supabase)
+    baseline_bytes = _payload_bytes(fake_supabase.queries)
+    fake_supabase.queries.clear()
+
+    result = survey_data.get_participant_progress('p1')
+
+    print(f"[BENCH] progress payload: select('*') {baseline_bytes} bytes, head counts "
+          f"{_payload_bytes(fake_supabase.queries)} bytes")
+    assert result['progress'] == baseline
+    assert len(fake_supabase.queries) == 3
+    assert all(query.head for query in fake_supabase.queries)
+    assert _payload_bytes(fake_supabase.queries) == 0
+
+
+def test_snapshot_projects_routing_columns(fake_supabase):
+    _load_participant(fake_supabase)
+    fake_supabase.table('reviewer-post-pr-review').select('*').eq('participant_id', 'p1').execute()
+    full_bytes = _payload_bytes(fake_supabase.queries)
+    fake_supabase.queries.clear()
+
+    snapshot = survey_data.load_participant_snapshot('p1')
+
+    review_queries = [q for q in fake_supabase.queries if q.table == 'reviewer-post-pr-review']
+    lean_bytes = _payload_bytes(review_queries)
+    print(f"[BENCH] reviewer-post-pr-review payload: select('*') {full_bytes} bytes, "
+          f"routing columns {lean_bytes} bytes")
+    assert snapshot.progress['progress']['post_pr_review_count'] == REVIEWS
+    assert snapshot.progress['progress']['post_pr_closed_count'] == REVIEWS // 2
+    assert [q.columns for q in review_queries] == [survey_data._POST_PR_REVIEW_STATUS_COLUMNS]
+    assert lean_bytes * 20 < full_bytes
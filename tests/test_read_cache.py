@@ -0,0 +1,18 @@
+"""Cross-rerun read cache: successful reads are reused, failed reads are retried."""
+
+import survey_data
+
+
+def test_completed_pr_closed_surveys_failure_is_not_cached(fake_supabase):
+    fake_supabase.tables['reviewer-post-pr-closed'] = [{'participant_id': 'p1', 'pr_url': 'https://github.com/o/r/pull/1'}]
+    fake_supabase.failing_tables.add('reviewer-post-pr-closed')
+    assert survey_data.get_completed_pr_closed_surveys('p1') == set()
+
+    # Next rerun: the outage is over and the read goes back to the database
+    fake_supabase.failing_tables.clear()
+    survey_data.begin_request_scope()
+    assert survey_data.get_completed_pr_closed_surveys('p1') == {'https://github.com/o/r/pull/1'}
+
+    survey_data.begin_request_scope()
+    survey_data.get_completed_pr_closed_surveys('p1')
+    assert len(fake_supabase.queries) == 1
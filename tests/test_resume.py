@@ -0,0 +1,50 @@
+"""resolve_resumed_page trusts the saved page unless that page's section is already saved."""
+
+import pytest
+
+import survey_data
+
+PR_URL = 'https://github.com/o/r/pull/7'
+RESPONSES = {'participant_id': 'p1', 'pr_url': PR_URL}
+
+
+@pytest.fixture
+def snapshot_loads(monkeypatch):
+    """Record full-snapshot loads; a re-routed participant lands on page 8."""
+    loads = []
+
+    def load_participant_snapshot(participant_id):
+        loads.append(participant_id)
+        return None
+
+    monkeypatch.setattr(survey_data, 'load_participant_snapshot', load_participant_snapshot)
+    monkeypatch.setattr(survey_data, 'build_routing_state', lambda snapshot, responses: None)
+    monkeypatch.setattr(survey_data, 'resolve_route', lambda state: ('pr-open', 8))
+    return loads
+
+
+@pytest.mark.parametrize('saved_page', [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+def test_unfinished_saved_page_is_kept_with_at_most_one_query(fake_supabase, snapshot_loads, saved_page):
+    assert survey_data.resolve_resumed_page('p1', saved_page, RESPONSES) == saved_page
+    assert len(fake_supabase.queries) <= 1
+    assert snapshot_loads == []
+
+
+def test_perception_page_resumes_after_collaboration_was_saved(fake_supabase, snapshot_loads):
+    fake_supabase.tables['reviewer-post-pr-closed'] = [
+        {'participant_id': 'p1', 'pr_key': PR_URL, 'collaboration_description': 'we paired', 'perception_effort': None}
+    ]
+    assert survey_data.resolve_resumed_page('p1', 10, RESPONSES) == 10
+    assert snapshot_loads == []
+
+
+@pytest.mark.parametrize('saved_page, table, row', [
+    (5, 'reviewer-post-pr-review', {'nasa_tlx_mental_demand': '3'}),
+    (9, 'reviewer-post-pr-closed', {'collaboration_description': 'we paired'}),
+    (10, 'reviewer-post-pr-closed', {'perception_effort': 'moderate'}),
+    (11, 'reviewer-end-study', {}),
+])
+def test_completed_saved_page_is_rerouted(fake_supabase, snapshot_loads, saved_page, table, row):
+    fake_supabase.tables[table] = [{'participant_id': 'p1', 'pr_key': PR_URL, **row}]
+    assert survey_data.resolve_resumed_page('p1', saved_page, RESPONSES) == 8
+    assert snapshot_loads == ['p1']
@@ -0,0 +1,70 @@
+"""
+Exhaustive check of the routing rule table against the original determine_current_page order.
+
+Every combination of RoutingState flags is routed through resolve_route and compared
+with expected_page, a direct transcription of the pre-refactor if/return chain, so
+reordering or editing a rule fails here unless the baseline is updated with it.
+"""
+
+import itertools
+from dataclasses import fields
+
+from routing import DEFAULT_RULE, ROUTING_RULES, RoutingState, resolve_route
+
+FLAGS = [f.name for f in fields(RoutingState)]
+
+
+def expected_page(s: RoutingState) -> int:
+    if not s.has_repository:
+        return 0
+    if not s.setup_complete and not s.has_started_reviews:
+        return 2
+    if not s.has_assigned_pr:
+        return 3
+    if not s.has_estimates:
+        return 3
+    if not s.is_reviewed:
+        return 4
+    if not s.progress_loaded:
+        return 5
+    if not s.nasa_tlx_complete:
+        return 5
+    if not s.code_quality_complete:
+        return 6
+    if not s.ai_detection_complete:
+        return 7
+    if s.review_quota_met:
+        if not s.all_reviewed_prs_closed:
+            return 8
+        if not s.artifact_complete:
+            return 11
+        if not s.end_study_completed:
+            return 11
+        return 12
+    if not s.is_closed_or_merged:
+        return 8
+    if not s.has_post_pr_closed:
+        return 9
+    if not s.artifact_complete:
+        return 11
+    # Below the review quota: request another PR
+    return 8
+
+
+def all_states():
+    for values in itertools.product((False, True), repeat=len(FLAGS)):
+        yield RoutingState(**dict(zip(FLAGS, values)))
+
+
+def test_every_state_matches_baseline_order():
+    mismatches = []
+    for state in all_states():
+        name, page = resolve_route(state)
+        if page != expected_page(state):
+            mismatches.append((state, name, page, expected_page(state)))
+    assert not mismatches, f"{len(mismatches)} states route differently, e.g. {mismatches[0]}"
+
+
+def test_every_rule_is_reachable():
+    used = {resolve_route(state)[0] for state in all_states()}
+    assert used == {name for name, _, _ in ROUTING_RULES} | {DEFAULT_RULE[0]}